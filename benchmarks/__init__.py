@@ -0,0 +1,19 @@
+"""
+Performance benchmarks of the core containers, operations and
+rendering of HoloViews.
+
+The benchmarks follow the conventions of airspeed velocity (asv):
+each module defines classes whose time_* methods are timed and whose
+track_* methods return a value such as a size in bytes, declared by
+their unit attribute, with sizes supplied through the params and
+param_names class attributes and passed to the setup method and the
+benchmark methods. A setup method
+raising NotImplementedError skips the benchmark, e.g. when an
+optional dependency is unavailable.
+
+The benchmarks run offline through benchmarks/run.py, which writes
+the timings as JSON and compares them against a stored baseline:
+
+    python -m benchmarks.run --output baseline.json
+    python -m benchmarks.run --compare baseline.json
+"""
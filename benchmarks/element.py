@@ -0,0 +1,46 @@
+"""
+Benchmarks of the reduction of Tables and the sampling of Rasters.
+"""
+
+import numpy as np
+
+from holoviews import Table, Raster, Image
+
+
+class TableSuite(object):
+    "Benchmarks a Table over a square grid of keys"
+
+    params = [10, 30, 50]
+    param_names = ['keys per dimension']
+
+    def setup(self, n):
+        self.table = Table({(i, j): (np.random.rand(),) for i in range(n) for j in range(n)},
+                           key_dimensions=['x', 'y'], value_dimensions=['z'])
+
+    def time_reduce(self, n):
+        self.table.reduce(x=np.mean)
+
+    def time_select(self, n):
+        self.table.select(x=(0, n//2))
+
+
+class RasterSuite(object):
+    "Benchmarks the sampling of square Rasters and Images"
+
+    params = [50, 200, 1000]
+    param_names = ['size']
+
+    def setup(self, n):
+        data = np.random.rand(n, n)
+        self.raster = Raster(data)
+        self.image = Image(data)
+        self.n = n
+
+    def time_raster_sample(self, n):
+        self.raster.sample(y=self.n//2)
+
+    def time_image_sample(self, n):
+        self.image.sample(x=0.1)
+
+    def time_image_sample_points(self, n):
+        self.image.sample([(x, x) for x in np.linspace(-0.4, 0.4, 20)])
@@ -0,0 +1,47 @@
+"""
+Benchmarks of the construction, slicing, selection and restructuring
+of HoloMaps.
+"""
+
+import numpy as np
+
+from holoviews import HoloMap, Curve
+
+
+class HoloMapSuite(object):
+    """
+    Benchmarks a HoloMap of Curves over a square grid of keys along
+    two key dimensions.
+    """
+
+    params = [10, 30, 50]
+    param_names = ['keys per dimension']
+
+    def setup(self, n):
+        curve = Curve(np.random.rand(10, 2))
+        self.items = [((i, j), curve) for i in range(n) for j in range(n)]
+        self.shuffled = [self.items[i] for i in np.random.permutation(len(self.items))]
+        self.hmap = HoloMap(self.items, key_dimensions=['a', 'b'])
+        self.n = n
+
+    def time_construct(self, n):
+        HoloMap(self.items, key_dimensions=['a', 'b'])
+
+    def time_construct_unsorted(self, n):
+        HoloMap(self.shuffled, key_dimensions=['a', 'b'])
+
+    def time_slice(self, n):
+        self.hmap[self.n//4:3*self.n//4, :]
+
+    def time_select(self, n):
+        self.hmap.select(a=(self.n//4, 3*self.n//4), b=self.n//2)
+
+    def time_lookup(self, n):
+        for i in range(self.n):
+            self.hmap[i, i]
+
+    def time_groupby(self, n):
+        self.hmap.groupby(['a'])
+
+    def time_reindex(self, n):
+        self.hmap.reindex(['b', 'a'])
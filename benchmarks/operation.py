@@ -0,0 +1,25 @@
+"""
+Benchmarks of ElementOperations applied over the frames of HoloMaps.
+"""
+
+import numpy as np
+
+from holoviews import HoloMap, Image
+from holoviews.operation import histogram, contours
+
+
+class OperationSuite(object):
+    "Benchmarks operations over a HoloMap of Images"
+
+    params = [[10, 100], [20, 100]]
+    param_names = ['frames', 'size']
+
+    def setup(self, frames, size):
+        self.hmap = HoloMap({i: Image(np.random.rand(size, size)) for i in range(frames)},
+                            key_dimensions=['Frame'])
+
+    def time_histogram(self, frames, size):
+        histogram(self.hmap, adjoin=False)
+
+    def time_contours(self, frames, size):
+        contours(self.hmap, levels=[0.5])
@@ -0,0 +1,127 @@
+"""
+Benchmarks of range computation, traversal, widget frame generation
+and the export of figures and animations with matplotlib.
+"""
+
+import numpy as np
+
+from matplotlib import pyplot
+pyplot.switch_backend('agg')
+from matplotlib import animation
+
+from holoviews import HoloMap, GridSpace, Curve, Image
+from holoviews.core import traversal
+from holoviews.plotting import MPLPlotRenderer, ANIMATION_OPTS
+
+
+def curve_grid(n, frames):
+    "Returns an n x n GridSpace of HoloMaps of Curves"
+    xs = np.linspace(0, 1, 50)
+    return GridSpace({(i, j): HoloMap({f: Curve(np.column_stack([xs, np.sin(xs*f)+i*j]))
+                                       for f in range(frames)}, key_dimensions=['Frame'])
+                      for i in range(n) for j in range(n)}, key_dimensions=['x', 'y'])
+
+
+def image_map(frames, size):
+    "Returns a HoloMap of random Images"
+    return HoloMap({f: Image(np.random.rand(size, size)) for f in range(frames)},
+                   key_dimensions=['Frame'])
+
+
+class RangeSuite(object):
+    "Benchmarks the computation of ranges over a GridSpace of HoloMaps"
+
+    params = [[2, 5], [10, 100]]
+    param_names = ['grid size', 'frames']
+
+    def setup(self, n, frames):
+        self.grid = curve_grid(n, frames)
+        self.plot = MPLPlotRenderer.instance().get_plot(self.grid)
+        pyplot.close(self.plot.handles['fig'])
+
+    def time_compute_ranges(self, n, frames):
+        # Discards the ranges cached by previous calls
+        self.plot.__dict__.pop('_range_table_', None)
+        self.plot.compute_ranges(self.grid, None, None)
+
+    def time_unique_dimkeys(self, n, frames):
+        traversal.unique_dimkeys(self.grid)
+
+
+class WidgetSuite(object):
+    """
+    Benchmarks the generation of all the frames of a ScrubberWidget
+    and the size of the frames and HTML it embeds, for each frame
+    encoding and figure format.
+    """
+
+    params = [['html', 'binary', 'delta'], ['png', 'svg'], [10, 30]]
+    param_names = ['encoding', 'format', 'frames']
+
+    def setup(self, encoding, fmt, frames):
+        try:
+            from holoviews.ipython.widgets import ScrubberWidget
+            from holoviews.ipython.magics import OutputMagic
+        except ImportError:
+            raise NotImplementedError('Widgets require IPython')
+        self.options = OutputMagic.options
+        self.fmt = self.options['fig']
+        self.options['fig'] = fmt
+        self.widget = ScrubberWidget
+        self.hmap = image_map(frames, 20)
+        plot = MPLPlotRenderer.instance().get_plot(self.hmap)
+        self.scrubber = ScrubberWidget(plot, frame_encoding=encoding)
+        pyplot.close('all')
+
+    def teardown(self, encoding, fmt, frames):
+        self.options['fig'] = self.fmt
+
+    def time_frames(self, encoding, fmt, frames):
+        plot = MPLPlotRenderer.instance().get_plot(self.hmap)
+        self.widget(plot, frame_encoding=encoding)
+        pyplot.close('all')
+
+    def time_get_frames(self, encoding, fmt, frames):
+        self.scrubber.get_frames('benchmark')
+
+    def track_frames_size(self, encoding, fmt, frames):
+        return len(str(self.scrubber.get_frames('benchmark')).encode('utf-8'))
+    track_frames_size.unit = 'bytes'
+
+    def track_html_size(self, encoding, fmt, frames):
+        return len(self.scrubber().encode('utf-8'))
+    track_html_size.unit = 'bytes'
+
+
+class FigureExportSuite(object):
+    "Benchmarks rendering a GridSpace of Curves to PNG and SVG"
+
+    params = [1, 4]
+    param_names = ['grid size']
+
+    def setup(self, n):
+        self.grid = curve_grid(n, 1)
+        self.png = MPLPlotRenderer.instance(fig='png')
+        self.svg = MPLPlotRenderer.instance(fig='svg')
+
+    def time_png(self, n):
+        self.png(self.grid)
+
+    def time_svg(self, n):
+        self.svg(self.grid)
+
+
+class AnimationExportSuite(object):
+    "Benchmarks rendering a HoloMap of Images to a GIF animation"
+
+    params = [10, 50]
+    param_names = ['frames']
+
+    def setup(self, frames):
+        if not animation.writers.is_available(ANIMATION_OPTS['gif'][0]):
+            raise NotImplementedError('GIF export requires imagemagick')
+        self.hmap = image_map(frames, 20)
+        self.gif = MPLPlotRenderer.instance(holomap='gif')
+
+    def time_gif(self, frames):
+        self.gif(self.hmap)
@@ -0,0 +1,249 @@
+"""
+Runs the benchmarks offline, without requiring airspeed velocity.
+
+Each benchmark is run for every combination of its params, timing a
+number of calls chosen so that each sample takes at least min_time,
+and the minimum and median time per call over the repeated samples
+are reported. The track_* methods of the benchmarks are called once,
+recording the value they return, e.g. a size, in their unit. The results may be written as JSON, along with the
+versions of the dependencies and the git commit they were measured
+on, and compared against a previously stored baseline:
+
+    python -m benchmarks.run --output baseline.json
+    python -m benchmarks.run --compare baseline.json --threshold 1.2
+
+When comparing, the exit status is nonzero if any benchmark is slower
+or tracks a larger value than the baseline by more than the threshold
+ratio.
+"""
+from __future__ import print_function
+
+import argparse
+import inspect
+import itertools
+import json
+import os
+import pkgutil
+import platform
+import re
+import subprocess
+import sys
+import time
+from collections import OrderedDict
+from importlib import import_module
+from timeit import default_timer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+def discover(pattern=None):
+    """
+    Returns a list of (name, class, method) tuples of all the time_*
+    and track_* methods of the classes in the benchmark modules, whose
+    name matches the optional regular expression.
+    """
+    package = os.path.dirname(os.path.abspath(__file__))
+    benchmarks = []
+    for _, modname, _ in sorted(pkgutil.iter_modules([package])):
+        if modname == 'run': continue
+        module = import_module('benchmarks.' + modname)
+        classes = [c for _, c in inspect.getmembers(module, inspect.isclass)
+                   if c.__module__ == module.__name__]
+        for cls in sorted(classes, key=lambda c: c.__name__):
+            for attr in sorted(dir(cls)):
+                if not attr.startswith(('time_', 'track_')): continue
+                name = '.'.join([modname, cls.__name__, attr])
+                if pattern is None or re.search(pattern, name):
+                    benchmarks.append((name, cls, attr))
+    return benchmarks
+
+
+def param_combinations(cls):
+    """
+    Returns all combinations of the params of a benchmark class,
+    which follow the asv convention of a single list of values for
+    one parameter or a list of lists for several parameters.
+    """
+    params = getattr(cls, 'params', [])
+    if not params:
+        return [()]
+    if len(getattr(cls, 'param_names', [])) <= 1:
+        params = [params]
+    return list(itertools.product(*params))
+
+
+def param_key(name, params):
+    "Returns the key identifying a benchmark with the supplied params"
+    if not params:
+        return name
+    return '%s(%s)' % (name, ', '.join(repr(p) for p in params))
+
+
+def measure(function, repeat=5, min_time=0.05):
+    """
+    Times the supplied function, returning the minimum and median
+    time per call over the repeated samples and the number of calls
+    per sample.
+    """
+    number = 1
+    while True:
+        start = default_timer()
+        for _ in range(number):
+            function()
+        elapsed = default_timer() - start
+        if elapsed >= min_time or number >= 1e6:
+            break
+        number *= 10 if elapsed < min_time/10. else 2
+    samples = [elapsed/number]
+    for _ in range(repeat-1):
+        start = default_timer()
+        for _ in range(number):
+            function()
+        samples.append((default_timer() - start)/number)
+    samples.sort()
+    return OrderedDict([('min', samples[0]), ('median', samples[len(samples)//2]),
+                        ('number', number), ('repeat', repeat)])
+
+
+def run_benchmark(cls, attr, params, repeat, min_time):
+    """
+    Runs a benchmark with the supplied params, returning its timings
+    or the value it tracks along with its unit, or None if it is
+    skipped by its setup raising NotImplementedError.
+    """
+    instance = cls()
+    if hasattr(instance, 'setup'):
+        try:
+            instance.setup(*params)
+        except NotImplementedError:
+            return None
+    try:
+        method = getattr(instance, attr)
+        if attr.startswith('track_'):
+            return OrderedDict([('value', method(*params)),
+                                ('unit', getattr(method, 'unit', 'unit'))])
+        return measure(lambda: method(*params), repeat, min_time)
+    finally:
+        if hasattr(instance, 'teardown'):
+            instance.teardown(*params)
+
+
+def metadata():
+    "Returns the environment the benchmarks are run in"
+    meta = OrderedDict([('date', time.strftime('%Y-%m-%d %H:%M:%S')),
+                        ('platform', platform.platform()),
+                        ('python', platform.python_version())])
+    for module in ['holoviews', 'param', 'numpy', 'matplotlib']:
+        try:
+            version = getattr(import_module(module), '__version__', None)
+            meta[module] = None if version is None else str(version)
+        except ImportError:
+            meta[module] = None
+    try:
+        commit = subprocess.check_output(['git', 'rev-parse', 'HEAD'], cwd=ROOT,
+                                         stderr=subprocess.STDOUT)
+        meta['commit'] = commit.decode('utf-8').strip()
+    except (OSError, subprocess.CalledProcessError):
+        meta['commit'] = None
+    return meta
+
+
+def format_time(seconds):
+    "Formats a time in seconds with an appropriate unit"
+    for unit, scale in [('s', 1), ('ms', 1e3), ('us', 1e6)]:
+        if seconds*scale >= 1:
+            return '%.3f%s' % (seconds*scale, unit)
+    return '%.3fns' % (seconds*1e9)
+
+
+def format_result(result):
+    "Formats the minimum time or the tracked value of a result"
+    if 'value' in result:
+        return '%s %s' % (result['value'], result['unit'])
+    return format_time(result['min'])
+
+
+def metric(result):
+    "Returns the minimum time or the tracked value of a result"
+    return result['value'] if 'value' in result else result['min']
+
+
+def compare(results, baseline, threshold=1.2):
+    """
+    Compares the minimum times or tracked values of the results
+    against the baseline, returning a list of (key, baseline, result,
+    ratio, status) tuples for the benchmarks present in both, where
+    the status is one of 'regressed', 'improved' or '' depending on
+    whether the ratio exceeds the threshold in either direction.
+    """
+    rows = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if result is None or base is None:
+            continue
+        ratio = metric(result)/float(metric(base)) if metric(base) else float('inf')
+        if ratio > threshold:
+            status = 'regressed'
+        elif ratio < 1./threshold:
+            status = 'improved'
+        else:
+            status = ''
+        rows.append((key, base, result, ratio, status))
+    return rows
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('-b', '--bench', default=None,
+                        help='Regular expression selecting the benchmarks to run')
+    parser.add_argument('-r', '--repeat', type=int, default=5,
+                        help='The number of samples of each benchmark')
+    parser.add_argument('--min-time', type=float, default=0.05,
+                        help='The minimum duration of each sample in seconds')
+    parser.add_argument('--quick', action='store_true',
+                        help='Time a single call of each benchmark')
+    parser.add_argument('-o', '--output', default=None,
+                        help='File the results are written to as JSON')
+    parser.add_argument('-c', '--compare', default=None,
+                        help='JSON file of baseline results to compare against')
+    parser.add_argument('-t', '--threshold', type=float, default=1.2,
+                        help='Ratio to the baseline above which a benchmark has regressed')
+    args = parser.parse_args(args)
+    repeat, min_time = (1, 0) if args.quick else (args.repeat, args.min_time)
+
+    results = OrderedDict()
+    for name, cls, attr in discover(args.bench):
+        for params in param_combinations(cls):
+            key = param_key(name, params)
+            result = run_benchmark(cls, attr, params, repeat, min_time)
+            results[key] = result
+            print('%-70s %s' % (key, 'skipped' if result is None
+                                else format_result(result)))
+            sys.stdout.flush()
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(OrderedDict([('meta', metadata()), ('results', results)]), f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        rows = compare(results, baseline['results'], args.threshold)
+        print('\nComparison against %s (commit %s)\n' %
+              (args.compare, baseline['meta'].get('commit')))
+        print('%-70s %14s %14s %7s' % ('Benchmark', 'Baseline', 'Result', 'Ratio'))
+        for key, base, result, ratio, status in rows:
+            print('%-70s %14s %14s %7.2f %s' % (key, format_result(base),
+                                                format_result(result), ratio, status))
+        regressed = [row for row in rows if row[-1] == 'regressed']
+        if regressed:
+            print('\n%d benchmark(s) regressed by more than %.2fx' %
+                  (len(regressed), args.threshold))
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -718,6 +718,11 @@ class HoloMap(UniformNdMapping):
 
             samples = set(self.last.closest(linsamples))
 
+        if self._uniform_rasters():
+            table = self._sample_stack(samples, **sample_values)
+            if table is not None:
+                return table
+
         sampled = self.clone([(k, view.sample(samples, **sample_values))
                               for k, view in self.items()])
         return sampled.table().reindex() if sampled.type in [ItemTable, Table] else sampled.table()
@@ -729,21 +734,110 @@ class HoloMap(UniformNdMapping):
         via the kwargs, where the keyword has to match a particular
         dimension in the Elements.
         """
+        if self._uniform_rasters():
+            reduce_dims = reduce_map if reduce_map else self.last._valid_dimensions(dimensions)
+            if reduce_dims and len(reduce_dims) == 1:
+                table = self._reduce_stack(dimensions, function, **reduce_map)
+                if table is not None:
+                    return table
+
         reduced_items = [(k, v.reduce(dimensions, function, **reduce_map))
                          for k, v in self.items()]
         return self.clone(reduced_items).table()
 
 
+    def _uniform_rasters(self):
+        """
+        Whether the HoloMap holds Raster elements sharing the same
+        type, shape and extents, which may be stacked into a single
+        array without copying any frame data up front.
+        """
+        from ..element import Raster
+        if not len(self) or not issubclass(self.type, Raster):
+            return False
+        last = self.last
+        return all(el.data.shape == last.data.shape and el.extents == last.extents
+                   for el in self.data.values())
+
+
+    def _stack_rasters(self):
+        """
+        Stacks the data of a uniform Raster HoloMap into a single
+        array with the frames along the first axis.
+        """
+        return np.array([el.data for el in self.data.values()])
+
+
+    def _stacked_table(self, template, values):
+        """
+        Builds a Table from the values sampled or reduced from all
+        frames at once, where values has the frames along the first
+        axis and the coords along the second. The template Table
+        generated from the last frame supplies the parameters and the
+        coordinates along the axis which is kept. Returns None if the
+        values do not match the coordinates, e.g. for non-square
+        rasters, in which case the frames are processed individually.
+        """
+        coords = list(template.data.keys())
+        if values.shape[:2] != (len(self), len(coords)):
+            return None
+        keys = [k if isinstance(k, tuple) else (k,) for k in self.data.keys()]
+        coords = [c if isinstance(c, tuple) else (c,) for c in coords]
+        items = [(k+c, v) for k, frame in zip(keys, values)
+                 for c, v in zip(coords, frame)]
+        return template.clone(items, key_dimensions=self.key_dimensions+template.key_dimensions)
+
+
+    def _sample_stack(self, samples=[], **sample_values):
+        """
+        Samples the stacked data of a uniform Raster HoloMap using a
+        single indexing operation across all frames.
+        """
+        from ..element import Table
+        last = self.last
+        index = last._sample_index(samples, **sample_values)[2]
+        values = self._stack_rasters()[(slice(None),)+index]
+        template = last.sample(samples, **sample_values)
+        table = self._stacked_table(template.table(), values)
+        if table is None or not isinstance(template, Table):
+            return table
+        return table.reindex()
+
+
+    def _reduce_stack(self, dimensions=None, function=None, **reduce_map):
+        """
+        Reduces the stacked data of a uniform Raster HoloMap along a
+        single Element dimension across all frames at once. The
+        reduce function must support numpy style axis selection.
+        """
+        last = self.last
+        template = last.reduce(dimensions, function, **reduce_map).table()
+        dimension, reduce_fn = (list(reduce_map.items())[0] if reduce_map
+                                else (last._valid_dimensions(dimensions)[0], function))
+        values = reduce_fn(self._stack_rasters(), axis=last.get_dimension_index(dimension)+1)
+        return self._stacked_table(template, values)
+
+
     @property
     def empty_element(self):
         return self._type(None)
 
 
     def hist(self, num_bins=20, bin_range=None, adjoin=True, individually=True, **kwargs):
+        from ..operation.element import PartialHistogram
         histmap = self.clone(shared_data=False)
 
-        map_range = None if individually else self.range
-        bin_range = map_range if bin_range is None else bin_range
+        if bin_range is None and not individually:
+            # Compute a single shared bin range in one streaming pass
+            dimension = kwargs.get('dimension')
+            def values(element):
+                dim = dimension or (element.value_dimensions +
+                                    element.key_dimensions)[0].name
+                return element.dimension_values(dim)
+            frame_values = (vals for frame in self.values()
+                            for vals in frame.traverse(values, [Element]))
+            bin_range = PartialHistogram.data_range(frame_values)
+
         style_prefix = 'Custom[<' + self.name + '>]_'
         for k, v in self.items():
             histmap[k] = v.hist(adjoin=False, bin_range=bin_range,
@@ -0,0 +1,293 @@
+"""
+Instrumentation of the hot paths of HoloViews, recording named timers
+and counters for plot construction, range computation, frame
+selection, plot updates, figure encoding, operations and NdMapping
+sorting and selection.
+"""
+
+import sys
+from functools import wraps
+from importlib import import_module
+from timeit import default_timer
+
+import param
+
+from .ndmapping import OrderedDict
+
+
+class Timer(object):
+    """
+    Timer accumulates the number of calls to a hot point and the time
+    spent in it. Time spent in nested calls with the same name is only
+    counted once, by the outermost call, and nested calls on the same
+    object, e.g. through super, are not counted as separate calls.
+    """
+
+    __slots__ = ['calls', 'total', 'maximum', 'depth', 'obj']
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.
+        self.maximum = 0.
+        self.depth = 0
+        self.obj = None
+
+
+    def record(self, elapsed):
+        self.total += elapsed
+        self.maximum = max(self.maximum, elapsed)
+
+
+
+class Instrumentation(param.Parameterized):
+    """
+    Instrumentation records named timers and counters at the hot
+    points of HoloViews. Each hot point is declared as a (module,
+    class, attribute, name) tuple, where a class of None declares a
+    module level function. Methods are instrumented on the class and
+    on all its subclasses overriding them. The name may contain a
+    {cls} field, which is filled in with the class of the instance
+    the method is called on, giving separate timers per plot class.
+
+    When enabled, the hot points are replaced by wrappers recording
+    the calls to them and the time spent in them. Disabling restores
+    the original functions, so instrumentation has no cost while
+    disabled. Code outside the hot points may record its own timers
+    and counters through the timer and count methods. While enabled,
+    counters record whether the ranges of plots, the frames of
+    layouts and widgets and the plots pooled by the renderer are
+    computed afresh or taken from their caches.
+
+    The timers and counters may be reported as text, through the
+    %instrument magic in IPython or programmatically as a Table.
+    """
+
+    hot_points = param.List(default=[
+        ('holoviews.plotting', 'Plot', '__init__', '{cls} construction'),
+        ('holoviews.plotting', 'Plot', 'compute_ranges', 'Range computation'),
+        ('holoviews.plotting', 'Plot', '_get_frame', 'Frame selection'),
+        ('holoviews.plotting', 'Plot', 'update_frame', '{cls}.update_frame'),
+        ('holoviews.plotting', 'Plot', 'update_handles', '{cls}.update_handles'),
+        ('holoviews.plotting', 'MPLPlotRenderer', 'figure_data', 'Figure encoding'),
+        ('holoviews.operation', 'ElementOperation', '_process', '{cls}._process'),
+        ('holoviews.operation', 'Compositor', 'collapse', 'Compositor.collapse'),
+        ('holoviews.core.ndmapping', 'MultiDimensionalMapping', '_resort', 'NdMapping sort'),
+        ('holoviews.core.dimension', 'Dimensioned', 'select', '{cls}.select'),
+        ('holoviews.core.traversal', None, 'unique_dimkeys', 'unique_dimkeys')], doc="""
+        The hot points instrumented when enabled, declared as
+        (module, class, attribute, name) tuples.""")
+
+    counters = OrderedDict()
+
+    timers = OrderedDict()
+
+    _patched = []
+
+    @classmethod
+    def enabled(cls):
+        "Whether the hot points are currently instrumented"
+        return bool(cls._patched)
+
+
+    @classmethod
+    def enable(cls):
+        """
+        Instruments all the hot points. If any hot point cannot be
+        resolved, a warning is issued and none are instrumented.
+        """
+        if cls._patched: return
+        resolved, errors = [], []
+        for module, clsname, attr, name in cls.hot_points:
+            try:
+                module = import_module(module)
+                owner = module if clsname is None else getattr(module, clsname)
+                getattr(owner, attr)
+            except (ImportError, AttributeError) as e:
+                errors.append('%s: %s' % (attr, e))
+                continue
+            resolved.append((module, clsname, owner, attr, name))
+        if errors:
+            param.main.warning("Could not instrument the hot points, "
+                               "failed to resolve %s" % '; '.join(errors))
+            return
+        try:
+            for module, clsname, owner, attr, name in resolved:
+                if clsname is None:
+                    cls._patch_function(module, attr, name)
+                    continue
+                for subclass in cls._overriding(owner, attr):
+                    original = subclass.__dict__[attr]
+                    cls._patch(subclass, attr, original, cls._instrument(original, name))
+        except:
+            cls.disable()
+            raise
+
+
+    @classmethod
+    def disable(cls):
+        "Restores the original hot points"
+        for owner, attr, original in reversed(cls._patched):
+            cls._set(owner, attr, original)
+        cls._patched = []
+
+
+    @classmethod
+    def reset(cls):
+        "Discards all recorded timers and counters"
+        cls.timers.clear()
+        cls.counters.clear()
+
+
+    @classmethod
+    def count(cls, name, n=1):
+        "Increments the named counter"
+        cls.counters[name] = cls.counters.get(name, 0) + n
+
+
+    @classmethod
+    def timer(cls, name):
+        """
+        Returns a context manager recording the time spent in the
+        enclosed block in the named timer.
+        """
+        return _TimerContext(cls._timer(name))
+
+
+    @classmethod
+    def report(cls):
+        "Returns a text report of the timers and counters"
+        if not cls.timers and not cls.counters:
+            return 'No timers or counters recorded.'
+        rows = [('Name', 'Calls', 'Total (s)', 'Mean (ms)', 'Max (ms)')]
+        for name, timer in sorted(cls.timers.items(), key=lambda x: -x[1].total):
+            rows.append((name, str(timer.calls), '%.4f' % timer.total,
+                         '%.3f' % (timer.total*1000./timer.calls if timer.calls else 0),
+                         '%.3f' % (timer.maximum*1000.)))
+        for name, count in cls.counters.items():
+            rows.append((name, str(count), '', '', ''))
+        widths = [max(len(row[i]) for row in rows) for i in range(5)]
+        lines = ['  '.join([row[0].ljust(widths[0])] +
+                           [v.rjust(w) for v, w in zip(row[1:], widths[1:])])
+                 for row in rows]
+        lines.insert(1, '-' * len(lines[0]))
+        return '\n'.join(lines)
+
+
+    @classmethod
+    def table(cls):
+        """
+        Returns a Table of the calls and the total, mean and maximum
+        time in seconds of each timer. Counters are listed with their
+        count as the number of calls.
+        """
+        from ..element import Table
+        rows = OrderedDict()
+        for name, timer in cls.timers.items():
+            mean = timer.total/timer.calls if timer.calls else 0
+            rows[(name,)] = (timer.calls, timer.total, mean, timer.maximum)
+        for name, count in cls.counters.items():
+            rows[(name,)] = (count, float('nan'), float('nan'), float('nan'))
+        return Table(rows, key_dimensions=['Name'],
+                     value_dimensions=['Calls', 'Total', 'Mean', 'Max'],
+                     group='Instrumentation')
+
+
+    @classmethod
+    def _timer(cls, name):
+        timer = cls.timers.get(name)
+        if timer is None:
+            timer = cls.timers[name] = Timer()
+        return timer
+
+
+    @classmethod
+    def _overriding(cls, base, attr):
+        "Returns the base class and all its subclasses defining attr"
+        classes, seen, queue = [], set(), [base]
+        while queue:
+            owner = queue.pop(0)
+            if owner in seen: continue
+            seen.add(owner)
+            if attr in owner.__dict__:
+                classes.append(owner)
+            queue += owner.__subclasses__()
+        return classes
+
+
+    @classmethod
+    def _patch(cls, owner, attr, original, replacement):
+        cls._patched.append((owner, attr, original))
+        cls._set(owner, attr, replacement)
+
+
+    @staticmethod
+    def _set(owner, attr, value):
+        # Bypasses the warnings of Parameterized classes about
+        # setting attributes which are not parameters
+        if isinstance(owner, type):
+            type.__setattr__(owner, attr, value)
+        else:
+            setattr(owner, attr, value)
+
+
+    @classmethod
+    def _patch_function(cls, module, attr, name):
+        """
+        Instruments a module level function in every loaded module
+        holding a reference to it.
+        """
+        function = getattr(module, attr)
+        instrumented = cls._instrument(function, name)
+        for mod in list(sys.modules.values()):
+            if mod is not None and getattr(mod, attr, None) is function:
+                cls._patch(mod, attr, function, instrumented)
+
+
+    @classmethod
+    def _instrument(cls, function, name):
+        "Wraps a function or descriptor, recording calls and time"
+        if isinstance(function, (classmethod, staticmethod)):
+            return type(function)(cls._instrument(function.__func__, name))
+        timers = cls.timers
+        dynamic = '{cls}' in name
+
+        @wraps(function)
+        def instrumented(*args, **kwargs):
+            key = name.format(cls=type(args[0]).__name__) if dynamic else name
+            timer = timers.get(key)
+            if timer is None:
+                timer = timers[key] = Timer()
+            obj = args[0] if args else None
+            if timer.depth:
+                if obj is not timer.obj:
+                    timer.calls += 1
+                return function(*args, **kwargs)
+            timer.calls += 1
+            timer.depth, timer.obj = 1, obj
+            start = default_timer()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                timer.depth, timer.obj = 0, None
+                timer.record(default_timer() - start)
+        return instrumented
+
+
+
+class _TimerContext(object):
+    "Context manager recording the time spent in a block in a Timer"
+
+    def __init__(self, timer):
+        self._timer = timer
+
+    def __enter__(self):
+        self._outermost = not self._timer.depth
+        self._timer.calls += 1
+        if self._outermost:
+            self._timer.depth = 1
+            self._start = default_timer()
+
+    def __exit__(self, *exc):
+        if self._outermost:
+            self._timer.depth = 0
+            self._timer.record(default_timer() - self._start)
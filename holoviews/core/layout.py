@@ -253,6 +253,59 @@ class NdLayout(UniformNdMapping):
 
 
 
+class PathIndex(object):
+    """
+    PathIndex indexes a list of paths by their prefixes, counting the
+    paths sharing each prefix, so that a path may be checked against
+    the indexed paths and all their prefixes in time proportional to
+    the length of the path rather than the number of indexed paths.
+    The indexed list is updated in place.
+    """
+
+    def __init__(self, paths):
+        self.paths = paths
+        self._positions = {}
+        self._prefixes = {}
+        for position, path in enumerate(paths):
+            self._add(path, position)
+
+
+    def _add(self, path, position):
+        self._positions.setdefault(path, position)
+        for i in range(1, len(path)+1):
+            self._prefixes[path[:i]] = self._prefixes.get(path[:i], 0) + 1
+
+
+    def _remove(self, path):
+        for i in range(1, len(path)+1):
+            self._prefixes[path[:i]] -= 1
+            if not self._prefixes[path[:i]]:
+                del self._prefixes[path[:i]]
+        return self._positions.pop(path)
+
+
+    def __contains__(self, path):
+        return path in self._positions
+
+
+    def clashes(self, path):
+        "Whether the path matches an indexed path or any of its prefixes"
+        return path in self._prefixes
+
+
+    def append(self, path):
+        self.paths.append(path)
+        self._add(path, len(self.paths)-1)
+
+
+    def replace(self, path, new_path):
+        "Replaces an indexed path, retaining its position in the list"
+        position = self._remove(path)
+        self.paths[position] = new_path
+        self._add(new_path, position)
+
+
+
 class Layout(AttrTree, Dimensioned):
     """
     A Layout is an AttrTree with ViewableElement objects as leaf
@@ -284,12 +337,20 @@ class Layout(AttrTree, Dimensioned):
 
     @classmethod
     def new_path(cls, path, item, paths, count):
-        while any(path in [p[:i] for p in paths] for i in range(1,len(path)+1)):
+        """
+        Returns a path for the item which does not clash with the
+        supplied paths or any of their prefixes, along with the
+        updated count used to generate roman numeral identifiers.
+        Clashing paths are renamed in place. The paths may be
+        supplied as a PathIndex to avoid indexing them on each call.
+        """
+        index = paths if isinstance(paths, PathIndex) else PathIndex(paths)
+        while index.clashes(path):
             pl = len(path)
             if (pl == 1 and not item.label) or (pl == 2 and item.label):
                 new_path = path + (int_to_roman(count-1),)
-                if new_path not in paths:
-                    paths[paths.index(path)] = new_path
+                if new_path not in index and path in index:
+                    index.replace(path, new_path)
                 path = path + (int_to_roman(count),)
             else:
                 path = path[:-1] + (int_to_roman(count),)
@@ -308,17 +369,31 @@ class Layout(AttrTree, Dimensioned):
         identifiers if necessary.
         """
         paths, path_items = [], []
+        index = PathIndex(paths)
         count = 2
         for path, item in items:
-            new_path, count = cls.new_path(path, item, paths, count)
+            new_path, count = cls.new_path(path, item, index, count)
             path_items.append(item)
-            paths.append(new_path)
+            index.append(new_path)
         return zip(paths, path_items)
 
 
     @classmethod
     def _from_values(cls, val):
-        return reduce(lambda x,y: x+y, val).display('auto')
+        """
+        Equivalent to adding the values together in turn, except that
+        the paths are indexed once instead of relabelling all the
+        paths on each addition.
+        """
+        paths, items = [], []
+        index = PathIndex(paths)
+        for v in val:
+            count = 2
+            for path, item in cls.from_values(v).data.items():
+                new_path, count = cls.new_path(path, item, index, count)
+                index.append(new_path)
+                items.append(item)
+        return cls(items=zip(paths, items)).display('auto')
 
     @classmethod
     def from_values(cls, val):
@@ -259,7 +259,8 @@ class MultiDimensionalMapping(Dimensioned):
             dimension = all_dims[dimension]
 
         if dimension in self._cached_index_names:
-            return [k[self.get_dimension_index(dimension)] for k in self.data.keys()]
+            index = self.get_dimension_index(dimension)
+            return [k[index] for k in self.data.keys()]
         elif dimension in all_dims:
             values = [el.dimension_values(dimension) for el in self
                       if dimension in el.dimensions()]
@@ -3,6 +3,7 @@ Operations manipulate Elements, HoloMaps and Layouts, typically for
 the purposes of analysis or visualization.
 """
 from functools import reduce
+import numpy as np
 import param
 
 from .dimension import ViewableElement
@@ -65,6 +66,88 @@ class Operation(param.ParameterizedFunction):
 
 
 
+class ArrayMetadata(object):
+    """
+    ArrayMetadata stands in for an array-backed Element between the
+    array-level kernels of fused operations. It holds the type of the
+    Element, the parameters it would be constructed with and the
+    current data, supplying the dimensions, bounds and ranges kernels
+    consult without constructing the intermediate Elements. Only the
+    final array is wrapped in an Element by calling element().
+    """
+
+    def __init__(self, element_type, data, **params):
+        self.element_type = element_type
+        self.data = data
+        self.params = params
+
+
+    @classmethod
+    def from_element(cls, element):
+        "Returns the metadata of the supplied Element"
+        return cls(type(element), element.data, **dict(element.get_param_values()))
+
+
+    def __getattr__(self, attr):
+        params = self.__dict__.get('params', {})
+        if attr in params:
+            return params[attr]
+        element_params = self.__dict__['element_type'].params()
+        if attr in element_params:
+            return element_params[attr].default
+        raise AttributeError(attr)
+
+
+    def clone(self, data=None, **overrides):
+        """
+        Returns the metadata of an Element holding the supplied data
+        with the parameters overridden, mirroring Element.clone.
+        """
+        data = self.data if data is None else data
+        return ArrayMetadata(self.element_type, data, **dict(self.params, **overrides))
+
+
+    def element(self, **overrides):
+        "Wraps the data in an Element with the parameters overridden"
+        return self.element_type(self.data, **dict(self.params, **overrides))
+
+
+    def dimensions(self, selection='all', label=False):
+        dims = {'key': self.key_dimensions, 'value': self.value_dimensions,
+                'all': self.key_dimensions + self.value_dimensions}[selection]
+        return [d.name if label else d for d in dims]
+
+
+    def get_dimension(self, dimension, default=None):
+        dims = self.dimensions()
+        if isinstance(dimension, int):
+            return dims[dimension]
+        return {d.name: d for d in dims}.get(dimension, default)
+
+
+    def range(self, dim, data_range=True):
+        """
+        Returns the range along a dimension, taken from the bounds
+        for the key dimensions and otherwise computed like the range
+        of the Element.
+        """
+        dimension = self.get_dimension(dim)
+        if dimension in self.key_dimensions and 'bounds' in self.params:
+            l, b, r, t = self.bounds.lbrt()
+            return [(l, r), (b, t)][self.key_dimensions.index(dimension)]
+        if dimension.range != (None, None):
+            return dimension.range
+        elif not data_range:
+            return (None, None)
+        data = self.data
+        if data.ndim == 3:
+            data = data[..., self.value_dimensions.index(dimension)]
+        soft_range = [r for r in dimension.soft_range if r is not None]
+        values = np.concatenate([data.flatten(), soft_range])
+        return np.min(values), np.max(values)
+
+
+
 class ElementOperation(Operation):
     """
     An ElementOperation process an Element or HoloMap at the level of
@@ -95,6 +178,21 @@ class ElementOperation(Operation):
         raise NotImplementedError
 
 
+    # Operations that can be expressed as an array-in/array-out
+    # kernel override this with a method of signature
+    # _process_array(data, element, key=None, inplace=False)
+    _process_array = None
+
+    def _array_metadata(self, data, metadata, key=None):
+        """
+        Returns the ArrayMetadata of the Element the operation would
+        return for the output data of its kernel, given the metadata
+        of the input. Fused pipelines pass it to the next kernel, so
+        that the metadata the kernel consults matches unfused
+        processing without constructing intermediate Elements.
+        """
+        return metadata.clone(data)
+
     def process_element(self, element, key, **params):
         """
         The process_element method allows a single element to be
@@ -104,6 +202,20 @@ class ElementOperation(Operation):
         return self._process(element, key)
 
 
+    def process_array(self, data, element, key=None, inplace=False, **params):
+        """
+        The process_array method applies the array-level kernel of
+        the operation to the supplied data, consulting the element or
+        its ArrayMetadata only for metadata such as dimensions and
+        bounds. If inplace
+        is True the kernel may reuse the data array for its output.
+        Used by fused pipelines (e.g. chain) to avoid copying the
+        data of intermediate elements.
+        """
+        self.p = param.ParamOverrides(self, params)
+        return self._process_array(data, element, key, inplace)
+
+
     def __call__(self, element, **params):
         self.p = param.ParamOverrides(self, params)
 
@@ -296,8 +296,19 @@ class OptionTree(AttrTree):
     given an object and a mode. For a given node of the tree, the
     options method computes a Options object containing the result of
     inheritance for a given group up to the root of the tree.
+
+    The results of the closest method are cached across all trees
+    until any OptionTree node is set or Store.options is replaced.
     """
 
+    # Incremented whenever any OptionTree node is set
+    _generation = 0
+
+    # Cache of closest lookups and the state it is valid for
+    _closest_cache = {}
+    _closest_cache_state = None
+    _closest_cache_stats = {'hits': 0, 'misses': 0}
+
     def __init__(self, items=None, identifier=None, parent=None, groups=None):
         if groups is None:
             raise ValueError('Please supply groups dictionary')
@@ -359,6 +370,7 @@ class OptionTree(AttrTree):
 
 
     def __setattr__(self, identifier, val):
+        OptionTree._generation += 1
         identifier = sanitize_identifier(identifier, escape=False)
         new_groups = {}
         if isinstance(val, dict):
@@ -421,7 +433,43 @@ class OptionTree(AttrTree):
         object
         """
         components = (obj.__class__.__name__, obj.group, obj.label)
-        return self.find(components).options(group)
+        cls = OptionTree
+        state = cls._closest_cache_state
+        if (state is None or state[0] != cls._generation
+            or state[1] is not Store.options):
+            cls._closest_cache.clear()
+            cls._closest_cache_state = (cls._generation, Store.options)
+
+        key = (id(self),) + components + (group,)
+        entry = cls._closest_cache.get(key)
+        if entry is not None:
+            cls._closest_cache_stats['hits'] += 1
+            return entry[1]
+        cls._closest_cache_stats['misses'] += 1
+        options = self.find(components).options(group)
+        # Holding on to the tree ensures its id cannot be reused
+        cls._closest_cache[key] = (self, options)
+        return options
+
+
+    @classmethod
+    def cache_info(cls):
+        """
+        Returns a dictionary of the hits, misses and current size of
+        the cache used by the closest method.
+        """
+        return dict(cls._closest_cache_stats, size=len(cls._closest_cache))
+
+
+    @classmethod
+    def clear_cache(cls):
+        """
+        Clears the cache used by the closest method and resets the
+        hit statistics.
+        """
+        cls._closest_cache.clear()
+        cls._closest_cache_state = None
+        cls._closest_cache_stats.update(hits=0, misses=0)
 
 
 
@@ -508,6 +556,10 @@ class Compositor(param.Parameterized):
     operations = []  # The operations that can be used to define compositors.
     definitions = [] # The set of all the compositor instances
 
+    # Cache of strongest matches by mode and overlay signature and
+    # the definitions (and their modes) the cache is valid for
+    _match_cache = {}
+    _match_cache_state = None
 
     @classmethod
     def strongest_match(cls, overlay, mode):
@@ -517,12 +569,34 @@ class Compositor(param.Parameterized):
 
         The best match is defined as the compositor operation with the
         highest match value as returned by the match_level method.
+
+        As the match only depends on the (type, group, label) of the
+        overlaid elements, the result is cached by this signature
+        until the compositor definitions change.
+        """
+        state = [(op, op.mode) for op in cls.definitions]
+        if state != cls._match_cache_state:
+            cls._match_cache.clear()
+            cls._match_cache_state = state
+
+        signature = cls._signature(overlay.values())
+        key = (mode, signature)
+        if key not in cls._match_cache:
+            match_strength = [(op._signature_match_level(signature), op)
+                              for op in cls.definitions if op.mode == mode]
+            matches = [(match[0], op, match[1]) for (match, op) in match_strength
+                       if match is not None]
+            cls._match_cache[key] = None if matches == [] else sorted(matches)[0]
+        return cls._match_cache[key]
+
+
+    @classmethod
+    def _signature(cls, elements):
+        """
+        Returns the (type, group, label) signature of a list of
+        elements, as used to match compositor patterns.
         """
-        match_strength = [(op.match_level(overlay), op) for op in cls.definitions
-                          if op.mode == mode]
-        matches = [(match[0], op, match[1]) for (match, op) in match_strength if match is not None]
-        if matches == []: return None
-        else:             return sorted(matches)[0]
+        return tuple((type(el).__name__, el.group, el.label) for el in elements)
 
 
     @classmethod
@@ -610,19 +684,23 @@ class Compositor(param.Parameterized):
         Find the match strength for a list of overlay items that must
         be exactly the same length as the pattern specification.
         """
+        return self._slice_signature_level(self._signature(overlay_items))
+
+
+    def _slice_signature_level(self, signature):
         level = 0
-        for spec, el in zip(self._pattern_spec, overlay_items):
-            if spec[0] != type(el).__name__:
+        for spec, (type_name, group, label) in zip(self._pattern_spec, signature):
+            if spec[0] != type_name:
                 return None
             level += 1      # Types match
             if len(spec) == 1: continue
 
-            group = [el.group, sanitize_identifier(el.group, escape=False)]
+            group = [group, sanitize_identifier(group, escape=False)]
             if spec[1] in group: level += 1  # Values match
             else:                     return None
 
             if len(spec) == 3:
-                group = [el.label, sanitize_identifier(el.label, escape=False)]
+                group = [label, sanitize_identifier(label, escape=False)]
                 if (spec[2] in group):
                     level += 1  # Labels match
                 else:
@@ -639,14 +717,17 @@ class Compositor(param.Parameterized):
         The level integer is the number of matching components. Higher
         values indicate a stronger match.
         """
+        return self._signature_match_level(self._signature(overlay.values()))
+
+
+    def _signature_match_level(self, signature):
         slice_width = len(self._pattern_spec)
-        if slice_width > len(overlay): return None
+        if slice_width > len(signature): return None
 
         # Check all the possible slices and return the best matching one
         best_lvl, match_slice = (0, None)
-        for i in range(len(overlay)-slice_width+1):
-            overlay_slice = overlay.values()[i:i+slice_width]
-            lvl = self._slice_match_level(overlay_slice)
+        for i in range(len(signature)-slice_width+1):
+            lvl = self._slice_signature_level(signature[i:i+slice_width])
             if lvl is None: continue
             if lvl > best_lvl:
                 best_lvl = lvl
@@ -20,8 +20,8 @@ def uniform(obj):
     dimensions. If there are is no common subset of dimensions, None
     is returned.
     """
-    dim_groups = obj.traverse(lambda x: tuple(x.key_dimensions),
-                              ('HoloMap',))
+    dim_groups = set(obj.traverse(lambda x: tuple(x.key_dimensions),
+                                  ('HoloMap',)))
     if dim_groups:
         return all(set(g1) <= set(g2) or set(g1) >= set(g2)
                    for g1 in dim_groups for g2 in dim_groups)
@@ -54,16 +54,21 @@ def unique_dimkeys(obj, default_dim='Frame'):
         all_dims = [default_dim]
 
     ndims = len(all_dims)
-    unique_keys = []
+    unique_keys, found = [], set()
     for group, keys in zip(dim_groups, keys):
         dim_idxs = [all_dims.index(dim) for dim in group]
         for key in keys:
             padded_key = create_ndkey(ndims, dim_idxs, key)
-            matches = [item for item in unique_keys
-                       if padded_key == tuple(k if k is None else i
-                                              for i, k in zip(item, padded_key))]
-            if not matches:
+            # A key specifying every dimension can only match itself
+            if None not in padded_key:
+                matched = padded_key in found
+            else:
+                matched = any(padded_key == tuple(k if k is None else i
+                                                  for i, k in zip(item, padded_key))
+                              for item in unique_keys)
+            if not matched:
                 unique_keys.append(padded_key)
+                found.add(padded_key)
 
     sorted_keys = NdMapping({key: None for key in unique_keys},
                             key_dimensions=all_dims).data.keys()
@@ -38,6 +38,16 @@ def int_to_roman(input):
    return result
 
 
+def int_to_alpha(n, upper=True):
+    "Generates alphabetic labels of the form A-Z, AA-AZ, BA-BZ etc."
+    casenum = 65 if upper else 97
+    label = ''
+    while n >= 0:
+        label = chr(n % 26 + casenum) + label
+        n = n // 26 - 1
+    return str(label)
+
+
 UNDERSCORE_TOKEN = 'UNDERSCORE'
 
 def sanitize_identifier(name, escape=True):
@@ -92,7 +102,9 @@ def match_spec(element, specification):
     """
     match_tuple = ()
     match = specification.get((), {})
-    for spec in [type(element).__name__,
+    # ArrayMetadata stands in for Elements of its element_type
+    element_type = getattr(element, 'element_type', type(element))
+    for spec in [element_type.__name__,
                  sanitize_identifier(element.group, escape=False),
                  sanitize_identifier(element.label, escape=False)]:
         match_tuple += (spec,)
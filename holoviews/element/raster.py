@@ -1,6 +1,5 @@
 from itertools import product
 import numpy as np
-import colorsys
 import param
 
 from ..core import OrderedDict, Dimension, NdMapping, Element2D, Overlay
@@ -68,30 +67,26 @@ class Raster(Element2D):
         return function(np.dstack(data_list), axis=-1, **kwargs)
 
 
-    def sample(self, samples=[], **sample_values):
+    def _sample_index(self, samples=[], **sample_values):
         """
-        Sample the Raster along one or both of its dimensions,
-        returning a reduced dimensionality type, which is either
-        a ItemTable, Curve or Scatter. If two dimension samples
-        and a new_xaxis is provided the sample will be the value
-        of the sampled unit indexed by the value in the new_xaxis
-        tuple.
+        Resolves the requested samples into the key dimensions of the
+        sampled result, the list of sample coordinates and the index
+        into the data array selecting the sampled values. The index
+        only depends on the shape and extents of the Raster, allowing
+        a HoloMap of uniform Rasters to sample all frames at once.
         """
         if isinstance(samples, tuple):
             X, Y = samples
             samples = zip(X, Y)
-        params = dict(self.get_param_values(onlychanged=True),
-                      value_dimensions=self.value_dimensions)
         if len(sample_values) == self.ndims or len(samples):
             if not len(samples):
                 samples = zip(*[c if isinstance(c, list) else [c] for didx, c in
                                sorted([(self.get_dimension_index(k), v) for k, v in
                                        sample_values.items()])])
-            table_data = OrderedDict()
-            for c in samples:
-                table_data[c] = self.data[self._coord2matrix(c)]
-            params['key_dimensions'] = self.key_dimensions
-            return Table(table_data, **params)
+            coords = list(OrderedDict.fromkeys(samples))
+            indices = [self._coord2matrix(c) for c in coords]
+            index = tuple(np.array(idx, dtype=int) for idx in zip(*indices))
+            return self.key_dimensions, coords, index
         else:
             dimension, sample_coord = list(sample_values.items())[0]
             if isinstance(sample_coord, slice):
@@ -108,11 +103,27 @@ class Raster(Element2D):
             coord_fn = (lambda v: (v, 0)) if sample_ind else (lambda v: (0, v))
             sample[sample_ind] = self._coord2matrix(coord_fn(sample_coord))[sample_ind]
 
-            # Sample data
             x_vals = sorted(set(self.dimension_values(dimension)))
-            data = list(zip(x_vals, self.data[sample]))
-            params['key_dimensions'] = other_dimension
-            return Curve(data, **params)
+            return other_dimension, x_vals, tuple(sample)
+
+
+    def sample(self, samples=[], **sample_values):
+        """
+        Sample the Raster along one or both of its dimensions,
+        returning a reduced dimensionality type, which is either
+        a ItemTable, Curve or Scatter. If two dimension samples
+        and a new_xaxis is provided the sample will be the value
+        of the sampled unit indexed by the value in the new_xaxis
+        tuple.
+        """
+        params = dict(self.get_param_values(onlychanged=True),
+                      value_dimensions=self.value_dimensions)
+        dimensions, coords, index = self._sample_index(samples, **sample_values)
+        params['key_dimensions'] = dimensions
+        if len(dimensions) == self.ndims:
+            return Table(list(zip(coords, self.data[index])), **params)
+        else:
+            return Curve(list(zip(coords, self.data[index])), **params)
 
 
     def reduce(self, dimensions=None, function=None, **reduce_map):
@@ -557,7 +568,24 @@ class HSV(RGB):
         If an alpha channel is supplied, the defined alpha_dimension
         is automatically appended to this list.""")
 
-    hsv_to_rgb = np.vectorize(colorsys.hsv_to_rgb)
+    @staticmethod
+    def hsv_to_rgb(h, s, v):
+        """
+        Array equivalent of colorsys.hsv_to_rgb, converting arrays of
+        hue, saturation and value into a tuple of red, green and blue
+        arrays using the same arithmetic.
+        """
+        h, s, v = np.asarray(h), np.asarray(s), np.asarray(v)
+        h6 = h*6.0
+        i = h6.astype(int)
+        f = h6 - i
+        p = v*(1.0 - s)
+        q = v*(1.0 - s*f)
+        t = v*(1.0 - s*(1.0 - f))
+        i = i % 6
+        return (np.choose(i, [v, q, p, p, t, v]),
+                np.choose(i, [t, v, v, q, p, p]),
+                np.choose(i, [p, p, t, v, v, q]))
 
     @property
     def rgb(self):
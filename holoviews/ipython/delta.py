@@ -0,0 +1,314 @@
+"""
+Implements DeltaEncoder, encoding successive frames of a matplotlib
+figure as the changes to its artists between frames, which are drawn
+by the DeltaFrames Javascript client of the widgets.
+"""
+
+import base64
+from hashlib import sha256
+from io import BytesIO
+
+import numpy as np
+from matplotlib.backends.backend_agg import RendererAgg
+from matplotlib.collections import PathCollection
+from matplotlib.colors import colorConverter, rgb2hex
+from matplotlib.image import AxesImage, imsave
+from matplotlib.lines import Line2D
+from matplotlib.path import Path
+from matplotlib.text import Text
+
+import param
+
+from ..core import OrderedDict
+from ..plotting import Plot
+
+
+def b64encode(data):
+    return base64.b64encode(data).decode('utf-8')
+
+
+def pack(array, dtype='<f4'):
+    "Packs an array into base64 encoded bytes of the supplied dtype"
+    return b64encode(np.ascontiguousarray(array, dtype=dtype).tostring())
+
+
+def hex_color(color):
+    return rgb2hex(colorConverter.to_rgb(color))
+
+
+class DeltaEncoder(param.Parameterized):
+    """
+    DeltaEncoder encodes successive frames of a figure as the changes
+    to its dynamic artists. The static parts of the figure, such as
+    the axes, ticks, labels and colorbars, are rendered into a
+    background image on each keyframe, while the images, lines,
+    scatter points and unrotated text of the axes are encoded as
+    payloads drawn on top of it: images as PNG tiles, line and point
+    data as packed float32 arrays of pixel coordinates and text as
+    strings with their font properties.
+
+    Each frame only holds the payloads which changed since the
+    previous frame. A keyframe, holding the background and every
+    payload, is emitted whenever the background changes, e.g. when
+    the axis ranges change, and after every keyframe_interval frames.
+    Artists which cannot be drawn by the client are left on the
+    background, so figures using them are encoded as keyframes.
+
+    When the plot of the figure is supplied and every artist it
+    updates between frames is drawn by the client, the background is
+    only rendered again when the static state of the figure changes
+    (see Plot._static_state). Otherwise it is rendered for each frame
+    to detect changes to the artists left on it.
+    """
+
+    dpi = param.Integer(default=72, doc="""
+        The resolution of the encoded frames in dots per inch.""")
+
+    keyframe_interval = param.Integer(default=25, bounds=(1, None), doc="""
+        The maximum number of frames between keyframes, bounding the
+        number of frames the client applies to display any frame.""")
+
+    line_styles = ['-', 'solid', 'None', ' ', '']
+
+    markers = ['o', 'None', None, ' ', '']
+
+    def __init__(self, **params):
+        super(DeltaEncoder, self).__init__(**params)
+        self._background = None
+        self._background_state = None
+        self._artists = {}
+        self._tiles = {}
+        self._hidden = []
+        self._since_keyframe = 0
+
+
+    def __call__(self, fig, plot=None):
+        """
+        Encodes the current state of the figure as a frame relative
+        to the previously encoded frame, optionally supplying the
+        plot of the figure to avoid rendering an unchanged background.
+        The figure is encoded at the dpi of the encoder, restoring
+        its own dpi afterwards.
+        """
+        dpi = fig.dpi
+        fig.set_dpi(self.dpi)
+        try:
+            return self._encode(fig, plot)
+        finally:
+            fig.set_dpi(dpi)
+
+
+    def _encode(self, fig, plot):
+        width, height = fig.canvas.get_width_height()
+        dynamic = self._dynamic_artists(fig)
+        self._hidden = [a for _, a in dynamic.values()]
+        background = self._render_background(fig, plot, dynamic)
+
+        renderer = RendererAgg(width, height, self.dpi)
+        tiles, artists = {}, OrderedDict()
+        for id, (z, artist) in dynamic.items():
+            payload = getattr(self, '_encode_%s' % id.split('-')[1])(artist, renderer,
+                                                                      height, tiles)
+            payload['z'] = z
+            artists[id] = payload
+
+        keyframe = (background != self._background or
+                    self._since_keyframe >= self.keyframe_interval)
+        frame = {'width': width, 'height': height}
+        if keyframe:
+            frame['background'] = b64encode(background)
+            frame['artists'] = artists
+            self._since_keyframe = 0
+        else:
+            frame['artists'] = OrderedDict((id, payload) for id, payload in artists.items()
+                                           if self._artists.get(id) != payload)
+            removed = [id for id in self._artists if id not in artists]
+            if removed:
+                frame['removed'] = removed
+        self._since_keyframe += 1
+        self._background, self._artists, self._tiles = background, artists, tiles
+        return frame
+
+
+    def _render_background(self, fig, plot, dynamic):
+        """
+        Returns the rendered background of the figure, reusing the
+        previous background if the plot only updates artists drawn by
+        the client and the static state of the figure is unchanged.
+        """
+        state = None
+        if plot is not None and plot.blittable():
+            drawn = set(id(a) for _, a in dynamic.values())
+            if all(id(a) in drawn for a in plot.dynamic_artists() if a.get_visible()):
+                state = (Plot._static_state(fig), list(dynamic.keys()))
+        if state is None or state != self._background_state or self._background is None:
+            background = self._render(fig, self._hidden)
+        else:
+            background = self._background
+        self._background_state = state
+        return background
+
+
+    def _dynamic_artists(self, fig):
+        """
+        Returns the visible artists of the figure drawn by the client
+        indexed by their id, along with their drawing order.
+        """
+        artists = OrderedDict()
+        for i, ax in enumerate(fig.axes):
+            candidates = ([('image', a) for a in ax.images] +
+                          [('line', a) for a in ax.lines] +
+                          [('scatter', a) for a in ax.collections] +
+                          [('text', a) for a in [ax.title] + ax.texts])
+            for n, (kind, artist) in enumerate(candidates):
+                if artist.get_visible() and self._supported(kind, artist):
+                    order = [i, artist.get_zorder(), n]
+                    artists['%d-%s-%d' % (i, kind, n)] = (order, artist)
+        for n, artist in enumerate(fig.texts):
+            if artist.get_visible() and self._supported('text', artist):
+                order = [len(fig.axes), artist.get_zorder(), n]
+                artists['fig-text-%d' % n] = (order, artist)
+        return artists
+
+
+    def _supported(self, kind, artist):
+        "Whether the artist can be drawn by the client"
+        if kind == 'image':
+            return isinstance(artist, AxesImage)
+        elif kind == 'line':
+            return (isinstance(artist, Line2D) and
+                    artist.get_drawstyle() == 'default' and
+                    artist.get_linestyle() in self.line_styles and
+                    artist.get_marker() in self.markers and
+                    artist.get_markerfacecolor() != 'none')
+        elif kind == 'scatter':
+            if type(artist) is not PathCollection or len(artist.get_paths()) != 1:
+                return False
+            vertices = artist.get_paths()[0].vertices
+            circle = Path.unit_circle().vertices
+            return (vertices.shape == circle.shape and
+                    np.allclose(vertices / np.abs(vertices).max(), circle))
+        text = artist.get_text()
+        return (type(artist) is Text and artist.get_rotation() == 0 and
+                not artist.get_usetex() and '\n' not in text and '$' not in text)
+
+
+    def _render(self, fig, hidden, fmt='png'):
+        "Renders the figure without the hidden artists"
+        for artist in hidden:
+            artist.set_visible(False)
+        try:
+            data = BytesIO()
+            fig.canvas.print_figure(data, format=fmt, dpi=self.dpi,
+                                    facecolor=fig.get_facecolor(),
+                                    edgecolor=fig.get_edgecolor())
+        finally:
+            for artist in hidden:
+                artist.set_visible(True)
+        return data.getvalue()
+
+
+    def _clip(self, artist, height):
+        "Returns the clip rectangle of the artist in pixel coordinates"
+        clip_box = artist.get_clip_box()
+        if not artist.get_clip_on() or clip_box is None:
+            return None
+        x0, y0, x1, y1 = clip_box.extents
+        return [x0, height-y1, x1-x0, y1-y0]
+
+
+    def _alpha(self, artist):
+        alpha = artist.get_alpha()
+        return 1 if alpha is None else alpha
+
+
+    def _encode_image(self, artist, renderer, height, tiles):
+        """
+        Encodes the image as a PNG tile covering the pixels it is
+        drawn to, only rendering tiles which changed since the
+        previous frame. The tile is cropped from a render of the
+        figure so that static artists drawn above the image, such as
+        the axis spines, are preserved.
+        """
+        data = artist.get_array()
+        state = (artist.get_clim(), artist.get_cmap().name, artist.get_extent(),
+                 artist.get_alpha(), artist.get_interpolation(),
+                 artist.axes.bbox.bounds, artist.axes.viewLim.bounds)
+        signature = sha256(np.ascontiguousarray(np.ma.getdata(data)).tostring() +
+                           np.ma.getmaskarray(data).tostring() +
+                           repr(state).encode('utf-8')).hexdigest()
+        tile = self._tiles.get(signature, tiles.get(signature))
+        if tile is None:
+            renderer.clear()
+            artist.draw(renderer)
+            shape = (height, renderer.width, 4)
+            alpha = np.frombuffer(renderer.buffer_rgba(), np.uint8).reshape(shape)[..., 3]
+            rows, cols = np.nonzero(alpha)
+            if len(rows):
+                y0, y1, x0, x1 = rows.min(), rows.max()+1, cols.min(), cols.max()+1
+                hidden = [a for a in self._hidden if a is not artist]
+                rgba = np.frombuffer(self._render(artist.figure, hidden, 'rgba'),
+                                     np.uint8).reshape(shape)
+                png = BytesIO()
+                imsave(png, rgba[y0:y1, x0:x1], format='png')
+                tile = {'type': 'image', 'x': int(x0), 'y': int(y0),
+                        'png': b64encode(png.getvalue())}
+            else:
+                tile = {'type': 'image'}
+        tiles[signature] = tile
+        return dict(tile)
+
+
+    def _encode_line(self, artist, renderer, height, tiles):
+        "Encodes the line as packed pixel coordinates"
+        xy = artist.get_transform().transform(artist.get_xydata())
+        xy[:, 1] = height - xy[:, 1]
+        scale = self.dpi / 72.
+        marker = artist.get_marker() == 'o'
+        payload = {'type': 'line', 'xy': pack(xy),
+                   'stroke': artist.get_linestyle() in ['-', 'solid'],
+                   'color': hex_color(artist.get_color()),
+                   'width': artist.get_linewidth() * scale,
+                   'alpha': self._alpha(artist),
+                   'clip': self._clip(artist, height), 'marker': marker}
+        if marker:
+            payload['markersize'] = artist.get_markersize() * scale
+            payload['markercolor'] = hex_color(artist.get_markerfacecolor())
+        return payload
+
+
+    def _encode_scatter(self, artist, renderer, height, tiles):
+        """
+        Encodes the points as packed pixel coordinates, radii and
+        RGBA colors.
+        """
+        artist.update_scalarmappable()
+        offsets = artist.get_offsets()
+        xy = artist.get_offset_transform().transform(offsets)
+        xy[:, 1] = height - xy[:, 1]
+        scale = self.dpi / 72.
+        radii = np.sqrt(artist.get_sizes()) * scale / 2.
+        colors = np.round(artist.get_facecolors() * 255)
+        payload = {'type': 'scatter', 'xy': pack(xy), 'radii': pack(radii),
+                   'colors': pack(colors, 'u1'), 'alpha': self._alpha(artist),
+                   'clip': self._clip(artist, height)}
+        edgecolors, widths = artist.get_edgecolors(), artist.get_linewidths()
+        if len(edgecolors) and len(widths) and widths[0]:
+            payload['edgecolor'] = hex_color(edgecolors[0])
+            payload['edgewidth'] = widths[0] * scale
+        return payload
+
+
+    def _encode_text(self, artist, renderer, height, tiles):
+        "Encodes the text with its font and pixel position"
+        text = artist.get_text()
+        x, y = 0, 0
+        if text:
+            bbox = artist.get_window_extent(renderer)
+            x, y = bbox.x0, height - bbox.y0
+        font = '%s %s %spx "%s", %s' % (artist.get_style(), artist.get_weight(),
+                                        artist.get_size() * self.dpi / 72.,
+                                        artist.get_fontname(), artist.get_family()[0])
+        return {'type': 'text', 'text': text, 'x': x, 'y': y, 'font': font,
+                'color': hex_color(artist.get_color()), 'alpha': self._alpha(artist),
+                'clip': self._clip(artist, height)}
@@ -24,7 +24,7 @@ from ..core import Element, ViewableElement, HoloMap, AdjointLayout, NdLayout,\
 from ..core.traversal import unique_dimkeys, bijective
 from ..element import Raster
 from ..plotting import LayoutPlot, GridPlot, RasterGridPlot
-from ..plotting import ANIMATION_OPTS, HTML_TAGS, opts, get_plot_size
+from ..plotting import ANIMATION_OPTS, HTML_TAGS, Base64Sink, opts, get_plot_size
 from .magics import OutputMagic, OptsMagic
 from .widgets import IPySelectionWidget, SelectionWidget, ScrubberWidget
 
@@ -46,8 +46,10 @@ def animate(anim, dpi, writer, fmt, anim_kwargs, extra_args):
         anim_kwargs = dict(anim_kwargs, extra_args=extra_args)
 
     renderer = Store.renderer.instance(dpi=dpi)
-    data = renderer.anim_data(anim, fmt, writer, **anim_kwargs)
-    b64data = base64.b64encode(data).decode("utf-8")
+    # Encode the video as it is streamed rather than holding it whole
+    sink = Base64Sink()
+    renderer.anim_stream(anim, fmt, writer, sink, **anim_kwargs)
+    b64data = sink.getvalue()
     (mime_type, tag) = HTML_TAGS[fmt]
     src = HTML_TAGS['base64'].format(mime_type=mime_type, b64=b64data)
     return  tag.format(src=src, mime_type=mime_type)
@@ -128,10 +130,11 @@ def display_widgets(plot):
     if widget_format == 'auto':
         widget_format = 'scrubber' if islinear or not isuniform else 'widgets'
 
+    lazy = widget_mode == 'lazy'
     if widget_format == 'scrubber':
-        return ScrubberWidget(plot)()
-    if widget_mode == 'embed':
-        return SelectionWidget(plot)()
+        return ScrubberWidget(plot, lazy=lazy)()
+    if widget_mode in ['embed', 'lazy']:
+        return SelectionWidget(plot, lazy=lazy)()
     elif widget_mode == 'cached':
         return IPySelectionWidget(plot, cached=True)()
     else:
@@ -210,15 +213,18 @@ def animation_display(anim, map_format, dpi=72, **kwargs):
 
 
 @display_hook
-def element_display(element, size, **kwargs):
+def element_display(element, size, widget_mode, **kwargs):
     if not isinstance(element, ViewableElement): return None
     if type(element) == Element:                 return None
     info = process_object(element)
     if info: return info
     if element.__class__ not in Store.registry: return None
-    fig = Store.registry[element.__class__](element,
-                                         **opts(element, get_plot_size(element, size)))()
-    return display_figure(fig)
+    plot = Store.registry[element.__class__](element,
+                                             **opts(element, get_plot_size(element, size)))
+    # Plots may display an Element across several frames, e.g. pages of a Table
+    if len(plot) > 1 and widget_mode is not None:
+        return display_widgets(plot)
+    return display_figure(plot())
 
 
 @display_hook
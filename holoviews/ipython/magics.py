@@ -8,6 +8,7 @@ except:
 
 from ..core import OrderedDict
 from ..core.options import Options, OptionError, Store, StoreOptions
+from ..core.instrumentation import Instrumentation
 from ..core.pprint import InfoPrinter
 
 from IPython.display import display, HTML
@@ -153,7 +154,7 @@ class OutputMagic(OptionsMagic):
     allowed = {'backend'     : ['mpl','d3'],
                'fig'         : ['svg', 'png', 'repr'],
                'holomap'     : inbuilt_formats,
-               'widgets'     : ['embed', 'live', 'cached'],
+               'widgets'     : ['embed', 'live', 'cached', 'lazy'],
                'fps'         : (0, float('inf')),
                'max_frames'  : (0, float('inf')),
                'max_branches': (0, float('inf')),
@@ -242,9 +243,9 @@ class OutputMagic(OptionsMagic):
                 raise ValueError("The D3 backend only supports holomap options %r" % allowed)
 
         if (options['holomap']=='widgets'
-            and options['widgets']!='embed'
+            and options['widgets'] not in ['embed', 'lazy']
             and options['fig']=='svg'):
-            raise ValueError("SVG mode not supported by widgets unless in embed mode")
+            raise ValueError("SVG mode not supported by widgets unless in embed or lazy mode")
         return options
 
 
@@ -559,8 +560,65 @@ class TimerMagic(Magics):
             print(self.elapsed_time())
 
 
+@magics_class
+class InstrumentMagic(Magics):
+    """
+    Magic reporting the time spent in the hot points of HoloViews,
+    such as plot construction, range computation and figure encoding,
+    as recorded by the core Instrumentation.
+    """
+
+    @classmethod
+    def option_completer(cls, k,v):
+        return ['on', 'off', 'reset']
+
+    @line_cell_magic
+    def instrument(self, line='', cell=None):
+        """
+        Instrumentation magic reporting named timers and counters.
+
+        To report the timers and counters of a single cell, run:
+
+        %%instrument
+        <cell contents>
+
+        This enables the instrumentation while running the cell and
+        prints the timers and counters recorded by it. In line mode,
+        %instrument on and %instrument off enable and disable the
+        instrumentation across cells, %instrument reset discards the
+        recorded timers and counters and %instrument prints them.
+        The timers are available as a Table from
+        Instrumentation.table().
+        """
+        line = line.strip()
+        if line not in ['', 'on', 'off', 'reset']:
+            print("Invalid argument to %instrument. For more information consult %instrument?")
+            return
+
+        if cell is not None:
+            enabled = Instrumentation.enabled()
+            Instrumentation.reset()
+            Instrumentation.enable()
+            try:
+                self.shell.run_cell(cell, store_history=STORE_HISTORY)
+            finally:
+                if not enabled:
+                    Instrumentation.disable()
+            print(Instrumentation.report())
+        elif line == 'on':
+            Instrumentation.enable()
+        elif line == 'off':
+            Instrumentation.disable()
+        elif line == 'reset':
+            Instrumentation.reset()
+        else:
+            print(Instrumentation.report())
+
+
+
 def load_magics(ip):
     ip.register_magics(TimerMagic)
+    ip.register_magics(InstrumentMagic)
     ip.register_magics(OutputMagic)
 
     if pyparsing is None:  print("%opts magic unavailable (pyparsing cannot be imported)")
@@ -0,0 +1,206 @@
+"""
+Implements FrameServer, a lightweight local HTTP server serving the
+frames of widgets from an on-disk cache, rendering them on demand.
+"""
+
+import os, re, hmac, threading
+from hashlib import sha256
+
+try:    # Python 3
+    from http.server import HTTPServer, BaseHTTPRequestHandler
+    from socketserver import ThreadingMixIn
+except: # Python 2
+    from BaseHTTPServer import HTTPServer, BaseHTTPRequestHandler
+    from SocketServer import ThreadingMixIn
+
+import param
+
+
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    "HTTPServer handling each request in a separate thread"
+
+    daemon_threads = True
+
+
+class FrameRequestHandler(BaseHTTPRequestHandler):
+    """
+    Handles requests for the frames of the widgets registered on the
+    FrameServer of the server, supplied at server/{token}/fig_{id}/{frame}
+    where the token authorizes access to the frames of the widget.
+    Responses carry the content hash of the frame as their ETag so
+    that revalidated frames are answered with 304 Not Modified.
+    """
+
+    path_pattern = re.compile(r'^/(?P<token>[0-9a-f]+)/fig_(?P<id>[\w-]+)/(?P<frame>\d+)$')
+
+    def do_GET(self):
+        match = self.path_pattern.match(self.path.split('?')[0])
+        if match is None:
+            return self.send_error(404, "Not a frame: %s" % self.path)
+        frame_server = self.server.frame_server
+        if not frame_server.authorized(match.group('id'), match.group('token')):
+            return self.send_error(403, "Not authorized to access %s" % self.path)
+        try:
+            frame = frame_server.frame(match.group('id'), int(match.group('frame')))
+        except (KeyError, IndexError) as e:
+            return self.send_error(404, "No frame found: %s" % e)
+        if frame is None:
+            return self.send_error(404, "No widget found for %s" % self.path)
+
+        digest, path, content_type, encoding = frame
+        etag = '"%s"' % digest
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self._send_headers(etag)
+            return self.end_headers()
+
+        with open(path, 'rb') as f:
+            data = f.read()
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        if encoding is not None:
+            self.send_header('Content-Encoding', encoding)
+        self.send_header('Content-Length', str(len(data)))
+        self._send_headers(etag)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+    def _send_headers(self, etag):
+        self.send_header('ETag', etag)
+        self.send_header('Cache-Control', 'no-cache')
+        # Widgets are displayed in notebooks served from another origin,
+        # which may read the frames as the request carried the token
+        # only embedded in the notebook
+        origin = self.headers.get('Origin')
+        if origin:
+            self.send_header('Access-Control-Allow-Origin', origin)
+            self.send_header('Vary', 'Origin')
+
+
+    def log_message(self, format, *args):
+        self.server.frame_server.debug(format % args)
+
+
+
+class FrameServer(param.Parameterized):
+    """
+    FrameServer is a threaded HTTP server serving the frames of the
+    registered widgets at url/{token}/fig_{id}/{frame}, where the token
+    is derived from the widget id and a secret of the server, so that
+    only pages embedding the widget may load its frames. At most
+    max_widgets of the most recently registered or used widgets are
+    served, releasing the others. Frames are rendered on
+    demand through the plotting classes of the widgets, as HTML or as
+    raw images when the widgets use binary frames, and stored in a
+    content addressed on-disk cache, so identical frames are stored
+    once and each frame is only rendered once per set of output
+    options. The server runs in a background thread and handles
+    concurrent requests.
+    """
+
+    hostname = param.String(default='localhost', doc="""
+        The hostname the server is bound to.""")
+
+    port = param.Integer(default=0, doc="""
+        The port the server is bound to, zero selecting any free port.""")
+
+    cache_path = param.String(default='./frame_cache', doc="""
+        The directory holding the on-disk frame cache.""")
+
+    max_widgets = param.Integer(default=20, bounds=(1, None), doc="""
+        The maximum number of widgets served, releasing the least
+        recently used widgets beyond it.""")
+
+    def __init__(self, **params):
+        super(FrameServer, self).__init__(**params)
+        from .widgets import WidgetRegistry
+        self.widgets = WidgetRegistry(self.max_widgets, released=self._released)
+        self._secret = os.urandom(32)
+        self._index = {}
+        self._lock = threading.Lock()
+        self._server = None
+
+
+    @property
+    def url(self):
+        "The URL the frames are served from"
+        if self._server is None:
+            return None
+        return 'http://%s:%d' % (self.hostname, self._server.server_port)
+
+
+    def start(self):
+        "Starts serving frames in a background thread"
+        if self._server is not None: return
+        if not os.path.isdir(self.cache_path):
+            os.makedirs(self.cache_path)
+        self._server = ThreadingHTTPServer((self.hostname, self.port),
+                                           FrameRequestHandler)
+        self._server.frame_server = self
+        thread = threading.Thread(target=self._server.serve_forever)
+        thread.daemon = True
+        thread.start()
+
+
+    def stop(self):
+        "Stops serving frames"
+        if self._server is None: return
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
+
+
+    def register(self, id, widget):
+        """
+        Registers a widget supplying frames through its get_frame
+        method, served at url/{token}/fig_{id}/{frame}.
+        """
+        self.widgets[id] = widget
+
+
+    def token(self, id):
+        "Returns the token authorizing access to the frames of a widget"
+        return hmac.new(self._secret, id.encode('utf-8'), sha256).hexdigest()
+
+
+    def authorized(self, id, token):
+        "Whether the token authorizes access to the frames of the widget"
+        return hmac.compare_digest(self.token(id), str(token))
+
+
+    def _released(self, id, widget):
+        "Discards the cache index entries of a released widget"
+        with self._lock:
+            for key in [k for k in self._index if k[0] == id]:
+                del self._index[key]
+
+
+    def frame(self, id, idx):
+        """
+        Returns the content hash, cache path, content type and content
+        encoding of the frame of the widget with the supplied id,
+        rendering it into the cache unless it is already held there.
+        """
+        widget = self.widgets.get(id)
+        if widget is None: return None
+        key = (id, widget.keys[idx], widget._frame_options())
+        with self._lock:
+            entry = self._index.get(key)
+        if entry is not None and os.path.isfile(entry[1]):
+            return entry
+
+        data, content_type, encoding = widget._frame_content(idx)
+        digest = sha256(data).hexdigest()
+        path = os.path.join(self.cache_path, digest)
+        if not os.path.isfile(path):
+            # Written under a unique name and renamed into place so
+            # concurrent requests never read a partial frame
+            tmp_path = '%s.%s.tmp' % (path, threading.current_thread().ident)
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.rename(tmp_path, path)
+        entry = (digest, path, content_type, encoding)
+        with self._lock:
+            self._index[key] = entry
+        return entry
@@ -1,7 +1,9 @@
-import os, sys, math, time, uuid, json
+import os, sys, math, time, uuid, json, threading, base64, zlib
+from io import BytesIO
 from unittest import SkipTest
 
 import numpy as np
+import matplotlib.pyplot as plt
 
 try:
     import IPython
@@ -23,9 +25,13 @@ ipython2 = hasattr(IPython, 'version_info') and (IPython.version_info[0] == 2)
 import param
 
 from ..core import OrderedDict, NdMapping
+from ..core.options import Store
+from ..core.instrumentation import Instrumentation
 from ..core.util import ProgressIndicator
-from ..plotting import Plot
+from ..plotting import Plot, HTML_TAGS
+from .delta import DeltaEncoder
 from .magics import OutputMagic
+from .server import FrameServer
 
 
 class ProgressBar(ProgressIndicator):
@@ -252,14 +258,175 @@ def get_plot_size():
             Plot.figure_inches[1] * factor)
 
 
+class FrameCache(object):
+    """
+    FrameCache is a thread-safe least recently used cache of rendered
+    frames, holding at most size frames.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self._frames = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._frames:
+                return default
+            frame = self._frames.pop(key)
+            self._frames[key] = frame
+            return frame
+
+    def __setitem__(self, key, frame):
+        with self._lock:
+            self._frames.pop(key, None)
+            self._frames[key] = frame
+            evicted = []
+            while len(self._frames) > self.size:
+                evicted.append(self._frames.popitem(last=False))
+        for item in evicted:
+            self._evicted(*item)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            return self._frames.pop(key, default)
+
+    def items(self):
+        with self._lock:
+            return list(self._frames.items())
+
+    def clear(self):
+        with self._lock:
+            self._frames.clear()
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._frames
+
+    def __len__(self):
+        with self._lock:
+            return len(self._frames)
+
+    def _evicted(self, key, frame):
+        "Called with each item evicted from the cache"
+
+
+
+class WidgetRegistry(FrameCache):
+    """
+    WidgetRegistry holds the widgets serving frames by id, keeping at
+    most size of the most recently registered or used widgets alive.
+    Widgets evicted or popped from the registry are released, freeing
+    their plot, figure and rendered frames, and are passed along with
+    their id to the released callback if supplied.
+    """
+
+    def __init__(self, size, released=None):
+        super(WidgetRegistry, self).__init__(size)
+        self.released = released
+
+    def __getitem__(self, id):
+        widget = self.get(id)
+        if widget is None:
+            raise KeyError("Widget %s has been released, display the "
+                           "object again to render its frames." % id)
+        return widget
+
+    def pop(self, id, default=None):
+        widget = super(WidgetRegistry, self).pop(id, None)
+        if widget is None:
+            return default
+        self._evicted(id, widget)
+        return widget
+
+    def _evicted(self, id, widget):
+        widget.release()
+        if self.released is not None:
+            self.released(id, widget)
+
+
+
+class FrameBlob(object):
+    """
+    FrameBlob packs the raw bytes of a number of frames into a single
+    binary blob, indexing the offset and length of each frame by its
+    index in the widget.
+    """
+
+    def __init__(self):
+        self._buffer = BytesIO()
+        self.index = OrderedDict()
+
+    def append(self, idx, data):
+        self.index[idx] = (self._buffer.tell(), len(data))
+        self._buffer.write(data)
+
+    @property
+    def data(self):
+        return self._buffer.getvalue()
+
+    def __getitem__(self, idx):
+        offset, length = self.index[idx]
+        return self.data[offset:offset+length]
+
+    def __len__(self):
+        return len(self.index)
+
+
+
 class NdWidget(param.Parameterized):
     """
     NdWidget is an abstract base class implementing a method to
     find the dimensions and keys of any ViewableElement, GridSpace or UniformNdMapping type.
     In the process it creates a mock_obj to hold the dimensions
     and keys.
+
+    Lazy widgets only render their initial frame up front, rendering
+    the remaining frames on demand when they are requested by the
+    Javascript widget through the kernel. Rendered frames are held in
+    a FrameCache and the frames following a request in the direction
+    of scrubbing are prefetched in a background thread.
     """
 
+    lazy = param.Boolean(default=False, doc="""
+        Whether to render frames on demand rather than rendering and
+        embedding every frame when the widget is created.""")
+
+    prefetch = param.Integer(default=0, bounds=(0, None), doc="""
+        The number of frames following a request in the direction of
+        scrubbing to prefetch in a background thread when rendering
+        lazily. Rendering in the background is serialized with the
+        rendering of all widgets but not with other uses of pyplot,
+        so prefetching is disabled by default.""")
+
+    cache_size = param.Integer(default=100, bounds=(1, None), doc="""
+        The maximum number of rendered frames cached when rendering
+        lazily.""")
+
+    frame_encoding = param.ObjectSelector(default='html',
+                                          objects=['html', 'binary', 'delta'], doc="""
+        The encoding of the rendered frames. Frames are either HTML
+        embedding the base64 encoded figure or the raw PNG bytes or
+        zlib compressed SVG of the figure, which are packed into a
+        single blob when embedded and displayed through object URLs.
+        The blob is embedded base64 encoded, so binary PNG frames are
+        about as large as HTML frames and only save parsing each frame
+        as HTML, while binary SVG frames are several times smaller.
+        Delta frames only hold the changes to the artists of the
+        figure since the previous frame, drawn onto a static
+        background by the Javascript widget (see DeltaEncoder). The
+        mpld3 backend always uses HTML frames.""")
+
+    keyframe_interval = param.Integer(default=25, bounds=(1, None), doc="""
+        The maximum number of delta frames between keyframes.""")
+
+    # Lazy widgets serving frames to the Javascript widgets, by id
+    widgets = WidgetRegistry(20)
+
+    # Serializes the rendering of frames by all widgets, whether in
+    # the main thread, prefetch threads or frame server threads
+    _render_lock = threading.RLock()
+
     def __init__(self, plot, **params):
         super(NdWidget, self).__init__(**params)
         self.plot = plot
@@ -268,18 +435,198 @@ class NdWidget(param.Parameterized):
         # Create mock NdMapping to hold the common dimensions and keys
         self.mock_obj = NdMapping([(k, None) for k in self.keys],
                                   key_dimensions=self.dimensions)
+        self._frame_cache = FrameCache(self.cache_size)
+        self._prefetch_lock = threading.Lock()
+        self._prefetch_queue = []
+        self._prefetch_thread = None
+        self._released = False
+        self._last_idx = 0
+        self._delta_encoder = DeltaEncoder(dpi=OutputMagic.options['dpi'],
+                                           keyframe_interval=self.keyframe_interval)
 
 
     def _plot_figure(self, idx):
+        with self._render_lock:
+            return self._render_figure(idx)
+
+
+    def _render_figure(self, idx):
         from .display_hooks import display_figure
         fig = self.plot[idx]
         if OutputMagic.options['backend'] == 'd3':
             import mpld3
             mpld3.plugins.connect(fig, mpld3.plugins.MousePosition(fontsize=14))
             return mpld3.fig_to_dict(fig)
+        elif self.frame_encoding == 'binary':
+            return self._figure_bytes(fig)
+        elif self.frame_encoding == 'delta':
+            frame = self._delta_encoder(fig, self.plot)
+            plt.close(fig)
+            return frame
         return display_figure(fig)
 
 
+    def _figure_bytes(self, fig):
+        "Renders the figure to PNG bytes or zlib compressed SVG"
+        fmt = OutputMagic.options['fig']
+        renderer = Store.renderer.instance(dpi=OutputMagic.options['dpi'])
+        data = renderer.figure_data(fig, fmt)
+        if fmt == 'svg':
+            data = zlib.compress(data.encode('utf-8'))
+        plt.close(fig)
+        return data
+
+
+    def _binary_frames(self):
+        "Whether the frames are rendered to raw bytes"
+        return (self.frame_encoding == 'binary' and
+                OutputMagic.options['backend'] != 'd3')
+
+
+    def _delta_frames(self):
+        "Whether the frames are delta encoded"
+        return (self.frame_encoding == 'delta' and
+                OutputMagic.options['backend'] != 'd3')
+
+
+    def _frame_blob(self, frames):
+        """
+        Packs binary frames into a FrameBlob, returning the data the
+        Javascript widgets decode it from. HTML cannot hold raw bytes,
+        so the blob is base64 encoded, which is the only encoding
+        layer added to the frames.
+        """
+        blob = FrameBlob()
+        for idx, frame in enumerate(frames):
+            blob.append(idx, frame)
+        fmt = OutputMagic.options['fig']
+        return json.dumps({'blob': base64.b64encode(blob.data).decode('utf-8'),
+                           'index': blob.index, 'mime_type': HTML_TAGS[fmt][0],
+                           'compressed': fmt == 'svg'})
+
+
+    def _frame_content(self, idx):
+        """
+        Returns the data, content type and content encoding of the
+        frame at the supplied index as served over HTTP.
+        """
+        frame = self.get_frame(idx)
+        if self._binary_frames():
+            fmt = OutputMagic.options['fig']
+            return frame, HTML_TAGS[fmt][0], 'deflate' if fmt == 'svg' else None
+        frame = self._encode_frame(frame)
+        if isinstance(frame, dict):
+            data, content_type = json.dumps(frame), 'application/json'
+        else:
+            data, content_type = frame, 'text/html'
+        if not isinstance(data, bytes):
+            data = data.encode('utf-8')
+        return data, content_type, None
+
+
+    def _frame_options(self):
+        "The output options the rendered frames depend on"
+        return tuple(OutputMagic.options[opt] for opt in
+                     ['backend', 'fig', 'dpi', 'size'])
+
+
+    def get_frame(self, idx):
+        """
+        Returns the rendered frame at the supplied index, rendering it
+        unless it is held in the frame cache.
+        """
+        key = (self.keys[idx], self._frame_options())
+        frame = self._frame_cache.get(key)
+        if frame is None:
+            with self._render_lock:
+                # The frame may have been prefetched in the meantime
+                frame = self._frame_cache.get(key)
+                if frame is None:
+                    frame = self._plot_figure(idx)
+                    self._frame_cache[key] = frame
+                    if Instrumentation.enabled():
+                        Instrumentation.count('Widget frames rendered')
+                    return frame
+        if Instrumentation.enabled():
+            Instrumentation.count('Widget frames cached')
+        return frame
+
+
+    def request_frame(self, idx):
+        """
+        Writes the frame at the supplied index to stdout as JSON, where
+        it is received by the Javascript widget, and prefetches the
+        frames following it in the direction of scrubbing.
+        """
+        frame = self.get_frame(idx)
+        self._prefetch_frames(idx)
+        sys.stdout.write(json.dumps(self._encode_frame(frame)))
+        sys.stdout.flush()
+
+
+    def _encode_frame(self, frame):
+        "Encodes the frame as sent to the Javascript widget"
+        if OutputMagic.options['backend'] == 'd3':
+            return frame
+        elif self._binary_frames():
+            return base64.b64encode(frame).decode('utf-8')
+        return str(frame)
+
+
+    def _prefetch_frames(self, idx):
+        if not self.prefetch: return
+        direction = -1 if idx < self._last_idx else 1
+        self._last_idx = idx
+        # Prefetching more frames than the cache holds would evict
+        # the requested frame
+        count = min(self.prefetch, self.cache_size-1)
+        options = self._frame_options()
+        indices = [idx + direction * i for i in range(1, count+1)]
+        indices = [i for i in indices if 0 <= i < len(self.keys)
+                   and (self.keys[i], options) not in self._frame_cache]
+        with self._prefetch_lock:
+            if self._released: return
+            # Supersedes the frames queued for any earlier request
+            self._prefetch_queue = indices
+            if indices and self._prefetch_thread is None:
+                self._prefetch_thread = threading.Thread(target=self._prefetch_loop)
+                self._prefetch_thread.daemon = True
+                self._prefetch_thread.start()
+
+
+    def _prefetch_loop(self):
+        """
+        Renders the queued frames, exiting once the queue is drained
+        or the widget is released. Prefetched frames evict the least
+        recently used frames from the cache.
+        """
+        while True:
+            with self._prefetch_lock:
+                if self._released or not self._prefetch_queue:
+                    self._prefetch_queue = []
+                    self._prefetch_thread = None
+                    return
+                idx = self._prefetch_queue.pop(0)
+            try:
+                self.get_frame(idx)
+            except Exception as e:
+                self.warning("Could not prefetch frame %d: %s" % (idx, e))
+
+
+    def release(self):
+        """
+        Releases the widget, stopping any prefetching and discarding
+        its rendered frames and the figure of its plot.
+        """
+        with self._prefetch_lock:
+            self._released = True
+            self._prefetch_queue = []
+        self._frame_cache.clear()
+        fig = self.plot.handles.get('fig')
+        if fig is not None:
+            plt.close(fig)
+
+
 
 class IPySelectionWidget(NdWidget):
     """
@@ -440,7 +787,16 @@ class ScrubberWidget(NdWidget):
     server_url = param.String(default='', doc="""If export_json is
          True the slider widget will expect to be served the plot data
          from this URL. Data should be served from:
-         server_url/fig_{id}/{frame}.""")
+         server_url/fig_{id}/{frame}. Served widgets load their frames
+         from the frame_server instead.""")
+
+    serve = param.Boolean(default=False, doc="""Whether to serve the
+         frames from the local frame_server, which renders them on
+         demand into its on-disk cache, rather than rendering and
+         embedding them up front.""")
+
+    # The FrameServer serving widgets, started on first use
+    frame_server = None
 
     ##############################
     # Javascript include options #
@@ -451,11 +807,29 @@ class ScrubberWidget(NdWidget):
 
     def __init__(self, plot, **params):
         super(ScrubberWidget, self).__init__(plot, **params)
-        self.frames = OrderedDict((idx, self._plot_figure(idx))
-                                  for idx in range(len(self.plot)))
+        if self.serve:
+            self.frames = OrderedDict()
+        elif self.lazy:
+            self.frames = OrderedDict([(0, self.get_frame(0))])
+        else:
+            self.frames = OrderedDict((idx, self._plot_figure(idx))
+                                      for idx in range(len(self.plot)))
 
 
     def get_frames(self, id):
+        if self._delta_frames():
+            if self.lazy or self.serve or self.export_json:
+                raise ValueError("Delta encoded frames depend on the preceding "
+                                 "frames and cannot be rendered lazily, served "
+                                 "or exported to json.")
+            return json.dumps(list(self.frames.values()))
+        elif self.serve:
+            return self._serve(id)
+        elif self._binary_frames():
+            if self.export_json:
+                raise ValueError("Binary frames cannot be exported to json, "
+                                 "serve them instead.")
+            return self._frame_blob(self.frames.values())
         use_mpld3 = OutputMagic.options['backend'] == 'd3'
         frames = {idx: frame if use_mpld3 or self.export_json else
                   str(frame) for idx, frame in enumerate(self.frames.values())}
@@ -465,6 +839,8 @@ class ScrubberWidget(NdWidget):
             encoder = dict(cls=mpld3._display.NumpyEncoder)
 
         if self.export_json:
+            if self.lazy:
+                raise ValueError("Lazily rendered widgets cannot be exported to json.")
             if not os.path.isdir(self.json_path):
                 os.mkdir(self.json_path)
             with open(self.json_path+'/fig_%s.json' % id, 'wb') as f:
@@ -475,6 +851,26 @@ class ScrubberWidget(NdWidget):
         return frames
 
 
+    def _serve(self, id):
+        """
+        Registers the widget with the frame_server, starting the server
+        if required, and returns the (empty) embedded frames.
+        """
+        if ScrubberWidget.frame_server is None:
+            ScrubberWidget.frame_server = FrameServer(cache_path=os.path.join(self.json_path, 'frames'))
+        ScrubberWidget.frame_server.start()
+        ScrubberWidget.frame_server.register(id, self)
+        return {}
+
+
+    def _server_url(self, id):
+        "The URL the frames are loaded from"
+        if self.serve:
+            server = ScrubberWidget.frame_server
+            return '%s/%s' % (server.url, server.token(id))
+        return self.server_url
+
+
     def render_html(self, data):
         # Set up jinja2 templating
         import jinja2
@@ -489,12 +885,17 @@ class ScrubberWidget(NdWidget):
     def __call__(self):
         id = uuid.uuid4().hex
         frames = self.get_frames(id)
+        if self.lazy:
+            NdWidget.widgets[id] = self
 
         data = {'id': id, 'Nframes': len(self.plot),
                 'interval': int(1000. / OutputMagic.options['fps']),
                 'frames': frames,
-                'load_json': str(self.export_json).lower(),
-                'server': self.server_url,
+                'load_json': str(self.export_json or self.serve).lower(),
+                'lazy': str(self.lazy).lower(),
+                'binary': str(self._binary_frames()).lower(),
+                'delta': str(self._delta_frames()).lower(),
+                'server': self._server_url(id),
                 'mpld3_url': self.mpld3_url,
                 'd3_url': self.d3_url[:-3],
                 'mpld3': str(OutputMagic.options['backend'] == 'd3').lower()}
@@ -528,8 +929,13 @@ class SelectionWidget(ScrubberWidget):
 
     def __init__(self, plot, **params):
         NdWidget.__init__(self, plot, **params)
-        self.frames = OrderedDict((k, self._plot_figure(idx))
-                                  for idx, k in enumerate(self.keys))
+        if self.serve:
+            self.frames = OrderedDict()
+        elif self.lazy:
+            self.frames = OrderedDict([(self.keys[0], self.get_frame(0))])
+        else:
+            self.frames = OrderedDict((k, self._plot_figure(idx))
+                                      for idx, k in enumerate(self.keys))
 
 
     def get_widgets(self):
@@ -569,14 +975,19 @@ class SelectionWidget(ScrubberWidget):
         widgets, dimensions, init_dim_vals = self.get_widgets()
         key_data = self.get_key_data()
         frames = self.get_frames(id)
+        if self.lazy:
+            NdWidget.widgets[id] = self
 
         data = {'id': id, 'Nframes': len(self.mock_obj),
                 'Nwidget': self.mock_obj.ndims,
                 'frames': frames, 'dimensions': dimensions,
                 'key_data': key_data, 'widgets': widgets,
                 'init_dim_vals': init_dim_vals,
-                'load_json': str(self.export_json).lower(),
-                'server': self.server_url,
+                'load_json': str(self.export_json or self.serve).lower(),
+                'lazy': str(self.lazy).lower(),
+                'binary': str(self._binary_frames()).lower(),
+                'delta': str(self._delta_frames()).lower(),
+                'server': self._server_url(id),
                 'mpld3_url': self.mpld3_url,
                 'jqueryui_url': self.jqueryui_url[:-3],
                 'd3_url': self.d3_url[:-3],
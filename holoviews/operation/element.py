@@ -4,6 +4,7 @@ import param
 
 from ..core import Dimension, ElementOperation, CompositeOverlay, \
                    NdOverlay, Overlay, BoundingBox
+from ..core.operation import ArrayMetadata
 from ..core.util import find_minmax
 from ..element.chart import Histogram, VectorField, Curve
 from ..element.raster import Image, RGB
@@ -59,11 +60,39 @@ class chain(ElementOperation):
        A list of ElementOperations (or ElementOperation instances)
        that are applied on the input from left to right..""")
 
+    fuse = param.Boolean(default=True, doc="""
+       Whether consecutive operations supplying an array-level kernel
+       are fused when processing an Image. Fused operations are
+       applied directly to the array output by the previous kernel,
+       reusing intermediate buffers where safe. The kernels are only
+       passed the ArrayMetadata of the Image each step would return
+       and the final array is wrapped in a single Image, so the
+       result matches unfused processing.""")
+
     def _process(self, view, key=None):
-        processed = view
+        processed, metadata = view, None
+        # Data of elements not computed by a kernel of this chain
+        shared = [view.data]
         for operation in self.p.operations:
-            processed = operation.process_element(processed, key, input_ranges=self.p.input_ranges)
-
+            fusable = (self.p.fuse and operation._process_array is not None and
+                       (metadata is not None or (isinstance(processed, Image)
+                                                 and not isinstance(processed, RGB))))
+            if fusable:
+                if metadata is None:
+                    metadata = ArrayMetadata.from_element(processed)
+                # Arrays computed by previous kernels may be reused
+                inplace = not any(np.may_share_memory(metadata.data, d) for d in shared)
+                data = operation.process_array(metadata.data, metadata, key, inplace=inplace,
+                                               input_ranges=self.p.input_ranges)
+                metadata = operation._array_metadata(data, metadata, key)
+            else:
+                if metadata is not None:
+                    processed, metadata = metadata.element(), None
+                processed = operation.process_element(processed, key,
+                                                      input_ranges=self.p.input_ranges)
+                shared.append(getattr(processed, 'data', None))
+        if metadata is not None:
+            return metadata.element(group=self.p.group)
         return processed.clone(group=self.p.group)
 
 
@@ -97,9 +126,16 @@ class transform(ElementOperation):
        Image to the data in the output Image. By default, acts as
        the identity function such that the output matches the input.""")
 
+    def _process_array(self, data, element, key=None, inplace=False):
+        return data if not self.p.operator else self.p.operator(data)
+
+
+    def _array_metadata(self, data, metadata, key=None):
+        return ArrayMetadata(Image, data, bounds=metadata.bounds, group=self.p.group)
+
+
     def _process(self, matrix, key=None):
-        processed = (matrix.data if not self.p.operator
-                     else self.p.operator(matrix.data))
+        processed = self._process_array(matrix.data, matrix, key)
         return Image(processed, matrix.bounds, group=self.p.group)
 
 
@@ -285,19 +321,28 @@ class threshold(ElementOperation):
     group = param.String(default='Threshold', doc="""
        The group assigned to the thresholded output.""")
 
+    def _process_array(self, data, element, key=None, inplace=False):
+        above = data > self.p.level
+        if inplace and data.dtype == np.float64:
+            data.fill(self.p.low)
+            data[above] = self.p.high
+            return data
+        return np.where(above, float(self.p.high), float(self.p.low))
+
+
     def _process(self, matrix, key=None):
 
         if not isinstance(matrix, Image):
             raise TypeError("The threshold operation requires a Image as input.")
 
-        arr = matrix.data
-        high = np.ones(arr.shape) * self.p.high
-        low = np.ones(arr.shape) * self.p.low
-        thresholded = np.where(arr > self.p.level, high, low)
-
+        thresholded = self._process_array(matrix.data, matrix, key)
         return matrix.clone(thresholded, group=self.p.group)
 
 
+    def _array_metadata(self, data, metadata, key=None):
+        return metadata.clone(data, group=self.p.group)
+
+
 
 class gradient(ElementOperation):
     """
@@ -312,7 +357,7 @@ class gradient(ElementOperation):
     group = param.String(default='Gradient', doc="""
     The group assigned to the output gradient matrix.""")
 
-    def _process(self, matrix, key=None):
+    def _process_array(self, data, matrix, key=None, inplace=False):
 
         if len(matrix.value_dimensions) != 1:
             raise ValueError("Input matrix to gradient operation must "
@@ -320,7 +365,6 @@ class gradient(ElementOperation):
 
         matrix_dim = matrix.value_dimensions[0]
 
-        data = matrix.data
         r, c = data.shape
         dx = np.diff(data, 1, axis=1)[0:r-1, 0:c-1]
         dy = np.diff(data, 1, axis=0)[0:r-1, 0:c-1]
@@ -336,7 +380,16 @@ class gradient(ElementOperation):
             dx = 0.5 * cyclic_range - np.abs(dx - 0.5 * cyclic_range)
             dy = 0.5 * cyclic_range - np.abs(dy - 0.5 * cyclic_range)
 
-        return Image(np.sqrt(dx * dx + dy * dy), matrix.bounds, group=self.p.group)
+        return np.sqrt(dx * dx + dy * dy)
+
+
+    def _array_metadata(self, data, metadata, key=None):
+        return ArrayMetadata(Image, data, bounds=metadata.bounds, group=self.p.group)
+
+
+    def _process(self, matrix, key=None):
+        gradient = self._process_array(matrix.data, matrix, key)
+        return Image(gradient, matrix.bounds, group=self.p.group)
 
 
 
@@ -440,6 +493,159 @@ class split_raster(ElementOperation):
 
 
 
+def _marching_squares_table():
+    """
+    Builds the lookup table of oriented cell edge pairs crossed by a
+    contour for each of the 16 marching squares cases, indexed by
+    case, the position of the cell center relative to the level
+    (above or below) and the segment, holding the start and end edge
+    (-1 if there is no segment). The corners of a cell are numbered
+    clockwise from the top left with edge k joining corner k and k+1.
+    Segments run from the edge on which the values fall below the
+    level to the edge on which they rise above it, so segments of
+    neighbouring cells join up head to tail. Only the ambiguous
+    saddle cases (5 and 10) depend on the cell center and have two
+    segments.
+    """
+    table = -np.ones((16, 2, 2, 2), dtype=int)
+    for case in range(16):
+        bits = [(case >> k) & 1 for k in range(4)]
+        falling = [k for k in range(4) if bits[k] and not bits[(k+1) % 4]]
+        rising = [k for k in range(4) if not bits[k] and bits[(k+1) % 4]]
+        if len(falling) == 1:
+            table[case, :, 0] = falling[0], rising[0]
+    table[5] = [[(0, 1), (2, 3)], [(0, 3), (2, 1)]]
+    table[10] = [[(3, 0), (1, 2)], [(1, 0), (3, 2)]]
+    return table
+
+_marching_squares_cases = _marching_squares_table()
+
+
+def _rank_paths(successor):
+    """
+    Given the index of the successor of each segment (-1 for the
+    tail of a path) computes the tail reached from each segment and
+    the number of steps needed to reach it using pointer jumping.
+    Segments on closed paths never reach a tail.
+    """
+    pointer = np.where(successor < 0, np.arange(len(successor)), successor)
+    dist = (successor >= 0).astype(int)
+    while True:
+        jumped = pointer[pointer]
+        if (jumped == pointer).all():
+            return pointer, dist
+        dist += dist[pointer]
+        pointer = jumped
+
+
+def _break_cycles(successor):
+    """
+    Returns a mask of the segments on closed paths that point back to
+    the lowest segment index on their path, found by following all
+    closed paths in lockstep.
+    """
+    indices = np.arange(len(successor))
+    pointer = np.where(successor < 0, indices, successor)
+    lowest = np.minimum(indices, pointer)
+    for _ in range(int(np.ceil(np.log2(max(len(successor), 2))))):
+        lowest = np.minimum(lowest, lowest[pointer])
+        pointer = pointer[pointer]
+    return (successor[pointer] >= 0) & (successor == lowest)
+
+
+def marching_squares(data, levels):
+    """
+    Traces the iso-lines of a 2D array at the given levels using a
+    vectorized marching squares algorithm, processing all levels in
+    a single pass. Returns a list with an entry per level, each
+    holding a list of Nx2 arrays of (row, column) positions in
+    continuous matrix index coordinates. Closed contours repeat
+    their first point at the end.
+
+    Only numpy is used, making it safe to call from worker threads
+    and processes.
+    """
+    data = np.asarray(data, dtype=float)
+    levels = np.asarray(levels, dtype=float)
+    rows, cols = data.shape
+    nlevels = len(levels)
+    lines = [[] for _ in range(nlevels)]
+    if rows < 2 or cols < 2 or not nlevels:
+        return lines
+
+    # Classify all cells at all levels and find those crossed
+    above = (data[np.newaxis] > levels[:, np.newaxis, np.newaxis]).view(np.uint8)
+    cases = (above[:, :-1, :-1] | above[:, :-1, 1:] << 1 |
+             above[:, 1:, 1:] << 2 | above[:, 1:, :-1] << 3)
+    crossed = np.flatnonzero((cases != 0) & (cases != 15))
+    if not len(crossed):
+        return lines
+    cases = cases.flat[crossed]
+    level, cell = divmod(crossed, (rows-1)*(cols-1))
+    r, c = divmod(cell, cols-1)
+
+    # Edge ids enumerate horizontal edges followed by vertical edges
+    # with a separate block of ids per level.
+    nhoriz = rows*(cols-1)
+    nedges = nhoriz + (rows-1)*cols
+    offset = level*nedges
+    cell_edges = np.array([r*(cols-1) + c, nhoriz + r*cols + c + 1,
+                           (r+1)*(cols-1) + c, nhoriz + r*cols + c]) + offset
+
+    saddle = (cases == 5) | (cases == 10)
+    below = np.zeros(len(cases), dtype=int)
+    sr, sc = r[saddle], c[saddle]
+    below[saddle] = (data[sr, sc] + data[sr, sc+1] + data[sr+1, sc+1] +
+                     data[sr+1, sc])/4. <= levels[level[saddle]]
+    pairs = _marching_squares_cases[cases, below]
+    cidx = np.arange(len(cases))
+    sidx = np.flatnonzero(saddle)
+    starts = np.concatenate([cell_edges[pairs[:, 0, 0], cidx],
+                             cell_edges[pairs[sidx, 1, 0], sidx]])
+    ends = np.concatenate([cell_edges[pairs[:, 0, 1], cidx],
+                           cell_edges[pairs[sidx, 1, 1], sidx]])
+
+    # Link each segment to the segment starting where it ends
+    nsegs = len(starts)
+    order = np.argsort(starts)
+    pos = np.searchsorted(starts, ends, sorter=order)
+    pos[pos == nsegs] = 0
+    successor = np.where(starts[order[pos]] == ends, order[pos], -1)
+
+    # Break closed paths and order segments along each path
+    closed_tails = _break_cycles(successor)
+    successor[closed_tails] = -1
+    tails, dist = _rank_paths(successor)
+    ordered = np.argsort(tails*nsegs + (nsegs-1-dist))
+    tails = tails[ordered]
+    breaks = np.flatnonzero(tails[1:] != tails[:-1]) + 1
+    heads = ordered[np.concatenate([[0], breaks])]
+    path_tails = tails[np.concatenate([[0], breaks])]
+
+    # Each path ends on the end edge of its tail segment, which is
+    # the start edge of its head for closed paths.
+    path_edges = np.concatenate([starts[ordered],
+                                 np.where(closed_tails[path_tails],
+                                          starts[heads], ends[path_tails])])
+    edge = path_edges % nedges
+    edge_level = path_edges // nedges
+    horizontal = edge < nhoriz
+    r0 = np.where(horizontal, edge // (cols-1), (edge-nhoriz) // cols)
+    c0 = np.where(horizontal, edge % (cols-1), (edge-nhoriz) % cols)
+    r1, c1 = r0 + ~horizontal, c0 + horizontal
+    v0, v1 = data[r0, c0], data[r1, c1]
+    frac = (levels[edge_level] - v0) / (v1 - v0)
+    points = np.column_stack([r0 + frac*(r1-r0), c0 + frac*(c1-c0)])
+
+    closing = points[nsegs:]
+    points = np.insert(points[:nsegs], np.append(breaks, nsegs), closing, axis=0)
+    paths = np.split(points, breaks + np.arange(1, len(breaks)+1))
+    for path_level, path in zip((starts[path_tails] // nedges).tolist(), paths):
+        lines[path_level].append(path)
+    return lines
+
+
+
 class contours(ElementOperation):
     """
     Given a Image with a single channel, annotate it with contour
@@ -459,25 +665,160 @@ class contours(ElementOperation):
 
 
     def _process(self, matrix, key=None):
-        from matplotlib import pyplot as plt
-
-        figure_handle = plt.figure()
         (l, b, r, t) = matrix.extents
-        contour_set = plt.contour(matrix.data, extent=(l, r, t, b),
-                                  levels=self.p.levels)
+        rows, cols = matrix.data.shape[:2]
+        xstep, ystep = (r-l)/float(cols), (t-b)/float(rows)
+        traced = marching_squares(matrix.data, self.p.levels)
 
         contours = NdOverlay(None, key_dimensions=['Levels'])
-        for level, cset in zip(self.p.levels, contour_set.collections):
-            paths = cset.get_paths()
-            lines = [path.vertices for path in paths]
-            contours[level] = Contours(lines, group=self.p.group,
+        for level, paths in zip(self.p.levels, traced):
+            # Convert matrix coordinates to the sheet coordinates of
+            # the cell centers
+            lines = [np.column_stack([l + (path[:, 1]+0.5)*xstep,
+                                      t - (path[:, 0]+0.5)*ystep])
+                     for path in paths]
+            contours[level] = Contours(lines, level=level, group=self.p.group,
                                        label=matrix.label)
-
-        plt.close(figure_handle)
         return matrix * contours
 
 
 
+class PartialHistogram(object):
+    """
+    PartialHistogram accumulates (optionally weighted) counts over a
+    fixed set of uniform bin edges. Values may be supplied in any
+    number of chunks via the update method, e.g. frame by frame or
+    block by block from an out-of-core array, and partial histograms
+    sharing the same edges may be merged with the + operator. The
+    binning matches np.histogram, i.e. the last bin is closed and
+    NaNs and out of range values are ignored.
+    """
+
+    def __init__(self, edges, counts=None):
+        self.edges = np.asarray(edges, dtype=np.float64)
+        num_bins = len(self.edges) - 1
+        self.counts = (np.zeros(num_bins) if counts is None
+                       else np.asarray(counts, dtype=np.float64))
+        if len(self.counts) != num_bins:
+            raise ValueError("PartialHistogram requires one count per bin.")
+
+
+    @classmethod
+    def from_range(cls, bin_range, num_bins):
+        """
+        Returns an empty PartialHistogram with num_bins uniform bins
+        spanning the supplied bin_range. As in np.histogram an empty
+        range is widened by 0.5 on either side.
+        """
+        lower, upper = bin_range
+        if lower == upper:
+            lower, upper = lower - 0.5, upper + 0.5
+        return cls(np.linspace(lower, upper, num_bins+1))
+
+
+    @classmethod
+    def from_chunks(cls, chunks, num_bins=20, bin_range=None, weights=None):
+        """
+        Accumulates a PartialHistogram over an iterable of array
+        chunks and an optional iterable of matching weight chunks. If
+        no bin_range is supplied it is computed in a first streaming
+        pass, in which case the chunks must support being iterated
+        over twice (e.g. a list or a HoloMap).
+        """
+        if bin_range is None:
+            bin_range = cls.data_range(chunks)
+            if bin_range is None:
+                bin_range = (0.0, 0.1)
+        hist = cls.from_range(bin_range, num_bins)
+        if weights is None:
+            for chunk in chunks:
+                hist.update(chunk)
+        else:
+            for chunk, chunk_weights in zip(chunks, weights):
+                hist.update(chunk, chunk_weights)
+        return hist
+
+
+    @staticmethod
+    def data_range(chunks):
+        """
+        Computes the (min, max) range over an iterable of array chunks
+        in a single pass, ignoring NaNs. Returns None if no finite
+        values were found.
+        """
+        lower, upper = np.inf, -np.inf
+        for chunk in chunks:
+            chunk = np.asarray(chunk, dtype=np.float64)
+            chunk = chunk[np.isfinite(chunk)]
+            if len(chunk):
+                lower = min(lower, chunk.min())
+                upper = max(upper, chunk.max())
+        return None if lower > upper else (lower, upper)
+
+
+    @property
+    def num_bins(self):
+        return len(self.counts)
+
+
+    def bin_indices(self, values):
+        """
+        Returns the bin index of each of the supplied values with -1
+        marking values that do not fall into any bin.
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        lower, upper = self.edges[0], self.edges[-1]
+        indices = np.full(len(values), -1, dtype=np.intp)
+        keep = (values >= lower) & (values <= upper)
+        kept = values[keep]
+        bins = self.num_bins
+        idx = ((kept - lower) * (bins / (upper - lower))).astype(np.intp)
+        idx[idx == bins] -= 1
+        # Correct for floating point rounding against the actual edges
+        idx[kept < self.edges[idx]] -= 1
+        idx[(kept >= self.edges[idx+1]) & (idx != bins-1)] += 1
+        indices[keep] = idx
+        return indices
+
+
+    def update(self, values, weights=None):
+        """
+        Accumulates the supplied values (and optional weights of the
+        same shape) into the histogram, returning self.
+        """
+        indices = self.bin_indices(values)
+        valid = indices >= 0
+        if weights is not None:
+            weights = np.asarray(weights, dtype=np.float64).ravel()[valid]
+        self.counts += np.bincount(indices[valid], weights,
+                                   minlength=self.num_bins)
+        return self
+
+
+    def __add__(self, other):
+        if not np.array_equal(self.edges, other.edges):
+            raise ValueError("Only PartialHistograms with the same bin "
+                             "edges may be merged.")
+        return PartialHistogram(self.edges, self.counts + other.counts)
+
+
+    def histogram(self, normed=False, cumulative=False):
+        """
+        Returns the (frequencies, edges) of the accumulated histogram.
+        If normed, the frequencies are normalized to a probability
+        density or, if cumulative, to a cumulative distribution.
+        """
+        counts = np.cumsum(self.counts) if cumulative else self.counts.copy()
+        if normed:
+            total = self.counts.sum()
+            norm = total if cumulative else total * np.diff(self.edges)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                counts = counts / norm
+            counts[~np.isfinite(counts)] = 0
+        return counts, self.edges.copy()
+
+
+
 class histogram(ElementOperation):
     """
     Returns a Histogram of the Raster data, binned into
@@ -496,6 +837,9 @@ class histogram(ElementOperation):
     dimension = param.String(default=None, doc="""
       Along which dimension of the ViewableElement to compute the histogram.""")
 
+    cumulative = param.Boolean(default=False, doc="""
+      Whether to return the cumulative histogram frequencies.""")
+
     normed = param.Boolean(default=True, doc="""
       Whether the histogram frequencies are normalized.""")
 
@@ -508,26 +852,34 @@ class histogram(ElementOperation):
     style_prefix = param.String(default=None, allow_None=None, doc="""
       Used for setting a common style for histograms in a HoloMap or AdjointLayout.""")
 
+    weight_dimension = param.String(default=None, doc="""
+      Optional dimension whose values are used to weight the counts.""")
+
     def _process(self, view, key=None):
         if self.p.dimension:
             selected_dim = self.p.dimension
         else:
             selected_dim = [d.name for d in view.value_dimensions + view.key_dimensions][0]
-        data = np.array(view.dimension_values(selected_dim))
-        range = find_minmax((np.min(data), np.max(data)), (0, -float('inf')))\
-            if self.p.bin_range is None else self.p.bin_range
+        data = view.dimension_values(selected_dim)
+        weights = (view.dimension_values(self.p.weight_dimension)
+                   if self.p.weight_dimension else None)
+        if self.p.bin_range is None:
+            data_range = PartialHistogram.data_range([data])
+            range = (0, 0) if data_range is None else \
+                find_minmax(data_range, (0, -float('inf')))
+        else:
+            range = tuple(self.p.bin_range)
 
         # Avoids range issues including zero bin range and empty bins
         if range == (0, 0):
             range = (0.0, 0.1)
         try:
-            data = data[np.invert(np.isnan(data))]
-            hist, edges = np.histogram(data, normed=self.p.normed,
-                                       range=range, bins=self.p.num_bins)
+            partial = PartialHistogram.from_range(range, self.p.num_bins)
+            hist, edges = partial.update(data, weights).histogram(self.p.normed,
+                                                                  self.p.cumulative)
         except:
             edges = np.linspace(range[0], range[1], self.p.num_bins + 1)
             hist = np.zeros(self.p.num_bins)
-        hist[np.isnan(hist)] = 0
 
         hist_view = Histogram(hist, edges, key_dimensions=[view.get_dimension(selected_dim)],
                               label=view.label)
@@ -573,14 +925,16 @@ class vectorfield(ElementOperation):
         l, b, r, t = radians.bounds.lbrt()
         X, Y = np.meshgrid(np.linspace(l, r, self.p.cols+2)[1:-1],
                            np.linspace(b, t, self.p.rows+2)[1:-1])
+        xs, ys = X.flatten(), Y.flatten()
 
-        vector_data = []
-        for x, y in zip(X.flat, Y.flat):
-            components = (x,y, radians[x,y])
-            if lengths is not None:
-                components += (lengths[x,y],)
-
-            vector_data.append(components)
+        # Sample all grid positions at once, using unit magnitudes
+        # if no lengths are supplied.
+        columns = [xs, ys, radians.data[radians.sheet2matrixidx(xs, ys)]]
+        if lengths is not None:
+            columns.append(lengths.data[lengths.sheet2matrixidx(xs, ys)])
+        else:
+            columns.append(np.ones(len(xs)))
+        vector_data = np.column_stack(columns)
 
         value_dimensions = [Dimension('Magnitude'),
                             Dimension('Angle', cyclic=True, range=cyclic_dim.range)]
@@ -661,7 +1015,9 @@ class collapse_curve(ElementOperation):
 
     fn = param.Callable(default=np.mean, doc="""
         The function that is used to collapse the curve y-values for
-        each x-value.""")
+        each x-value. Functions supporting numpy style axis selection
+        (e.g. np.mean, np.median, np.std) are applied to all x-values
+        at once.""")
 
     group = param.String(default='Collapses', doc="""
        The group assigned to the collapsed curve output.""")
@@ -674,12 +1030,15 @@ class collapse_curve(ElementOperation):
             if not all(curve.data[:,0] == overlay[0].data[:,0]):
                 raise ValueError("All input curves must have same x-axis values.")
 
-        data = []
-        for i, xval in enumerate(overlay[0].data[:,0]):
-            yval = self.p.fn([c.data[i,1]  for c in overlay])
-            data.append((xval, yval))
+        xvals = overlay[0].data[:,0]
+        stack = np.vstack([c.data[:,1] for c in overlay])
+        try:
+            yvals = self.p.fn(stack, axis=0)
+        except TypeError:
+            yvals = [self.p.fn(list(col)) for col in stack.T]
+        data = np.column_stack([xvals, yvals])
 
-        return Curve(np.array(data), group=self.p.group,
+        return Curve(data, group=self.p.group,
                      label=self.get_overlay_label(overlay))
 
 
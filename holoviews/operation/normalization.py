@@ -90,6 +90,13 @@ class Normalization(ElementOperation):
         return self._process(element, key)
 
 
+    def process_array(self, data, element, key=None, inplace=False,
+                      ranges={}, keys=None, **params):
+        params = dict(params,ranges=ranges, keys=keys)
+        self.p = param.ParamOverrides(self, params)
+        return self._process_array(data, element, key, inplace)
+
+
     def get_ranges(self, element, key):
         """
         Method to get the appropriate normalization range dictionary
@@ -152,23 +159,25 @@ class raster_normalization(Normalization):
 
     def _normalize_raster(self, raster, key):
         if not isinstance(raster, Raster): return raster
-        norm_raster = raster.clone(raster.data.copy())
+        return raster.clone(self._process_array(raster.data, raster, key))
+
+
+    def _process_array(self, data, raster, key=None, inplace=False):
+        norm_data = data if inplace else data.copy()
         ranges = self.get_ranges(raster, key)
 
         for depth, name in enumerate(d.name for d in raster.value_dimensions):
             depth_range = ranges.get(name, (None, None))
             if None in depth_range:  continue
-            if depth_range and len(norm_raster.data.shape) == 2:
+            if depth_range and len(norm_data.shape) == 2:
                 depth_range = ranges[name]
-                norm_raster.data[:,:] -= depth_range[0]
+                norm_data[:,:] -= depth_range[0]
                 range = (depth_range[1] - depth_range[0])
                 if range:
-                    norm_raster.data[:,:] /= range
+                    norm_data[:,:] /= range
             elif depth_range:
-                norm_raster.data[:,:,depth] -= depth_range[0]
+                norm_data[:,:,depth] -= depth_range[0]
                 range = (depth_range[1] - depth_range[0])
                 if range:
-                    norm_raster.data[:,:,depth] /= range
-        return norm_raster
-
-
+                    norm_data[:,:,depth] /= range
+        return norm_data
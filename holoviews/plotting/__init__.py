@@ -1,6 +1,11 @@
 import os
+import base64
+import pickle
+import subprocess
+import threading
 from io import BytesIO
-from tempfile import NamedTemporaryFile
+from multiprocessing import Pool
+from tempfile import NamedTemporaryFile, TemporaryFile
 
 # Python3 compatibility
 try: basestring = basestring
@@ -8,18 +13,21 @@ except: basestring = str
 
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib import rc_params_from_file
+from matplotlib import animation, rc_context, rc_params_from_file, rcParams
+from matplotlib.backends.backend_agg import RendererAgg
 from matplotlib.ticker import FormatStrFormatter
 
 import param
 from param.parameterized import bothmethod
 
 from ..core.options import Cycle, Palette, Options, Store, StoreOptions
-from ..core import Dimension, Layout, NdLayout, GridSpace, HoloMap
+from ..core import Dimension, Layout, NdLayout, GridSpace, HoloMap, Element, OrderedDict
 from ..core.io import Exporter
+from ..core.instrumentation import Instrumentation
 from .annotation import * # pyflakes:ignore (API import)
 from .chart import * # pyflakes:ignore (API import)
 from .chart3d import * # pyflakes:ignore (API import)
+from .element import ElementPlot, OverlayPlot
 from .plot import * # pyflakes:ignore (API import)
 from .raster import * # pyflakes:ignore (API import)
 from .tabular import * # pyflakes:ignore (API import)
@@ -54,6 +62,14 @@ ANIMATION_OPTS = {
     'scrubber': ('html', None, {'fps': 5}, None)
 }
 
+# <format name> : (output file, extra_args) used to stream the encoded
+# animation through the stdout of the encoder
+STREAM_OPTS = {
+    'webm': ('pipe:1', ['-f', 'webm']),
+    'mp4': ('pipe:1', ['-f', 'mp4', '-movflags', 'frag_keyframe+empty_moov']),
+    'gif': ('gif:-', [])
+}
+
 
 def opts(el, size):
     "Returns the plot options with supplied size (if not overridden)"
@@ -96,6 +112,191 @@ def get_plot_size(obj, percent_size):
 
 
 
+class Base64Sink(object):
+    """
+    Callable sink base64 encoding the chunks of data written to it as
+    they arrive, e.g. when passed as the target of anim_stream, so
+    that the raw data is never held as a whole. Chunks are encoded in
+    multiples of three bytes, carrying any remainder over to the next
+    chunk, so the concatenated output matches encoding all the data
+    at once.
+    """
+
+    def __init__(self):
+        self._remainder = b''
+        self._encoded = []
+
+
+    def __call__(self, chunk):
+        data = self._remainder + chunk
+        aligned = len(data) - len(data) % 3
+        if aligned:
+            self._encoded.append(base64.b64encode(data[:aligned]))
+        self._remainder = data[aligned:]
+
+
+    def getvalue(self):
+        "Returns the base64 encoded data written so far as text"
+        return (b''.join(self._encoded) +
+                base64.b64encode(self._remainder)).decode('utf-8')
+
+
+
+class StreamingWriter(animation.MovieWriter):
+    """
+    StreamingWriter runs the encoder of a pipe based matplotlib
+    MovieWriter, passing the encoded output from its stdout to a sink
+    callable in chunks as it becomes available. Without a sink the
+    encoder writes the output file directly. Either way the frames are
+    piped to the encoder as they are grabbed, so only the frame being
+    encoded is ever held in memory.
+
+    Frames are supplied through the public setup, grab_frame and
+    finish methods of MovieWriter or as already rendered frames
+    through write_frame. The only MovieWriter internal relied on is
+    the _args method assembling the command line of the wrapped
+    writer, which the pipe based writers of all the matplotlib
+    versions supported by HoloViews (1.3 and above) implement.
+    """
+
+    chunk_size = 2**16
+
+    def __init__(self, writer, sink=None):
+        super(StreamingWriter, self).__init__(writer.fps, writer.codec, writer.bitrate,
+                                              list(writer.extra_args), writer.metadata)
+        self.frame_format = writer.frame_format
+        self.writer = writer
+        self.sink = sink
+
+
+    def _args(self):
+        self.writer.fig, self.writer.dpi = self.fig, self.dpi
+        self.writer.outfile = self.outfile
+        args = self.writer._args()
+        if not isinstance(args, list):
+            raise NotImplementedError("%s does not supply the command line of "
+                                      "a pipe based encoder."
+                                      % type(self.writer).__name__)
+        return args
+
+
+    def _run(self):
+        self._log = TemporaryFile()
+        self._sink_error = None
+        output = self._log if self.sink is None else subprocess.PIPE
+        self._command = self._args()
+        self._proc = subprocess.Popen(self._command, stdin=subprocess.PIPE,
+                                      stdout=output, stderr=self._log)
+        self._reader = None
+        if self.sink is not None:
+            self._reader = threading.Thread(target=self._read_output)
+            self._reader.daemon = True
+            self._reader.start()
+
+
+    def write_frame(self, frame):
+        "Pipes a frame already rendered in the frame format to the encoder"
+        self._proc.stdin.write(frame)
+
+
+    def _read_output(self):
+        for chunk in iter(lambda: self._proc.stdout.read(self.chunk_size), b''):
+            # Keep draining the output after an error so the encoder
+            # cannot block on a full pipe
+            if self._sink_error is not None: continue
+            try:
+                self.sink(chunk)
+            except Exception as e:
+                self._sink_error = e
+
+
+    def cleanup(self):
+        self._proc.stdin.close()
+        if self._reader is not None:
+            self._reader.join()
+        returncode = self._proc.wait()
+        self._log.seek(0)
+        log = self._log.read().decode('utf-8', 'replace')
+        self._log.close()
+        if returncode:
+            raise IOError("Encoding with %s failed:\n%s"
+                          % (self._command[0], log))
+        elif self._sink_error is not None:
+            raise self._sink_error
+
+
+
+# State of the plot built by each parallel rendering worker process
+_render_state = {}
+
+def _init_render_worker(obj_data, options_data, renderer_params):
+    """
+    Initializes a parallel rendering worker by building the plot of
+    the pickled object using the pickled options tree.
+    """
+    # Fonts inherited from the parent process share open file handles
+    # and would be read concurrently by all the workers. The font
+    # cache of the Agg renderer is only exposed by some versions of
+    # matplotlib, others open fonts per process.
+    fontd = getattr(RendererAgg, '_fontd', None)
+    if isinstance(fontd, dict):
+        fontd.clear()
+    Store.options = pickle.loads(options_data)
+    obj = Store.loads(None, obj_data)
+    renderer = MPLPlotRenderer.instance(**renderer_params)
+    plot = renderer.get_plot(obj)
+    _render_state.update(plot=plot, figure=plot(), blit=renderer.blit)
+
+
+def _render_frames(args):
+    """
+    Renders the frames between the start and stop indices to raw
+    image buffers in the supplied format and dpi.
+    """
+    start, stop, frame_format, dpi = args
+    plot, figure = _render_state['plot'], _render_state['figure']
+    # Leave the plot in the state serial rendering would have left
+    # it in before drawing the start frame
+    plot.update_frame(plot.keys[max(start-1, 0)])
+    with rc_context():
+        rcParams['savefig.bbox'] = None
+        return list(_raw_frames(plot, figure, plot.keys[start:stop], frame_format,
+                                dpi, _render_state['blit']))
+
+
+def _raw_frames(plot, figure, keys, frame_format, dpi, blit=False):
+    """
+    Generates the frames of the plot for the supplied keys as raw
+    image buffers in the supplied format and dpi, matching the frames
+    drawn by Figure.savefig. If blit is enabled, frames of blittable
+    plots in raw RGBA format are drawn by blitting the dynamic artists
+    over a cached background rather than drawing the whole figure.
+    """
+    blit = (blit and frame_format in ['rgba', 'raw'] and plot.blittable() and
+            hasattr(figure.canvas, 'copy_from_bbox'))
+    if not blit:
+        for key in keys:
+            plot.update_frame(key)
+            frame = BytesIO()
+            figure.savefig(frame, format=frame_format, dpi=dpi)
+            yield frame.getvalue()
+        return
+
+    state = figure.dpi, figure.get_facecolor(), figure.get_edgecolor()
+    figure.set_dpi(dpi)
+    figure.set_facecolor(rcParams['savefig.facecolor'])
+    figure.set_edgecolor(rcParams['savefig.edgecolor'])
+    try:
+        for key in keys:
+            plot.blit(key)
+            yield bytes(figure.canvas.buffer_rgba())
+    finally:
+        figure.set_dpi(state[0])
+        figure.set_facecolor(state[1])
+        figure.set_edgecolor(state[2])
+
+
+
 class MPLPlotRenderer(Exporter):
     """
     Exporter used to render data from matplotlib, either to a stream
@@ -129,35 +330,44 @@ class MPLPlotRenderer(Exporter):
     dpi=param.Integer(None, allow_None=True, doc="""
         The render resolution in dpi (dots per inch)""")
 
+    processes=param.Integer(1, bounds=(1, None), doc="""
+        The number of worker processes used to render the frames of
+        animated formats. If greater than one, the frames are split
+        into contiguous chunks rendered by workers that each build
+        the plot from the pickled object and options tree, and the
+        raw frames are piped to a single encoder in order.""")
+
+    blit=param.Boolean(default=False, doc="""
+        Whether the frames of animations streamed to the encoder are
+        drawn by blitting, only redrawing the artists which change
+        between frames over a cached background. Applies to plots
+        whose normalization is not framewise. Disabled by default
+        since the dynamic artists, including the title, are drawn
+        above the cached background, so the frames differ from the
+        rendered figure wherever they overlap static artists such
+        as the axis spines.""")
+
+    pool_size=param.Integer(0, bounds=(0, None), doc="""
+        The number of plots of static elements kept alive for reuse
+        across calls. An element matching the plot class, type,
+        dimensions and options of a pooled plot is rendered by
+        updating the figure of that plot in place, avoiding the
+        construction of a new figure and axes. Layouts, grids and
+        overlays are never pooled. Zero disables pooling.""")
+
 
     def __call__(self, obj, fmt=None):
         """
         Render the supplied HoloViews component using matplotlib.
         """
-        if isinstance(obj, AdjointLayout):
-            obj = Layout.from_values(obj)
-
-        element_type = obj.type if isinstance(obj, HoloMap) else type(obj)
-        try:
-            plotclass = Store.registry[element_type]
-        except KeyError:
-            raise Exception("No corresponding plot type found for %r" % type(obj))
-
-        plot = plotclass(obj, **opts(obj,  get_plot_size(obj, self.size)))
-
-        if fmt is None:
-            fmt = self.holomap if len(plot) > 1 else self.fig
-            if fmt is None: return
+        obj, plot, fmt = self._plot_format(obj, fmt)
+        if fmt is None: return
 
         if len(plot) > 1:
-            (writer, _, anim_kwargs, extra_args) = ANIMATION_OPTS[fmt]
-            anim = plot.anim(fps=self.fps)
-            if extra_args != []:
-                anim_kwargs = dict(anim_kwargs, extra_args=extra_args)
-
-            data = self.anim_data(anim, fmt, writer, **anim_kwargs)
+            data = self._anim_data(obj, plot, fmt)
         else:
-            data = self.figure_data(plot(), fmt, **({'dpi':self.dpi} if self.dpi else {}))
+            data = self.figure_data(self._figure(plot), fmt,
+                                    **({'dpi':self.dpi} if self.dpi else {}))
 
         return data, {'file-ext':fmt,
                       'size':len(data),
@@ -168,20 +378,68 @@ class MPLPlotRenderer(Exporter):
     def save(self_or_cls, obj, basename, fmt=None, options=None, **kwargs):
         """
         Save a HoloViews object to file, either using an explicitly
-        supplied format or to the appropriate default.
+        supplied format or to the appropriate default. Animations are
+        streamed to the file as the frames are encoded.
         """
+        renderer = self_or_cls.instance() if isinstance(self_or_cls, type) else self_or_cls
         with StoreOptions.options(obj, options, **kwargs):
-            rendered = self_or_cls(obj, fmt)
-        if rendered is None: return
-        (data, info) = rendered
-        filename ='%s.%s' % (basename, info['file-ext'])
+            obj, plot, fmt = renderer._plot_format(obj, fmt)
+            if fmt is None: return
+            filename ='%s.%s' % (basename, fmt)
+            if len(plot) > 1:
+                renderer._anim_data(obj, plot, fmt, filename)
+                return
+            data = renderer.figure_data(renderer._figure(plot), fmt,
+                                        **({'dpi':renderer.dpi} if renderer.dpi else {}))
         with open(filename, 'wb') as f:
-            f.write(self_or_cls.encode(rendered))
+            f.write(renderer.encode((data, {'mime_type':HTML_TAGS[fmt][0]})))
+
+
+    def _plot_format(self, obj, fmt):
+        """
+        Returns the object to render, its plot and the format to render
+        it in, which is None if no rendering should occur.
+        """
+        if isinstance(obj, AdjointLayout):
+            obj = Layout.from_values(obj)
+
+        plot = self._pooled_plot(obj) if self.pool_size else self.get_plot(obj)
+
+        if fmt is None:
+            fmt = self.holomap if len(plot) > 1 else self.fig
+        return obj, plot, fmt
+
+
+    def _anim_data(self, obj, plot, fmt, target=None):
+        """
+        Render the frames of the plot of the supplied object, returning
+        the encoded animation data or streaming it to the target if
+        supplied.
+        """
+        (writer, _, anim_kwargs, extra_args) = ANIMATION_OPTS[fmt]
+        if extra_args != []:
+            anim_kwargs = dict(anim_kwargs, extra_args=extra_args)
+
+        video = BytesIO() if target is None else None
+        target = video if target is None else target
+        if self.processes > 1 and self._streamable(fmt, writer, target):
+            self.parallel_anim_stream(obj, plot, fmt, writer, target, **anim_kwargs)
+        elif self.blit and plot.blittable() and self._streamable(fmt, writer, target):
+            self.blit_anim_stream(plot, fmt, writer, target, **anim_kwargs)
+        else:
+            anim = plot.anim(fps=self.fps)
+            self.anim_stream(anim, fmt, writer, target, **anim_kwargs)
+        return None if video is None else video.getvalue()
+
 
     def anim_data(self, anim, fmt, writer, **anim_kwargs):
         """
         Render a matplotlib animation object and return the corresponding data.
         """
+        if self._streamable(fmt, writer):
+            video = BytesIO()
+            self.anim_stream(anim, fmt, writer, video, **anim_kwargs)
+            return video.getvalue()
         anim_kwargs = dict(anim_kwargs, **({'dpi':self.dpi} if self.dpi is not None else {}))
         anim_kwargs = dict(anim_kwargs, **({'fps':self.fps} if fmt =='gif' else {}))
         if not hasattr(anim, '_encoded_video'):
@@ -192,6 +450,181 @@ class MPLPlotRenderer(Exporter):
         return video
 
 
+    def anim_stream(self, anim, fmt, writer, target, **anim_kwargs):
+        """
+        Render a matplotlib animation object, piping each frame to the
+        encoder as it is drawn and streaming the encoded data to the
+        target. The target may be a filename, a file-like object or a
+        callable accepting successive chunks of data. Writers unable
+        to stream the format write the data once it is encoded.
+        """
+        if not self._streamable(fmt, writer, target):
+            self._write_target(target, self.anim_data(anim, fmt, writer, **anim_kwargs))
+            return
+        anim_kwargs = dict(anim_kwargs, **({'fps':self.fps} if fmt =='gif' else {}))
+        fps = anim_kwargs.get('fps', 1000. / anim._interval)
+        writer, outfile = self._stream_writer(fmt, writer, target, fps, anim_kwargs)
+        anim.save(outfile, writer=writer, dpi=self.dpi)
+
+
+    def get_plot(self, obj):
+        """
+        Returns the plot for the supplied HoloViews component.
+        """
+        element_type = obj.type if isinstance(obj, HoloMap) else type(obj)
+        try:
+            plotclass = Store.registry[element_type]
+        except KeyError:
+            raise Exception("No corresponding plot type found for %r" % type(obj))
+
+        return plotclass(obj, **opts(obj,  get_plot_size(obj, self.size)))
+
+
+    def _pooled_plot(self, obj):
+        """
+        Returns the pooled plot matching the supplied element updated
+        to display it, adding a new plot to the pool if none matches.
+        The least recently used plots are evicted beyond pool_size.
+        """
+        plotclass = Store.registry.get(type(obj))
+        if (not isinstance(obj, Element) or plotclass is None or
+            not issubclass(plotclass, ElementPlot) or
+            issubclass(plotclass, OverlayPlot) or not plotclass.reusable):
+            return self.get_plot(obj)
+
+        options = tuple(sorted(Store.lookup_options(obj, group).kwargs.items())
+                        for group in ['plot', 'style', 'norm'])
+        key = (plotclass, type(obj), tuple(repr(d) for d in obj.dimensions()),
+               repr(options), self.size)
+        pool = self.__dict__.setdefault('_plot_pool', OrderedDict())
+        plot = pool.pop(key, None)
+        if Instrumentation.enabled():
+            Instrumentation.count('Pooled plots created' if plot is None
+                                  else 'Pooled plots reused')
+        if plot is None:
+            plot = self.get_plot(obj)
+        else:
+            plot.update_element(obj)
+        pool[key] = plot
+        while len(pool) > self.pool_size:
+            pool.popitem(last=False)
+        return plot
+
+
+    @staticmethod
+    def _figure(plot):
+        "Returns the figure of the plot, drawing it unless already drawn"
+        return plot.handles['fig'] if plot.drawn else plot()
+
+
+    @staticmethod
+    def _pipe_writer(writer):
+        "Whether the named writer accepts raw frames through a pipe"
+        if writer not in animation.writers.avail:
+            return False
+        return not issubclass(animation.writers[writer], animation.FileMovieWriter)
+
+
+    @classmethod
+    def _streamable(cls, fmt, writer, target=None):
+        """
+        Whether the named writer can stream the format to the target,
+        either a filename written by the encoder or a sink fed from
+        its stdout.
+        """
+        if not cls._pipe_writer(writer):
+            return False
+        return isinstance(target, basestring) or fmt in STREAM_OPTS
+
+
+    @staticmethod
+    def _stream_writer(fmt, writer, target, fps, anim_kwargs):
+        """
+        Returns a StreamingWriter for the named writer writing the
+        format to the target along with the output file to pass it.
+        """
+        writer = animation.writers[writer](fps, anim_kwargs.get('codec'),
+                                           anim_kwargs.get('bitrate'),
+                                           extra_args=anim_kwargs.get('extra_args'))
+        if isinstance(target, basestring):
+            return StreamingWriter(writer), target
+        outfile, stream_args = STREAM_OPTS[fmt]
+        writer.extra_args = list(writer.extra_args) + stream_args
+        sink = target if callable(target) else target.write
+        return StreamingWriter(writer, sink), outfile
+
+
+    @staticmethod
+    def _write_target(target, data):
+        "Writes the data to a filename, file-like object or callable"
+        if isinstance(target, basestring):
+            with open(target, 'wb') as f:
+                f.write(data)
+        elif callable(target):
+            target(data)
+        else:
+            target.write(data)
+
+
+    def parallel_anim_stream(self, obj, plot, fmt, writer, target, **anim_kwargs):
+        """
+        Render the frames of the plot of the supplied object across
+        multiple worker processes, piping them in order to a single
+        encoder streaming the encoded data to the target. The frames
+        match those of anim_stream in order, size, dpi and
+        normalization.
+        """
+        renderer_params = dict(size=self.size, dpi=self.dpi, fps=self.fps, blit=self.blit)
+        initargs = (Store.dumps(obj, protocol=2), pickle.dumps(Store.options, 2),
+                    renderer_params)
+
+        def frames(figure, frame_format, dpi):
+            num_frames = len(plot)
+            chunk_size = max(1, int(np.ceil(num_frames / (self.processes * 4.))))
+            chunks = [(start, min(start+chunk_size, num_frames), frame_format, dpi)
+                      for start in range(0, num_frames, chunk_size)]
+            return (frame for chunk in pool.imap(_render_frames, chunks)
+                    for frame in chunk)
+
+        pool = Pool(self.processes, _init_render_worker, initargs)
+        try:
+            self._pipe_frames(plot, fmt, writer, target, anim_kwargs, frames)
+        finally:
+            pool.terminate()
+
+
+    def blit_anim_stream(self, plot, fmt, writer, target, **anim_kwargs):
+        """
+        Render the frames of a blittable plot by only redrawing its
+        dynamic artists over a cached background, piping them to the
+        encoder streaming the encoded data to the target.
+        """
+        frames = lambda figure, frame_format, dpi: _raw_frames(plot, figure, plot.keys,
+                                                               frame_format, dpi)
+        self._pipe_frames(plot, fmt, writer, target, anim_kwargs, frames)
+
+
+    def _pipe_frames(self, plot, fmt, writer, target, anim_kwargs, frames):
+        """
+        Pipes the raw frames returned by the frames callable, given the
+        figure and the frame format and dpi of the writer, to a single
+        encoder streaming the encoded data to the target.
+        """
+        figure = plot()
+        plt.close(figure)
+        # Matches the fps and dpi Animation.save would use
+        fps = self.fps if fmt == 'gif' else anim_kwargs.get('fps', self.fps)
+        dpi = rcParams['savefig.dpi'] if self.dpi is None else self.dpi
+        if dpi == 'figure':
+            dpi = figure.dpi
+        writer, outfile = self._stream_writer(fmt, writer, target, fps, anim_kwargs)
+        with rc_context():
+            rcParams['savefig.bbox'] = None
+            with writer.saving(figure, outfile, dpi):
+                for frame in frames(figure, writer.frame_format, dpi):
+                    writer.write_frame(frame)
+
+
     def figure_data(self, fig, fmt='png', bbox_inches='tight', **kwargs):
         """
         Render matplotlib figure object and return the corresponding data.
@@ -12,6 +12,8 @@ class AnnotationPlot(ElementPlot):
     AnnotationPlot handles the display of all annotation elements.
     """
 
+    dynamic_handles = ['annotations', 'title']
+
     def __init__(self, annotation, **params):
         self._annotation = annotation
         super(AnnotationPlot, self).__init__(annotation, **params)
@@ -118,6 +120,8 @@ class PathPlot(ElementPlot):
 
     style_opts = ['alpha', 'color', 'linestyle', 'linewidth', 'visible']
 
+    dynamic_handles = ['line_segments', 'title']
+
     def __init__(self, *args, **params):
         self.aspect = 'equal'
         super(PathPlot, self).__init__(*args, **params)
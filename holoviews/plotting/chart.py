@@ -4,6 +4,7 @@ from itertools import product
 import numpy as np
 from matplotlib import cm
 from matplotlib import pyplot as plt
+from matplotlib.collections import PolyCollection
 
 import param
 
@@ -15,6 +16,45 @@ from .element import ElementPlot
 from .plot import Plot
 
 
+def bar_verts(edges, heights, widths, bottoms=0, horizontal=False):
+    """
+    Returns the vertices of rectangular bars starting at the supplied
+    edges with the given heights, widths and bottoms as an array of
+    shape (N, 4, 2), as drawn by a PolyCollection. Horizontal bars
+    extend along the x-axis.
+    """
+    edges, heights, widths, bottoms = np.broadcast_arrays(
+        *[np.asarray(v, dtype=float) for v in (edges, heights, widths, bottoms)])
+    x0, x1 = edges, edges + widths
+    y0, y1 = bottoms, bottoms + heights
+    xs = np.column_stack([x0, x1, x1, x0])
+    ys = np.column_stack([y0, y0, y1, y1])
+    if horizontal:
+        xs, ys = ys, xs
+    return np.dstack([xs, ys])
+
+
+def bar_style(style):
+    """
+    Translates the style options of matplotlib bar calls into the
+    options of a PolyCollection, returning them along with the bar
+    alignment and whether the value axis is logarithmic.
+    """
+    opts = dict(style)
+    align = opts.pop('align', 'edge')
+    log = opts.pop('log', False)
+    # Error bars are never drawn
+    for opt in ['ecolor', 'capsize', 'error_kw']:
+        opts.pop(opt, None)
+    facecolor = opts.pop('fc', opts.pop('facecolor', opts.pop('color', None)))
+    edgecolor = opts.pop('ec', opts.pop('edgecolor', None))
+    if facecolor is not None:
+        opts['facecolors'] = facecolor
+    if edgecolor is not None:
+        opts['edgecolors'] = edgecolor
+    return opts, align, log
+
+
 class ChartPlot(ElementPlot):
 
     def __init__(self, data, **params):
@@ -23,6 +63,12 @@ class ChartPlot(ElementPlot):
         self.cyclic_range = key_dim.range if key_dim.cyclic else None
 
 
+    def _set_element(self, element):
+        super(ChartPlot, self)._set_element(element)
+        key_dim = self.map.last.get_dimension(0)
+        self.cyclic_range = key_dim.range if key_dim.cyclic else None
+
+
     def _cyclic_format_x_tick_label(self, x):
         if self.relative_labels:
             return str(x)
@@ -125,6 +171,8 @@ class CurvePlot(ChartPlot):
     style_opts = ['alpha', 'color', 'visible', 'linewidth',
                   'lw', 'ls', 'linestyle', 'marker']
 
+    dynamic_handles = ['line_segment', 'title']
+
     def __call__(self, ranges=None):
         element = self.map.last
         axis = self.handles['axis']
@@ -181,9 +229,12 @@ class HistogramPlot(ChartPlot):
                   'edgecolor', 'log', 'ecolor', 'capsize',
                   'error_kw', 'hatch', 'fc', 'ec']
 
+    dynamic_handles = ['bars', 'offset_line', 'title']
+
     def __init__(self, histograms, **params):
         self.center = False
         self.cyclic = False
+        self.align = 'edge'
 
         super(HistogramPlot, self).__init__(histograms, **params)
 
@@ -197,20 +248,24 @@ class HistogramPlot(ChartPlot):
 
     def __call__(self, ranges=None):
         hist = self.map.last
+        axis = self.handles['axis']
 
         # Get plot ranges and values
         edges, hvals, widths, lims = self._process_hist(hist)
 
+        style, self.align, log = bar_style(self.style[self.cyclic_index])
         if self.orientation == 'vertical':
-            self.offset_linefn = self.handles['axis'].axvline
-            self.plotfn = self.handles['axis'].barh
+            self.offset_linefn = axis.axvline
+            if log: axis.set_xscale('log', nonposx='clip')
         else:
-            self.offset_linefn = self.handles['axis'].axhline
-            self.plotfn = self.handles['axis'].bar
-
-        # Plot bars and make any adjustments
-        style = self.style[self.cyclic_index]
-        bars = self.plotfn(edges, hvals, widths, zorder=self.zorder, **style)
+            self.offset_linefn = axis.axhline
+            if log: axis.set_yscale('log', nonposy='clip')
+
+        # Plot bars as a single collection and make any adjustments
+        bars = PolyCollection(self._bar_verts(edges, hvals, widths),
+                              zorder=self.zorder, **style)
+        axis.add_collection(bars)
+        axis.autoscale_view()
         self.handles['bars'] = self._update_plot(self.keys[-1], hist, bars, lims) # Indexing top
         self.handles['legend_handle'] = bars
 
@@ -225,9 +280,8 @@ class HistogramPlot(ChartPlot):
         Get data from histogram, including bin_ranges and values.
         """
         self.cyclic = hist.get_dimension(0).cyclic
-        edges = hist.edges[:-1]
+        edges, widths = self._bin_edges(hist)
         hist_vals = np.array(hist.values)
-        widths = [hist._width] * len(hist) if getattr(hist, '_width', None) else np.diff(hist.edges)
         extents = None
         if extents is None:
             xlims = hist.xlim if self.rescale_individually else self.map.xlim
@@ -240,6 +294,21 @@ class HistogramPlot(ChartPlot):
         return edges, hist_vals, widths, lims
 
 
+    def _bin_edges(self, hist):
+        "Returns the left edges and the widths of the bins"
+        edges = hist.edges[:-1]
+        widths = [hist._width] * len(hist) if getattr(hist, '_width', None) else np.diff(hist.edges)
+        return edges, widths
+
+
+    def _bar_verts(self, edges, hvals, widths):
+        "Returns the vertices of the bars of the histogram"
+        edges, widths = np.asarray(edges, dtype=float), np.asarray(widths, dtype=float)
+        if self.align == 'center':
+            edges = edges - widths/2.
+        return bar_verts(edges, hvals, widths, horizontal=self.orientation == 'vertical')
+
+
     def _compute_ticks(self, view, edges, widths, lims):
         """
         Compute the ticks either as cyclic values in degrees or as roughly
@@ -290,16 +359,7 @@ class HistogramPlot(ChartPlot):
         Update all the artists in the histogram. Subclassable to
         allow updating of further artists.
         """
-        plot_vals = zip(self.handles['bars'], edges, hvals, widths)
-        for bar, edge, height, width in plot_vals:
-            if self.orientation == 'vertical':
-                bar.set_y(edge)
-                bar.set_width(height)
-                bar.set_height(width)
-            else:
-                bar.set_x(edge)
-                bar.set_height(height)
-                bar.set_width(width)
+        self.handles['bars'].set_verts(self._bar_verts(edges, hvals, widths))
 
 
     def update_handles(self, axis, view, key, ranges=None):
@@ -411,7 +471,7 @@ class SideHistogramPlot(HistogramPlot):
             cmap = None
 
         if cmap is not None:
-            self._colorize_bars(cmap, bars, main_range)
+            self._colorize_bars(cmap, bars, hist, main_range)
         return bars
 
 
@@ -420,23 +480,23 @@ class SideHistogramPlot(HistogramPlot):
         return (0, x0, y1, x1) if self.orientation == 'vertical' else (x0, 0, x1, y1)
 
 
-    def _colorize_bars(self, cmap, bars, main_range):
+    def _colorize_bars(self, cmap, bars, hist, main_range):
         """
         Use the given cmap to color the bars, applying the correct
         color ranges as necessary.
         """
-        vertical = (self.orientation == 'vertical')
-        cmap_range = main_range[1] - main_range[0]
-        lower_bound = main_range[0]
-        for bar in bars:
-            bar_bin = bar.get_y() if vertical else bar.get_x()
-            width = bar.get_height() if vertical else bar.get_width()
+        edges, widths = self._bin_edges(hist)
+        centers = np.asarray(edges, dtype=float)
+        if self.align != 'center':
+            centers = centers + np.asarray(widths, dtype=float)/2.
+        with np.errstate(divide='ignore', invalid='ignore'):
             try:
-                color_val = (bar_bin+width/2.-lower_bound)/cmap_range
-            except:
-                color_val = 0
-            bar.set_facecolor(cmap(color_val))
-            bar.set_clip_on(False)
+                color_vals = (centers - main_range[0]) / float(main_range[1] - main_range[0])
+            except TypeError:
+                color_vals = np.zeros(len(centers))
+        color_vals[~np.isfinite(color_vals)] = 0
+        bars.set_facecolors(cmap(color_vals))
+        bars.set_clip_on(False)
 
 
     def _update_separator(self, offset):
@@ -479,6 +539,8 @@ class PointPlot(ChartPlot):
                   'linewidth', 'marker', 's', 'visible',
                   'cmap', 'vmin', 'vmax']
 
+    dynamic_handles = ['paths', 'title']
+
     def __call__(self, ranges=None):
         points = self.map.last
         axis = self.handles['axis']
@@ -572,11 +634,21 @@ class VectorFieldPlot(ElementPlot):
                   'linewidth', 'marker', 's', 'visible', 'cmap',
                   'scale', 'headlength', 'headaxislength', 'pivot']
 
+    dynamic_handles = ['quiver', 'title']
+
     def __init__(self, *args, **params):
         super(VectorFieldPlot, self).__init__(*args, **params)
         self._min_dist = self._get_map_info(self.map)
 
 
+    def _set_element(self, element):
+        super(VectorFieldPlot, self)._set_element(element)
+        self._min_dist = self._get_map_info(self.map)
+        # The arrow width is derived from the axis span when drawn
+        if 'quiver' in self.handles:
+            self.handles['quiver'].width = None
+
+
     def _get_map_info(self, vmap):
         """
         Get the minimum sample distance and maximum magnitude
@@ -669,6 +741,7 @@ class VectorFieldPlot(ElementPlot):
         quiver = self.handles['quiver']
         quiver.U = lens
         quiver.angles = angles
+        quiver.scale = scale
         if self.color_dim is not None:
             quiver.set_array(colors)
 
@@ -679,6 +752,9 @@ class VectorFieldPlot(ElementPlot):
 
 class BarPlot(ElementPlot):
 
+    # The bars are created for the categories of the displayed element
+    reusable = False
+
     group_index = param.Integer(default=0, doc="""
        Index of the dimension in the supplied MultiBars
        Element, which will be laid out into groups.""")
@@ -707,6 +783,8 @@ class BarPlot(ElementPlot):
                   'edgecolor', 'log', 'ecolor', 'capsize',
                   'error_kw', 'hatch', 'fc', 'ec']
 
+    dynamic_handles = ['bars', 'title']
+
     _dimensions = OrderedDict([('group', 0),
                                ('category',1),
                                ('stack',2)])
@@ -714,6 +792,7 @@ class BarPlot(ElementPlot):
     def __init__(self, element, **params):
         super(BarPlot, self).__init__(element, **params)
         self.values, self.bar_dimensions = self._get_values()
+        self.align = 'edge'
 
 
     def _get_values(self):
@@ -816,8 +895,8 @@ class BarPlot(ElementPlot):
         val_key = [None] * ndims
         style_key = [None] * len(style_groups)
         label_key = [None] * len(style_groups)
-        labels = []
-        bars = {}
+        labels = OrderedDict()
+        bar_keys, positions, bar_styles = [], [], []
 
         # Iterate over group, category and stack dimension values
         # computing xticks and drawing bars and applying styles
@@ -843,7 +922,6 @@ class BarPlot(ElementPlot):
                         style_key[idx] = cat_name
                     val_key[ci] = cat_name
                     xticks.append((xpos+width/2., cat_name, 0))
-                prev = 0
                 for sidx, stk_name in enumerate(values['stack']):
                     if stk_name is not None:
                         if 'stack' in style_groups:
@@ -851,43 +929,60 @@ class BarPlot(ElementPlot):
                             label_key[idx] = str(gdim.pprint_value(stk_name))
                             style_key[idx] = stk_name
                         val_key[si] = stk_name
-                    val = element.get(tuple(val_key), (np.NaN,))
                     label = ', '.join(label_key)
-                    style = dict(style_opts, label='' if label in labels else label,
-                                 **dict(zip(sopts, color_groups[tuple(style_key)])))
-                    bar = axis.bar([xpos], val, width=width , bottom=prev,
-                                   **style)
+                    if tuple(style_key) not in labels:
+                        labels[tuple(style_key)] = '' if label in labels.values() else label
 
                     # Update variables
-                    bars[tuple(val_key)] = bar
-                    prev += val[0] if np.isfinite(val[0]) else 0
-                    labels.append(label)
+                    bar_keys.append(tuple(val_key))
+                    positions.append(xpos)
+                    bar_styles.append(tuple(style_key))
+
+        # Draw the bars sharing a style as a single collection
+        self.bar_keys, self.bar_positions, self.bar_width = bar_keys, np.array(positions), width
+        self.bar_indices = OrderedDict((style, np.array([i for i, s in enumerate(bar_styles)
+                                                         if s == style], dtype=int))
+                                       for style in labels)
+        # The alignment applies to all bars and must be known before
+        # their vertices are computed
+        self.align = bar_style(style_opts)[1]
+        verts = self._bar_verts(element)
+        bars = OrderedDict()
+        for style_key, label in labels.items():
+            style = dict(style_opts, **dict(zip(sopts, color_groups[style_key])))
+            opts, _, log = bar_style(style)
+            if log: axis.set_yscale('log', nonposy='clip')
+            bars[style_key] = PolyCollection(verts[self.bar_indices[style_key]],
+                                             label=label, **opts)
+            axis.add_collection(bars[style_key])
+        axis.autoscale_view()
+
         title = [str(element.key_dimensions[self._dimensions[cg]])
                  for cg in self.color_by if indices[cg] < ndims]
-        if any(len(l) for l in labels):
+        if any(len(l) for l in labels.values()):
             axis.legend(title=', '.join(title))
         return bars, xticks
 
 
+    def _bar_verts(self, element):
+        """
+        Returns the vertices of all bars of the element, stacking the
+        bars of each category in order.
+        """
+        heights = [element.get(key, np.NaN) for key in self.bar_keys]
+        heights = np.array([h if np.isscalar(h) else h[0] for h in heights], dtype=float)
+        stacked = np.where(np.isfinite(heights), heights, 0).reshape(-1, len(self.values['stack']))
+        bottoms = (np.cumsum(stacked, axis=1) - stacked).flatten()
+        edges = self.bar_positions
+        if self.align == 'center':
+            edges = edges - self.bar_width/2.
+        return bar_verts(edges, heights, self.bar_width, bottoms)
+
+
     def update_handles(self, axis, element, key, ranges=None):
-        dims = element.dimensions('key', label=True)
-        ndims = len(dims)
-        ci, gi, si = self.category_index, self.group_index, self.stack_index
-        val_key = [None] * ndims
-        for g in self.values['group']:
-            if g is not None: val_key[gi] = g
-            for c in self.values['category']:
-                if c is not None: val_key[ci] = c
-                prev = 0
-                for s in self.values['stack']:
-                    if s is not None: val_key[si] = s
-                    bar = self.handles['bars'].get(tuple(val_key))
-                    if bar:
-                        height = element.get(tuple(val_key), np.NaN)
-                        height = height if np.isscalar(height) else height[0]
-                        bar[0].set_height(height)
-                        bar[0].set_y(prev)
-                        prev += height if np.isfinite(height) else 0
+        verts = self._bar_verts(element)
+        for style_key, bars in self.handles['bars'].items():
+            bars.set_verts(verts[self.bar_indices[style_key]])
 
 
 Store.registry.update({Curve: CurvePlot,
@@ -1,5 +1,6 @@
 import numpy as np
 from matplotlib import ticker
+from matplotlib.colors import colorConverter
 
 import param
 
@@ -42,6 +43,9 @@ class Plot3D(ElementPlot):
                                       objects=['fixed'], doc="""
         Whether and where to display the yaxis.""")
 
+    # The 3D axes are drawn as a whole
+    dynamic_handles = None
+
     def _finalize_axis(self, key, zlabel=None, zticks=None, **kwargs):
         """
         Extends the ElementPlot _finalize_axis method to set appropriate
@@ -66,6 +70,9 @@ class Plot3D(ElementPlot):
         axis.view_init(elev=self.elevation, azim=self.azimuth)
         axis.dist = self.distance
         axis.set_axis_bgcolor('white')
+        # Axes3D.set_title lowers the title relative to its current
+        # position, so it is reset as the axis is not cleared
+        axis.title.set_y(1.0)
         return super(Plot3D, self)._finalize_axis(key, **kwargs)
 
 
@@ -85,16 +92,6 @@ class Plot3D(ElementPlot):
         return l, b, zmin, r, t, zmax
 
 
-    def update_frame(self, *args, **kwargs):
-        """
-        If on the bottom Layer, clear plot before drawing each frame.
-        """
-        if not self.subplot or self.zorder == 0:
-            self.handles['axis'].cla()
-
-        super(Plot3D, self).update_frame(*args, **kwargs)
-
-
 
 class Scatter3DPlot(Plot3D, PointPlot):
     """
@@ -132,17 +129,36 @@ class Scatter3DPlot(Plot3D, PointPlot):
         if cs is not None:
             style['c'] = cs
             style.pop('color', None)
-        scatterplot = axis.scatter(xs, ys, zs, zorder=self.zorder, **style)
 
-        self.handles['axis'].add_collection(scatterplot)
-        self.handles['scatter'] = scatterplot
-        self.handles['legend_handle'] = scatterplot
+        scatterplot = self.handles.get('scatter')
+        update = scatterplot is not None
+        if update:
+            # Update the points in place, the depth shading is
+            # computed from the 3D offsets and colors when drawn
+            scatterplot.set_offsets(np.column_stack([xs, ys]))
+            scatterplot._offsets3d = tuple(np.asarray(v, dtype=float) for v in (xs, ys, zs))
+            if 's' in style:
+                scatterplot.set_sizes(np.atleast_1d(style['s']))
+            if cs is not None:
+                scatterplot.set_array(np.asarray(cs))
+        else:
+            scatterplot = axis.scatter(xs, ys, zs, zorder=self.zorder, **style)
+            self.handles['scatter'] = scatterplot
+            self.handles['legend_handle'] = scatterplot
+            # Before the first draw the edge colors are the face colors
+            # themselves if the edges are colored to match the faces
+            self._face_edges = scatterplot.get_edgecolor() is scatterplot.get_facecolor()
 
         if cs is not None:
             val_dim = points.dimensions(label=True)[self.color_index]
             ranges = self.compute_ranges(self.map, key, ranges)
             ranges = match_spec(points, ranges)
             scatterplot.set_clim(ranges[val_dim])
+            if update:
+                scatterplot.update_scalarmappable()
+                scatterplot._facecolor3d = scatterplot.get_facecolor()
+                if self._face_edges:
+                    scatterplot._edgecolor3d = scatterplot._facecolor3d
 
 
 
@@ -163,6 +179,11 @@ class SurfacePlot(Plot3D):
     style_opts = ['cmap', 'color', 'shade', 'facecolors',
                   'rstride', 'cstride']
 
+    def __init__(self, *args, **params):
+        super(SurfacePlot, self).__init__(*args, **params)
+        self._surface_layout = None
+        self._surface_polys = None
+
     def __call__(self, ranges=None):
         view = self.map.last
         key = self.keys[-1]
@@ -180,13 +201,100 @@ class SurfacePlot(Plot3D):
         style_opts = Store.lookup_options(element, 'style')[self.cyclic_index]
         style_opts['vmin'] = zmin
         style_opts['vmax'] = zmax
+
+        # Surfaces and wireframes of the same shape are updated in
+        # place, otherwise the previous artists are replaced
+        surface = self.handles.get('surface')
+        layout = (self.plot_type, mat.shape, r.shape,
+                  style_opts.get('rstride'), style_opts.get('cstride'))
+        if surface is not None:
+            if layout == self._surface_layout and self._update_surface(surface, r, c, mat, style_opts):
+                return
+            for artist in getattr(surface, 'collections', [surface]):
+                artist.remove()
+
         if self.plot_type == "wireframe":
+            # Wireframes are not colormapped
+            style_opts.pop('vmin'), style_opts.pop('vmax')
             self.handles['surface'] = self.handles['axis'].plot_wireframe(r, c, mat, **style_opts)
         elif self.plot_type == "surface":
             self.handles['surface'] = self.handles['axis'].plot_surface(r, c, mat, **style_opts)
+            rstride, cstride = style_opts.get('rstride', 10), style_opts.get('cstride', 10)
+            self._surface_polys = self._polygon_indices(mat.shape, rstride, cstride)
         elif self.plot_type == "contour":
             self.handles['surface'] = self.handles['axis'].contour3D(r, c, mat, **style_opts)
         self.handles['legend_handle'] = self.handles['surface']
+        self._surface_layout = layout
+
+
+    def _update_surface(self, surface, X, Y, Z, style):
+        """
+        Updates the vertices and colors of a surface or wireframe in
+        place, returning whether the surface could be updated.
+        """
+        if self.plot_type == 'contour' or 'facecolors' in style:
+            return False
+        if self.plot_type == 'wireframe':
+            surface.set_segments(self._wireframe_lines(X, Y, Z, style.get('rstride', 1),
+                                                       style.get('cstride', 1)))
+            return True
+
+        # Gather the vertices of all polygons at once
+        indices, starts, normal_indices = self._surface_polys
+        xyz = np.column_stack([X.ravel(), Y.ravel(), Z.ravel()])
+        vertices = xyz[indices]
+        surface.set_verts(np.split(vertices, starts[1:]))
+        cmap = style.get('cmap')
+        if cmap is not None:
+            lengths = np.diff(np.append(starts, len(indices)))
+            surface.set_array(np.add.reduceat(vertices[:, 2], starts) / lengths)
+            surface.set_clim(style['vmin'], style['vmax'])
+        elif style.get('shade', True):
+            p1, p2, p3 = [xyz[idx] for idx in normal_indices.T]
+            color = colorConverter.to_rgba(style.get('color', 'b'))
+            normals = np.cross(p1 - p2, p2 - p3)
+            surface.set_facecolors(self.handles['axis']._shade_colors(color, normals))
+        return True
+
+
+    @staticmethod
+    def _polygon_indices(shape, rstride, cstride):
+        """
+        Returns the flat indices into the grid of the vertices of the
+        polygons of a surface, as constructed by Axes3D.plot_surface,
+        along with the start of each polygon and the indices of the
+        vertices used to compute the normal of each polygon.
+        """
+        rows, cols = shape
+        grid = np.arange(rows*cols).reshape(shape)
+        polys = []
+        for rs in range(0, rows-1, rstride):
+            for cs in range(0, cols-1, cstride):
+                top = grid[rs, cs:min(cols, cs+cstride+1)]
+                left = grid[rs+1:min(rows, rs+rstride+1), min(cols-1, cs+cstride)]
+                base = grid[min(rows-1, rs+rstride), cs:min(cols, cs+cstride+1)][::-1]
+                right = grid[rs:min(rows-1, rs+rstride), cs][::-1]
+                poly = np.concatenate((top, left, base, right))
+                polys.append(poly[np.concatenate([[True], poly[1:] != poly[:-1]])])
+        starts = np.cumsum([0] + [len(p) for p in polys[:-1]])
+        normals = np.array([[p[0], p[len(p)//3], p[2*len(p)//3]] for p in polys])
+        return np.concatenate(polys), starts, normals
+
+
+    @staticmethod
+    def _wireframe_lines(X, Y, Z, rstride, cstride):
+        """
+        Returns the lines of a wireframe along the rows and columns
+        of the grid, as constructed by Axes3D.plot_wireframe.
+        """
+        rows, cols = Z.shape
+        rii = list(range(0, rows, rstride)) if rstride and Z.size else []
+        if rii and rii[-1] != rows-1: rii.append(rows-1)
+        cii = list(range(0, cols, cstride)) if cstride and Z.size else []
+        if cii and cii[-1] != cols-1: cii.append(cols-1)
+        rlines = np.dstack([X[rii], Y[rii], Z[rii]])
+        clines = np.dstack([X.T[cii], Y.T[cii], Z.T[cii]])
+        return list(rlines) + list(clines)
 
 
 Store.registry.update({Surface: SurfacePlot,
@@ -79,8 +79,13 @@ class ElementPlot(Plot):
     # Element Plots should declare the valid style options for matplotlib call
     style_opts = []
 
+    # Whether the plot can display a new element through
+    # update_element, allowing it to be reused by pooled rendering
+    reusable = True
+
     def __init__(self, element, keys=None, ranges=None, dimensions=None, overlaid=0,
-                 cyclic_index=0, style=None, zorder=0, adjoined=None, uniform=True, **params):
+                 cyclic_index=0, style=None, zorder=0, adjoined=None, uniform=True,
+                 context=None, **params):
         self.dimensions = dimensions
         self.keys = keys
         if not isinstance(element, HoloMap):
@@ -90,7 +95,7 @@ class ElementPlot(Plot):
             self.map = element
         self.uniform = uniform
         self.adjoined = adjoined
-        self.map = self._check_map(ranges, keys)
+        self.map = self._check_map(ranges, keys, context)
         self.overlaid = overlaid
         self.cyclic_index = cyclic_index
         self.style = Store.lookup_options(self.map.last, 'style') if style is None else style
@@ -112,6 +117,10 @@ class ElementPlot(Plot):
             else:
                 select = {d.name: key[self.dimensions.index(d)]
                           for d in self.map.key_dimensions}
+                # A key specifying every map dimension is looked up directly
+                map_key = tuple(select[d] for d in key_dimensions)
+                if not any(isinstance(k, (tuple, list, set, slice)) for k in map_key):
+                    return self.map.data.get(map_key)
         elif isinstance(key, int):
             return self.map.values()[min([key, len(self.map)-1])]
         else:
@@ -123,22 +132,28 @@ class ElementPlot(Plot):
         return selection.last if isinstance(selection, HoloMap) else selection
 
 
-    def _check_map(self, ranges=None, keys=None):
+    def _check_map(self, ranges=None, keys=None, context=None):
         """
         Helper method that ensures a given element is always returned as
-        an HoloMap object.
+        an HoloMap object. When the map is covered by the PlotContext
+        of the parent plot it has already been collapsed and the ranges
+        of the context are reused.
         """
-        # Apply data collapse
-        holomap = self.map.map(Compositor.collapse_element, [CompositeOverlay])
+        if context is not None and context.covers(self.map):
+            holomap = self.map
+            keys, ranges = context.keys, context.ranges
+        else:
+            # Apply data collapse
+            holomap = self.map.map(Compositor.collapse_element, [CompositeOverlay])
 
         # Compute framewise normalization
-        mapwise_ranges = self.compute_ranges(holomap, None, None)
         if keys and isinstance(holomap, HoloMap) and ranges:
             frame_ranges = OrderedDict([(tuple(key),
                                          self.compute_ranges(holomap, key, ranges[key]))
                                         for key in keys])
             ranges = frame_ranges.values()
         elif isinstance(holomap, HoloMap):
+            mapwise_ranges = self.compute_ranges(holomap, None, None)
             frame_ranges = OrderedDict([(key, self.compute_ranges(holomap, key, mapwise_ranges))
                                         for key in (keys if keys else holomap.keys())])
             ranges = frame_ranges.values()
@@ -378,6 +393,44 @@ class ElementPlot(Plot):
         raise NotImplementedError
 
 
+    def blittable(self):
+        """
+        Plots may only be blitted when normalized across all frames,
+        since framewise normalization changes the axes on each frame.
+        """
+        if not super(ElementPlot, self).blittable() or not self.normalize:
+            return False
+        if self.rescale_individually:
+            return False
+        norm_opts = self._get_norm_opts(self.map)
+        return not any(framewise for _, framewise in norm_opts.values())
+
+
+    def update_element(self, element):
+        """
+        Replaces the displayed element with another element of the
+        same type and options, updating the existing figure in place
+        rather than constructing a new plot. Returns the figure.
+        """
+        self._set_element(element)
+        if not self.drawn:
+            return self()
+        self.update_frame(self.keys[0])
+        return self.handles['fig']
+
+
+    def _set_element(self, element):
+        """
+        Sets the element displayed by the plot, discarding any state
+        derived from the previously displayed element.
+        """
+        self.map = HoloMap(initial_items=(0, element),
+                           key_dimensions=['Frame'], id=element.id)
+        self.map = self._check_map()
+        self.keys = list(self.map.data.keys())
+        self.__dict__.pop('_range_table_', None)
+
+
 class OverlayPlot(ElementPlot):
     """
     OverlayPlot supports compositors processing of Overlays across maps.
@@ -398,6 +451,8 @@ class OverlayPlot(ElementPlot):
         options. The predefined options may be customized in the
         legend_specs class attribute.""")
 
+    dynamic_handles = ['legend', 'title']
+
     legend_specs = {'inner': {},
                     'left':   dict(bbox_to_anchor=(-.15, 1)),
                     'right':  dict(bbox_to_anchor=(1.25, 1)),
@@ -557,9 +612,6 @@ class OverlayPlot(ElementPlot):
 
 
     def update_frame(self, key, ranges=None):
-        if self.projection == '3d':
-            self.handles['axis'].clear()
-
         for plot in self.subplots.values():
             plot.update_frame(key, ranges)
 
@@ -112,14 +112,15 @@ class BarPlugin(MplD3Plugin):
         if not self._applies(plot, view): return
         fig = plot.handles['fig']
 
-        for i, (key, bar) in enumerate(plot.handles['bars'].items()):
-            handle = bar.get_children()[0]
-            selection = [(d.name,{k}) for d, k in zip(plot.bar_dimensions, key)
-                         if d is not None]
-            label_data = view.select(**dict(selection)).dframe().ix[0].to_frame()
-            label = str(label_data.to_html(header=len(view.label)>0))
-            tooltip = plugins.LineHTMLTooltip(handle, label, voffset=self.voffset,
-                                              hoffset=self.hoffset, css=self.css)
+        for style_key, bars in plot.handles['bars'].items():
+            labels = []
+            for i in plot.bar_indices[style_key]:
+                selection = [(d.name,{k}) for d, k in zip(plot.bar_dimensions, plot.bar_keys[i])
+                             if d is not None]
+                label_data = view.select(**dict(selection)).dframe().ix[0].to_frame()
+                labels.append(str(label_data.to_html(header=len(view.label)>0)))
+            tooltip = plugins.PointHTMLTooltip(bars, labels, voffset=self.voffset,
+                                               hoffset=self.hoffset, css=self.css)
             plugins.connect(fig, tooltip)
 
     
@@ -141,10 +142,10 @@ class HistogramPlugin(MplD3Plugin):
             label.columns = [view.label]
             labels.append(str(label.to_html(header=len(view.label)>0)))
 
-        for i, (bar, label) in enumerate(zip(plot.handles['bars'].get_children(), labels)):
-            tooltip = plugins.LineHTMLTooltip(bar, label, voffset=self.voffset,
-                                              hoffset=self.hoffset, css=self.css)
-            plugins.connect(fig, tooltip)
+        tooltip = plugins.PointHTMLTooltip(plot.handles['bars'], labels,
+                                           voffset=self.voffset, hoffset=self.hoffset,
+                                           css=self.css)
+        plugins.connect(fig, tooltip)
 
 
 
@@ -181,9 +182,9 @@ class RasterPlugin(MplD3Plugin):
             df = view.dframe().sort(['y','x'], ascending=(1,1))[::-1]
             l, b, r, t = (0, 0, cols, rows)
 
-        for k, ann in plot.handles.get('annotations', {}).items():
-            ann.remove()
-            plot.handles['annotations'].pop(k)
+        annotations = plot.handles.pop('annotations', None)
+        if annotations is not None:
+            annotations.remove()
 
         # Generate color mesh to label each point
         cols+=1; rows+=1
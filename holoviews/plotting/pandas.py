@@ -60,6 +60,9 @@ class DFrameViewPlot(ElementPlot):
 
     apply_databounds = False
 
+    # The plot type may be declared by the displayed element
+    reusable = False
+
     def __init__(self, view, **params):
         super(DFrameViewPlot, self).__init__(view, **params)
         if self.map.last.plot_type and 'plot_type' not in params:
@@ -8,10 +8,11 @@ from matplotlib import gridspec, animation
 
 import param
 from ..core import OrderedDict, HoloMap, AdjointLayout, NdLayout,\
-    GridSpace, Layout, Element, CompositeOverlay
-from ..core.options import Store, Compositor
+    GridSpace, Layout, Element, Element3D, CompositeOverlay
+from ..core.options import Store, Compositor, OptionTree
+from ..core.instrumentation import Instrumentation
 from ..core import traversal
-from ..core.util import find_minmax, sanitize_identifier, int_to_roman
+from ..core.util import find_minmax, sanitize_identifier, int_to_roman, int_to_alpha
 from ..element import Raster, Table
 
 
@@ -88,6 +89,11 @@ class Plot(param.Parameterized):
     # A mapping from ViewableElement types to their corresponding side plot types
     sideplots = {}
 
+    # The handles holding the artists which change between frames,
+    # which are redrawn over a cached background when blitting. Plots
+    # which may not be blitted leave it as None.
+    dynamic_handles = None
+
 
     def __init__(self, figure=None, axis=None, dimensions=None, subplots=None,
                  layout_dimensions=None, uniform=True, keys=None, subplot=False,
@@ -121,9 +127,13 @@ class Plot(param.Parameterized):
         the selected normalization option (i.e. either per frame or
         over the whole animation) and finally compute the dimension
         ranges in each group. The new set of ranges is returned.
+
+        The ranges of each normalization group are computed once per
+        object (or per key for framewise normalization) and stored in
+        a table on the plot, so subsequent calls (e.g. when updating
+        frames) reduce to dictionary lookups.
         """
-        all_table = all(isinstance(el, Table) for el in obj.traverse(lambda x: x, [Element]))
-        if obj is None or not self.normalize or all_table:
+        if obj is None or not self.normalize or self._all_tables(obj):
             return OrderedDict()
         # Get inherited ranges
         ranges = {} if ranges is None or self.adjoined else dict(ranges)
@@ -135,20 +145,69 @@ class Plot(param.Parameterized):
         # Traverse displayed object if normalization applies
         # at this level, and ranges for the group have not
         # been supplied from a composite plot
-        elements = []
-        return_fn = lambda x: x if isinstance(x, Element) else None
+        source = None
         for group, (axiswise, framewise) in norm_opts.items():
             if group in ranges:
                 continue # Skip if ranges are already computed
             elif not framewise and not self.adjoined: # Traverse to get all elements
-                elements = obj.traverse(return_fn, [group])
+                source = (id(obj), None, group)
             elif key is not None: # Traverse to get elements for each frame
-                elements = self._get_frame(key).traverse(return_fn, [group])
+                source = (id(obj), key, group)
             if not axiswise or (not framewise and isinstance(obj, HoloMap)): # Compute new ranges
-                self._compute_group_range(group, elements, ranges)
+                group_ranges = self._group_ranges(obj, source)
+                if group_ranges:
+                    ranges[group] = OrderedDict(group_ranges)
         return ranges
 
 
+    def _all_tables(self, obj):
+        """
+        Whether all the elements of the object are Tables, which are
+        never normalized. The result is cached until the object changes.
+        """
+        cached = self.__dict__.get('_all_tables_')
+        if cached is None or cached[0] is not obj:
+            tables = all(isinstance(el, Table) for el in obj.traverse(lambda x: x, [Element]))
+            cached = (obj, tables)
+            self.__dict__['_all_tables_'] = cached
+        return cached[1]
+
+
+    def _range_table(self):
+        """
+        Returns the table of computed group ranges, created lazily as
+        ranges may be computed before Plot.__init__ is called.
+        """
+        if '_range_table_' not in self.__dict__:
+            self.__dict__['_range_table_'] = {}
+        return self.__dict__['_range_table_']
+
+
+    def _group_ranges(self, obj, source):
+        """
+        Looks up the ranges of the elements matching the group of the
+        supplied source, an (object id, key, group) tuple where a key
+        of None selects the whole object, computing them on the first
+        request.
+        """
+        if source is None:
+            return OrderedDict()
+        table = self._range_table()
+        if Instrumentation.enabled():
+            Instrumentation.count('Ranges cached' if source in table
+                                  else 'Ranges computed')
+        if source not in table:
+            _, key, group = source
+            return_fn = lambda x: x if isinstance(x, Element) else None
+            frame = obj if key is None else self._get_frame(key)
+            elements = frame.traverse(return_fn, [group])
+            group_ranges = {}
+            self._compute_group_range(group, elements, group_ranges)
+            # Holding on to obj ensures its id cannot be reused
+            table[source] = (obj, group_ranges.get(group, OrderedDict()))
+        return table[source][1]
+
+
     def _get_norm_opts(self, obj):
         """
         Gets the normalization options for a LabelledData object by
@@ -156,8 +215,14 @@ class Plot(param.Parameterized):
         The id is then used to select the appropriate OptionsTree,
         accumulating the normalization options into a dictionary.
         Returns a dictionary of normalization options for each
-        element in the tree.
+        element in the tree. The result is cached until the object
+        or any OptionTree changes.
         """
+        state = (obj, OptionTree._generation, Store.options)
+        cached = self.__dict__.get('_norm_opts_')
+        if cached is not None and all(c is s for c, s in zip(cached[0], state)):
+            return cached[1]
+
         norm_opts = {}
 
         # Get all elements' type.group.label specs and ids
@@ -189,22 +254,47 @@ class Plot(param.Parameterized):
         element_specs = [spec for eid, spec in element_specs]
         norm_opts.update({spec: (False, False) for spec in element_specs
                           if not any(spec[1:i] in norm_opts.keys() for i in range(1, 3))})
+        self.__dict__['_norm_opts_'] = (state, norm_opts)
         return norm_opts
 
 
     @staticmethod
     def _compute_group_range(group, elements, ranges):
-        # Iterate over all elements in a normalization group
-        # and accumulate their ranges into the supplied dictionary.
+        # Collect the ranges of all elements in a normalization group
+        # and accumulate them into the supplied dictionary.
         elements = [el for el in elements if el is not None]
+        dim_ranges = OrderedDict()
         for el in elements:
             for dim in el.dimensions(label=True):
-                dim_range = el.range(dim)
-                if group not in ranges: ranges[group] = OrderedDict()
-                if dim in ranges[group]:
-                    ranges[group][dim] = find_minmax(ranges[group][dim], dim_range)
-                else:
-                    ranges[group][dim] = dim_range
+                dim_ranges.setdefault(dim, []).append(el.range(dim))
+        if not dim_ranges:
+            return
+        group_ranges = ranges.setdefault(group, OrderedDict())
+        for dim, dranges in dim_ranges.items():
+            if dim in group_ranges:
+                dranges = [group_ranges[dim]] + dranges
+            group_ranges[dim] = Plot._combine_ranges(dranges)
+
+
+    @staticmethod
+    def _combine_ranges(ranges):
+        """
+        Combines a list of (min, max) ranges into a single range using
+        vectorized min/max, matching successive calls to find_minmax.
+        """
+        if len(ranges) == 1:
+            return ranges[0]
+        try:
+            extrema = np.array(ranges, dtype=np.float64)
+        except (TypeError, ValueError):
+            extrema = None
+        if extrema is None or extrema.shape != (len(ranges), 2):
+            combined = ranges[0]
+            for dim_range in ranges[1:]:
+                combined = find_minmax(combined, dim_range)
+            return combined
+        return (float(np.minimum.reduce(extrema[:, 0])),
+                float(np.maximum.reduce(extrema[:, 1])))
 
 
     def _get_frame(self, key):
@@ -262,9 +352,9 @@ class Plot(param.Parameterized):
             from mpl_toolkits.axes_grid1.anchored_artists import AnchoredText
             labels = {}
             if '{Alpha}' in self.sublabel_format:
-                labels['Alpha'] = str(chr(layout_num+64))
+                labels['Alpha'] = int_to_alpha(layout_num-1)
             elif '{alpha}' in self.sublabel_format:
-                labels['alpha'] = str(chr(layout_num+96))
+                labels['alpha'] = int_to_alpha(layout_num-1, upper=False)
             elif '{numeric}' in self.sublabel_format:
                 labels['numeric'] = self.layout_num
             elif '{Roman}' in self.sublabel_format:
@@ -276,7 +366,11 @@ class Plot(param.Parameterized):
                               prop=dict(size=self.sublabel_size, weight='bold'),
                               bbox_transform=axis.transAxes)
             at.patch.set_visible(False)
+            # Replace rather than stack sublabels when updating frames
+            if self.__dict__.get('_sublabel') is not None:
+                self._sublabel.remove()
             axis.add_artist(at)
+            self._sublabel = at
 
 
     def _finalize_axis(self, key):
@@ -313,13 +407,101 @@ class Plot(param.Parameterized):
         frames may be specified as well as the fps.
         """
         figure = self()
-        anim = animation.FuncAnimation(figure, self.update_frame,
+        blit = self.blittable()
+        anim = animation.FuncAnimation(figure, self._animate if blit else self.update_frame,
                                        frames=self.keys,
-                                       interval = 1000.0/fps)
+                                       interval = 1000.0/fps, blit=blit)
         # Close the figure handle
         plt.close(figure)
         return anim
 
+
+    def _animate(self, key):
+        "Updates the frame, returning the artists to be blitted"
+        self.update_frame(key)
+        return self.dynamic_artists()
+
+
+    def blittable(self):
+        """
+        Whether the frames of the plot may be blitted, requiring the
+        plot and all its subplots to declare their dynamic handles.
+        """
+        if self.dynamic_handles is None:
+            return False
+        subplots = (self.subplots or {}).values()
+        return all(subplot.blittable() for subplot in subplots if subplot is not None)
+
+
+    def dynamic_artists(self):
+        """
+        Returns the artists of the plot and its subplots held by the
+        dynamic handles.
+        """
+        artists = []
+        for name in (self.dynamic_handles or []):
+            handle = self.handles.get(name)
+            if isinstance(handle, dict):
+                artists += list(handle.values())
+            elif isinstance(handle, (list, tuple)):
+                artists += list(handle)
+            elif handle is not None:
+                artists.append(handle)
+        for subplot in (self.subplots or {}).values():
+            if subplot is not None:
+                artists += subplot.dynamic_artists()
+        return artists
+
+
+    def blit(self, key):
+        """
+        Updates the figure to the given frame by only redrawing the
+        dynamic artists over a cached rendering of the static
+        background. The background is rendered again whenever the
+        axes change, e.g. when the axis ranges or ticks are updated.
+        Requires an Agg based canvas and returns the figure.
+        """
+        fig = self.handles['fig']
+        self.update_frame(key)
+        artists = [a for a in self.dynamic_artists() if a.get_visible()]
+        state = self._static_state(fig)
+        canvas = fig.canvas
+        background = self.__dict__.get('_blit_background_')
+        if background is None or background[0] != state:
+            for artist in artists:
+                artist.set_visible(False)
+            try:
+                canvas.draw()
+            finally:
+                for artist in artists:
+                    artist.set_visible(True)
+            background = (state, canvas.copy_from_bbox(fig.bbox))
+            self.__dict__['_blit_background_'] = background
+        else:
+            canvas.restore_region(background[1])
+        for artist in sorted(artists, key=lambda a: a.get_zorder()):
+            fig.draw_artist(artist)
+        return fig
+
+
+    @staticmethod
+    def _static_state(fig):
+        """
+        Summarizes the state of the static artists of the figure,
+        which invalidates the cached background when it changes.
+        """
+        state = [fig.dpi, tuple(fig.get_size_inches()),
+                 fig.get_facecolor(), fig.get_edgecolor()]
+        for ax in fig.axes:
+            state.append((ax.get_visible(), ax.get_position().bounds,
+                          ax.get_xlim(), ax.get_ylim(), ax.patch.get_alpha()))
+            for axis in [ax.xaxis, ax.yaxis]:
+                formatter = axis.get_major_formatter()
+                state.append((axis.get_visible(), axis.label.get_text(),
+                              tuple(axis.get_majorticklocs()),
+                              tuple(getattr(formatter, 'seq', []))))
+        return state
+
     def __len__(self):
         """
         Returns the total number of available frames.
@@ -350,12 +532,37 @@ class Plot(param.Parameterized):
 
 
 
+class PlotContext(object):
+    """
+    PlotContext carries the state a composite plot computes over all
+    its items down to the plots of the individual items: the items
+    collapsed by the Compositor, the keys of the composite plot and
+    the ranges computed over the composite for each key. A subplot
+    whose item is covered by the context skips collapsing its item
+    and computing the ranges of the normalization groups the context
+    already holds.
+    """
+
+    def __init__(self, collapsed, keys, ranges):
+        self.keys = keys
+        self.ranges = ranges
+        self._items = {id(item): item for item in collapsed.values()}
+
+
+    def covers(self, obj):
+        "Whether the object is one of the collapsed items of the context"
+        return self._items.get(id(obj)) is obj
+
+
+
 class CompositePlot(Plot):
     """
     CompositePlot provides a baseclass for plots coordinate multiple
     subplots to form a Layout.
     """
 
+    dynamic_handles = ['title']
+
     def update_frame(self, key, ranges=None):
         ranges = self.compute_ranges(self.layout, key, ranges)
         for subplot in self.subplots.values():
@@ -367,24 +574,59 @@ class CompositePlot(Plot):
     def _get_frame(self, key):
         """
         Creates a clone of the Layout with the nth-frame for each
-        Element.
+        Element. Frames are cached by key for as long as the plotted
+        layout is unchanged.
         """
+        cached = self.__dict__.get('_frames_')
+        if cached is None or cached[0] is not self.layout:
+            cached = (self.layout, {})
+            self.__dict__['_frames_'] = cached
+        frames = cached[1]
+        if Instrumentation.enabled():
+            Instrumentation.count('Layout frames cached' if key in frames
+                                  else 'Layout frames selected')
+        if key in frames:
+            return frames[key]
+
         layout_frame = self.layout.clone(shared_data=False)
         nthkey_fn = lambda x: zip(tuple(x.name for x in x.key_dimensions),
                                   list(x.data.keys())[min([key[0], len(x)-1])])
         for path, item in self.layout.items():
-            if self.uniform:
+            if type(item) is HoloMap and not self.uniform:
+                layout_frame[path] = list(item.data.values())[min([key[0], len(item)-1])]
+                continue
+            elif self.uniform:
                 dim_keys = zip([d.name for d in self.dimensions
                                 if d in item.key_dimensions], key)
             else:
                 dim_keys = item.traverse(nthkey_fn, ('HoloMap',))[0]
-            if dim_keys:
-                layout_frame[path] = item.select(**dict(dim_keys))
-            else:
-                layout_frame[path] = item
+            frame = self._lookup_frame(item, dict(dim_keys)) if dim_keys else item
+            layout_frame[path] = item.select(**dict(dim_keys)) if frame is None else frame
+        frames[key] = layout_frame
         return layout_frame
 
 
+    def _lookup_frame(self, item, selection):
+        """
+        Looks up the element of a HoloMap (or the elements of the
+        HoloMaps in an AdjointLayout) directly if the selection
+        supplies a value for every key dimension, returning None if
+        a regular select is required.
+        """
+        if isinstance(item, AdjointLayout):
+            frames = [self._lookup_frame(el, selection) for el in item]
+            return None if any(f is None for f in frames) else item.clone(frames)
+        elif type(item) is not HoloMap:
+            return None
+        names = [d.name for d in item.key_dimensions]
+        if set(names) != set(selection):
+            return None
+        map_key = tuple(selection[name] for name in names)
+        if any(isinstance(k, (tuple, list, set, slice)) for k in map_key):
+            return None
+        return item.data.get(map_key)
+
+
     def __len__(self):
         return len(self.keys)
 
@@ -462,12 +704,15 @@ class GridPlot(CompositePlot):
 
 
     def _create_subplots(self, layout, axis, ranges, create_axes):
-        layout = layout.map(Compositor.collapse_element, [CompositeOverlay])
+        # Only maps containing overlays need to be collapsed
+        if any(layout.traverse(lambda x: isinstance(x, CompositeOverlay))):
+            layout = layout.map(Compositor.collapse_element, [CompositeOverlay])
         subplots, subaxes = OrderedDict(), OrderedDict()
 
         frame_ranges = self.compute_ranges(layout, None, ranges)
         frame_ranges = OrderedDict([(key, self.compute_ranges(layout, key, frame_ranges))
                                     for key in self.keys])
+        context = PlotContext(layout, self.keys, frame_ranges)
         collapsed_layout = layout.clone(shared_data=False, id=layout.id)
         r, c = (0, 0)
         for coord in layout.keys(full_grid=True):
@@ -489,7 +734,7 @@ class GridPlot(CompositePlot):
                                                 dimensions=self.dimensions, show_title=False,
                                                 subplot=not create_axes, ranges=frame_ranges,
                                                 uniform=self.uniform, keys=self.keys,
-                                                show_legend=False)
+                                                show_legend=False, context=context)
                 collapsed_layout[coord] = subplot.layout if isinstance(subplot, CompositePlot) else subplot.map
                 subplots[(r, c)] = subplot
             if r != self.rows-1:
@@ -708,13 +953,16 @@ class AdjointLayoutPlot(CompositePlot):
         used to position all the Layouts together. This method allows
         LayoutPlots to make final adjustments to the axis positions.
         """
-        if not 'main' in self.subplots:
+        checks = [self.view_positions, self.subaxes, self.subplots]
+        adjoined = [pos for pos in ['right', 'top'] if all(pos in check for check in checks)]
+        if not 'main' in self.subplots or not adjoined:
             return
-        plt.draw()
+        # Applying the aspect of the main axis computes its final
+        # position without drawing the whole figure
         main_ax = self.subplots['main'].handles['axis']
-        checks = [self.view_positions, self.subaxes, self.subplots]
+        main_ax.apply_aspect()
         bbox = main_ax.get_position()
-        if all('right' in check for check in checks):
+        if 'right' in adjoined:
             ax = self.subaxes['right']
             subplot = self.subplots['right']
             ax.set_position([bbox.x1 + bbox.width * self.border_size,
@@ -722,7 +970,7 @@ class AdjointLayoutPlot(CompositePlot):
                              bbox.width * self.subplot_size, bbox.height])
             if isinstance(subplot, GridPlot):
                 ax.set_aspect('equal')
-        if all('top' in check for check in checks):
+        if 'top' in adjoined:
             ax = self.subaxes['top']
             subplot = self.subplots['top']
             ax.set_position([bbox.x0,
@@ -841,6 +1089,14 @@ class LayoutPlot(CompositePlot):
         frame_ranges = self.compute_ranges(layout, None, None)
         frame_ranges = OrderedDict([(key, self.compute_ranges(layout, key, frame_ranges))
                                     for key in self.keys])
+        # The axis covering the whole figure is replaced by the axes
+        # of the AdjointLayouts
+        fig = self.handles['fig']
+        if self.handles['axis'] in fig.axes:
+            fig.delaxes(self.handles['axis'])
+        # Options shared by the main plots of all the AdjointLayouts
+        self._sublabel_opts = {k: v for k, v in self.get_param_values(onlychanged=True)
+                               if 'sublabel_' in k}
         layout_subplots, layout_axes = {}, {}
         for num, (r, c) in enumerate(self.coords):
             # Compute the layout type from shape
@@ -859,11 +1115,10 @@ class LayoutPlot(CompositePlot):
             view = layouts[(r, c)]
             positions = AdjointLayoutPlot.layout_dict[layout_type]['positions']
 
-            # Create temporary subplots to get projections types
-            # to create the correct subaxes for all plots in the layout
-            temp_subplots, new_layout = self._create_subplots(layouts[(r, c)], positions,
-                                                              None, frame_ranges)
-            gidx, gsinds, projs = self.grid_situate(temp_subplots, gidx, layout_type, cols)
+            # Look up the projections of the plots to create the
+            # correct subaxes for all plots in the layout
+            projections = self._get_projections(view, positions)
+            gidx, gsinds, projs = self.grid_situate(projections, gidx, layout_type, cols)
 
             layout_key, _ = layout_items.get((r, c), (None, None))
             if isinstance(layout, NdLayout) and layout_key:
@@ -871,7 +1126,7 @@ class LayoutPlot(CompositePlot):
 
             # Generate the axes and create the subplots with the appropriate
             # axis objects
-            subaxes = [plt.subplot(self.gs[ind], projection=proj)
+            subaxes = [fig.add_subplot(self.gs[ind], projection=proj)
                        for ind, proj in zip(gsinds, projs)]
             subplots, adjoint_layout = self._create_subplots(layouts[(r, c)], positions,
                                                              layout_dimensions, frame_ranges,
@@ -894,12 +1149,13 @@ class LayoutPlot(CompositePlot):
         return layout_subplots, layout_axes, collapsed_layout
 
 
-    def grid_situate(self, subplots, current_idx, layout_type, subgrid_width):
+    def grid_situate(self, projections, current_idx, layout_type, subgrid_width):
         """
         Situate the current AdjointLayoutPlot in a LayoutPlot. The
         LayoutPlot specifies a layout_type into which the AdjointLayoutPlot
         must be embedded. This enclosing layout is guaranteed to have
-        enough cells to display all the views.
+        enough cells to display all the views. The projections of the
+        plots are supplied as a dictionary indexed by position.
 
         Based on this enforced layout format, a starting index
         supplied by LayoutPlot (indexing into a large gridspec
@@ -928,11 +1184,48 @@ class LayoutPlot(CompositePlot):
             grid_idx = (bottom_idx if bottom else current_idx) + 2
             start, inds = grid_idx, [current_idx, current_idx+1,
                               bottom_idx, bottom_idx+1]
-        projs = [subplots.get(pos, Plot).projection for pos in positions]
+        projs = [projections.get(pos) for pos in positions]
 
         return start, inds, projs
 
 
+    def _get_plot_type(self, view, pos):
+        """
+        Returns the plot type used to plot the view at the supplied
+        position of an AdjointLayout.
+        """
+        if isinstance(view, GridSpace):
+            raster_fn = lambda x: True if isinstance(x, Raster) or \
+                              (not isinstance(x, Element)) else False
+            all_raster = all(view.traverse(raster_fn))
+            if all_raster:
+                from .raster import RasterGridPlot
+                return RasterGridPlot
+            return GridPlot
+        vtype = view.type if isinstance(view, HoloMap) else view.__class__
+        return Store.registry[vtype] if pos == 'main' else Plot.sideplots[vtype]
+
+
+    def _get_projections(self, layout, positions):
+        """
+        Returns the projections of the axes of the plots of the views
+        in the AdjointLayout indexed by position, looked up from the
+        plot types and options rather than by creating the plots.
+        """
+        projections = {}
+        for pos in positions:
+            view = layout.get(pos, None)
+            if view is None:
+                continue
+            plotopts = Store.lookup_options(view, 'plot').options
+            projection = plotopts.get('projection', self._get_plot_type(view, pos).projection)
+            element = view.last if isinstance(view, HoloMap) else view
+            if isinstance(element, CompositeOverlay):
+                element = element.values()[0]
+            projections[pos] = '3d' if isinstance(element, Element3D) else projection
+        return projections
+
+
     def _create_subplots(self, layout, positions, layout_dimensions, ranges, axes={}, num=1):
         """
         Plot all the views contained in the AdjointLayout Object using axes
@@ -956,9 +1249,6 @@ class LayoutPlot(CompositePlot):
 
             override_opts = {}
             if pos == 'main':
-                own_params = self.get_param_values(onlychanged=True)
-                sublabel_opts = {k: v for k, v in own_params
-                                 if 'sublabel_' in k}
                 override_opts = dict(aspect='square')
             elif pos == 'right':
                 right_opts = dict(orientation='vertical',
@@ -969,24 +1259,11 @@ class LayoutPlot(CompositePlot):
                 override_opts = dict(subplot_opts, **top_opts)
 
             # Override the plotopts as required
-            plotopts = dict(sublabel_opts, **plotopts)
+            plotopts = dict(self._sublabel_opts, **plotopts)
             plotopts.update(override_opts, figure=self.handles['fig'])
-            vtype = view.type if isinstance(view, HoloMap) else view.__class__
+            plot_type = self._get_plot_type(view, pos)
             if isinstance(view, GridSpace):
-                raster_fn = lambda x: True if isinstance(x, Raster) or \
-                                  (not isinstance(x, Element)) else False
-                all_raster = all(view.traverse(raster_fn))
-                if all_raster:
-                    from .raster import RasterGridPlot
-                    plot_type = RasterGridPlot
-                else:
-                    plot_type = GridPlot
                 plotopts['create_axes'] = ax is not None
-            else:
-                if pos == 'main':
-                    plot_type = Store.registry[vtype]
-                else:
-                    plot_type = Plot.sideplots[vtype]
             num = num if len(self.coords) > 1 else 0
             subplots[pos] = plot_type(view, axis=ax, keys=self.keys,
                                       dimensions=self.dimensions,
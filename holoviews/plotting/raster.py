@@ -1,8 +1,10 @@
 import copy
-from itertools import product
 
 import numpy as np
 from matplotlib import pyplot as plt
+from matplotlib import rcParams
+from matplotlib.artist import Artist, allow_rasterization
+from matplotlib.font_manager import FontProperties
 from mpl_toolkits.axes_grid1 import make_axes_locatable
 
 import param
@@ -16,6 +18,93 @@ from .element import ElementPlot, OverlayPlot
 from .plot import Plot, GridPlot
 
 
+class TextGrid(Artist):
+    """
+    TextGrid is a matplotlib artist drawing a grid of text labels,
+    each centered on a cell of a regular grid spanning the supplied
+    extents. The labels share their font properties and their extents
+    are measured once per distinct string, so thousands of labels may
+    be drawn in a single pass. Labels which do not fit into their
+    cell at the current size of the figure are not drawn.
+    """
+
+    def __init__(self, texts, extents=(0, 0, 1, 1), color=None, fontsize=None, **kwargs):
+        super(TextGrid, self).__init__()
+        self.update(kwargs)
+        self._color = rcParams['text.color'] if color is None else color
+        self._fontproperties = FontProperties(size=fontsize)
+        self._extent_cache = {}
+        self.set_texts(texts, extents)
+
+
+    def set_texts(self, texts, extents=(0, 0, 1, 1)):
+        """
+        Sets the labels as a 2D array of strings, the first row
+        holding the labels at the bottom of the extents.
+        """
+        texts = np.asarray(texts, dtype=object)
+        self._shape = texts.shape
+        self._strings, self._codes = np.unique(texts.ravel(), return_inverse=True)
+        self._extents = extents
+        self.stale = True
+
+
+    def _measure(self, renderer):
+        """
+        Returns the width, height and descent of each distinct label
+        in display units.
+        """
+        key = (type(renderer), getattr(renderer, 'dpi', None))
+        cache = self._extent_cache.setdefault(key, {})
+        for string in self._strings:
+            if string not in cache:
+                cache[string] = renderer.get_text_width_height_descent(
+                    string, self._fontproperties, ismath=False)
+        return np.array([cache[string] for string in self._strings]).reshape(-1, 3)
+
+
+    @allow_rasterization
+    def draw(self, renderer):
+        if not self.get_visible() or not len(self._codes):
+            return
+        rows, cols = self._shape
+        l, b, r, t = self._extents
+        (x0, y0), (x1, y1) = self.get_transform().transform([(l, b), (r, t)])
+        cell_width, cell_height = (x1-x0)/float(cols), (y1-y0)/float(rows)
+
+        # Vertically center the labels like a single line of Text
+        _, line_height, line_descent = renderer.get_text_width_height_descent(
+            'lp', self._fontproperties, ismath=False)
+        widths, heights, descents = self._measure(renderer).T
+        heights = np.maximum(heights, line_height)
+        descents = np.maximum(descents, line_descent)
+        fits = ((self._strings != '') & (widths <= abs(cell_width)) &
+                (heights <= abs(cell_height)))
+        cells = np.flatnonzero(fits[self._codes])
+        if not len(cells):
+            return
+
+        codes = self._codes[cells]
+        row, col = cells // cols, cells % cols
+        xs = x0 + (col + 0.5) * cell_width - widths[codes]/2.
+        ys = y0 + (row + 0.5) * cell_height - heights[codes]/2. + descents[codes]
+        if renderer.flipy():
+            ys = renderer.get_canvas_width_height()[1] - ys
+
+        renderer.open_group('textgrid', self.get_gid())
+        gc = renderer.new_gc()
+        gc.set_foreground(self._color)
+        gc.set_alpha(self.get_alpha())
+        gc.set_url(self.get_url())
+        self._set_gc_clip(gc)
+        for x, y, code in zip(xs, ys, codes):
+            renderer.draw_text(gc, x, y, self._strings[code], self._fontproperties, 0)
+        gc.restore()
+        renderer.close_group('textgrid')
+        self.stale = False
+
+
+
 class RasterPlot(ElementPlot):
 
     colorbar = param.Boolean(default=False, doc="""
@@ -27,6 +116,7 @@ class RasterPlot(ElementPlot):
     style_opts = ['alpha', 'cmap', 'interpolation', 'visible',
                   'filterrad', 'origin', 'clims']
 
+    dynamic_handles = ['im', 'annotations', 'title']
 
     def __init__(self, *args, **kwargs):
         super(RasterPlot, self).__init__(*args, **kwargs)
@@ -40,8 +130,6 @@ class RasterPlot(ElementPlot):
         ranges = self.compute_ranges(self.map, self.keys[-1], ranges)
         ranges = match_spec(view, ranges)
 
-        (l, b, r, t) = (0, 0, 1, 1) if isinstance(view, HeatMap)\
-            else self.map.last.extents
         xticks, yticks = self._compute_ticks(view)
 
         opts = self.style[self.cyclic_index]
@@ -58,11 +146,8 @@ class RasterPlot(ElementPlot):
             cmap = copy.copy(plt.cm.get_cmap('gray' if cmap_name is None else cmap_name))
             cmap.set_bad('w', 1.)
             opts['cmap'] = cmap
-        elif type(view) == Raster:
-            b, t = t, b
-            r+=1; b+=1
 
-        im = axis.imshow(data, extent=[l, r, b, t], zorder=self.zorder, **opts)
+        im = axis.imshow(data, extent=self._image_extent(view), zorder=self.zorder, **opts)
         if clims is None:
             val_dim = [d.name for d in view.value_dimensions][0]
             clims = ranges.get(val_dim)
@@ -74,8 +159,8 @@ class RasterPlot(ElementPlot):
             plt.colorbar(im, cax=self.handles['cax'])
 
         if isinstance(view, HeatMap):
-            self.handles['axis'].set_aspect(float(r - l)/(t-b))
-            self.handles['annotations'] = {}
+            self.handles['axis'].set_aspect(1)
+            self.handles['annotations'] = None
 
             if self.show_values:
                 self._annotate_values(view)
@@ -107,46 +192,66 @@ class RasterPlot(ElementPlot):
             return None, None
 
 
+    @staticmethod
+    def _image_extent(view):
+        "Returns the (left, right, bottom, top) extent of the image"
+        (l, b, r, t) = (0, 0, 1, 1) if isinstance(view, HeatMap) else view.extents
+        if type(view) == Raster:
+            b, t = t, b
+            r+=1; b+=1
+        return [l, r, b, t]
+
+
     def _annotate_values(self, view):
-        axis = self.handles['axis']
+        """
+        Annotates each cell of the HeatMap with its value, formatting
+        each distinct value once and drawing the labels as a single
+        TextGrid artist.
+        """
         val_dim = view.value_dimensions[0]
         dim1_keys, dim2_keys = view.dense_keys()
-        num_x, num_y = len(dim1_keys), len(dim2_keys)
-        xstep, ystep = 1.0/num_x, 1.0/num_y
-        xpos = np.linspace(xstep/2., 1.0-xstep/2., num_x)
-        ypos = np.linspace(ystep/2., 1.0-ystep/2., num_y)
-        coords = product(dim1_keys, dim2_keys)
-        plot_coords = product(xpos, ypos)
-        for plot_coord, coord in zip(plot_coords, coords):
-            if isinstance(view, HeatMap):
-                val = view._data.get(coord, np.NaN)
-                val = val[0] if isinstance(val, tuple) else val
-            else:
-                val = view[coord]
-            val = val_dim.type(val) if val_dim.type else val
+        xindex = {k: i for i, k in enumerate(dim1_keys)}
+        yindex = {k: i for i, k in enumerate(dim2_keys)}
+        texts = np.empty((len(dim2_keys), len(dim1_keys)), dtype=object)
+        texts[:] = ''
+        formatted = {}
+        for (k1, k2), val in view._data.items():
             val = val[0] if isinstance(val, tuple) else val
-            text = val_dim.pprint_value(val)
-            text = '' if val is np.nan else text
-            if plot_coord not in self.handles['annotations']:
-                annotation = axis.annotate(text, xy=plot_coord,
-                                           xycoords='axes fraction',
-                                           horizontalalignment='center',
-                                           verticalalignment='center')
-                self.handles['annotations'][plot_coord] = annotation
-            else:
-                self.handles['annotations'][plot_coord].set_text(text)
-        old_coords = set(self.handles['annotations'].keys()) - set(product(xpos, ypos))
-        for plot_coord in old_coords:
-            annotation = self.handles['annotations'].pop(plot_coord)
-            annotation.remove()
+            try:
+                text = formatted[val]
+            except (KeyError, TypeError):
+                text = self._format_value(val_dim, val)
+                try:
+                    formatted[val] = text
+                except TypeError:
+                    pass
+            texts[yindex[k2], xindex[k1]] = text
+
+        annotations = self.handles.get('annotations')
+        if annotations is None:
+            annotations = TextGrid(texts, zorder=3, transform=self.handles['axis'].transAxes)
+            self.handles['axis'].add_artist(annotations)
+            self.handles['annotations'] = annotations
+        else:
+            annotations.set_texts(texts)
+
+
+    @staticmethod
+    def _format_value(val_dim, val):
+        val = val_dim.type(val) if val_dim.type else val
+        val = val[0] if isinstance(val, tuple) else val
+        if val is np.nan or (isinstance(val, float) and np.isnan(val)):
+            return ''
+        return '%s' % (val_dim.pprint_value(val),)
 
 
     def update_handles(self, axis, view, key, ranges=None):
         im = self.handles.get('im', None)
         im.set_data(view.data)
+        im.set_extent(self._image_extent(view))
 
         if isinstance(view, HeatMap) and self.show_values:
-           self._annotate_values(view)
+            self._annotate_values(view)
 
         val_dim = [d.name for d in view.value_dimensions][0]
         im.set_clim(ranges.get(val_dim))
@@ -174,6 +279,9 @@ class RasterGridPlot(GridPlot, OverlayPlot):
     style_opts = ['alpha', 'cmap', 'interpolation', 'visible',
                   'filterrad', 'origin']
 
+    # The projections are laid out on a single axis
+    dynamic_handles = None
+
     def __init__(self, layout, keys=None, dimensions=None, create_axes=False, ranges=None,
                  layout_num=1, **params):
         if not keys or not dimensions:
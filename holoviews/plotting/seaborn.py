@@ -19,9 +19,11 @@ from .pandas import DFrameViewPlot
 
 class FullRedrawPlot(ElementPlot):
     """
-    FullRedrawPlot provides an abstract baseclass, defining an
-    update_frame method, which completely wipes the axis and
-    redraws the plot.
+    FullRedrawPlot provides an abstract baseclass for plots drawn
+    through seaborn functions, which do not return the artists they
+    draw. The artists added to the axis on each frame are recorded,
+    so they can be removed and redrawn on the next frame while the
+    axis decorations persist.
     """
 
     apply_databounds = param.Boolean(default=False, doc="""
@@ -42,9 +44,22 @@ class FullRedrawPlot(ElementPlot):
     _abstract = True
 
     def update_handles(self, axis, view, key, ranges=None):
-        if self.zorder == 0 and axis:
-            axis.cla()
+        for artist in self.handles.get('artists', []):
+            artist.remove()
+        if self.zorder == 0:
+            # Compute the data limits from the redrawn artists only
+            axis.ignore_existing_data_limits = True
+        self._draw(axis, view)
+
+
+    def _draw(self, axis, view):
+        """
+        Draws the view, recording the artists added to the axis.
+        """
+        existing = set(axis.get_children())
         self._update_plot(axis, view)
+        self.handles['artists'] = [artist for artist in axis.get_children()
+                                   if artist not in existing]
 
 
 
@@ -63,7 +78,7 @@ class RegressionPlot(FullRedrawPlot):
                   'x_jitter', 'y_jitter', 'x_partial', 'y_partial']
 
     def __call__(self, ranges=None):
-        self._update_plot(self.handles['axis'], self.map.last)
+        self._draw(self.handles['axis'], self.map.last)
         return self._finalize_axis(self.keys[-1])
 
 
@@ -101,7 +116,7 @@ class BivariatePlot(FullRedrawPlot):
         self.style = self.style[self.cyclic_index]
         if self.joint and self.subplot:
             raise Exception("Joint plots can't be animated or laid out in a grid.")
-        self._update_plot(axis, kdeview)
+        self._draw(axis, kdeview)
 
         return self._finalize_axis(self.keys[-1])
 
@@ -143,7 +158,7 @@ class TimeSeriesPlot(FullRedrawPlot):
         curveview = self.map.last
         axis = self.handles['axis']
         self.style = self.style[self.cyclic_index]
-        self._update_plot(axis, curveview)
+        self._draw(axis, curveview)
 
         return self._finalize_axis(self.keys[-1])
 
@@ -174,7 +189,7 @@ class DistributionPlot(FullRedrawPlot):
         distview = self.map.last
         axis = self.handles['axis']
         self.style = self.style[self.cyclic_index]
-        self._update_plot(axis, distview)
+        self._draw(axis, distview)
 
         return self._finalize_axis(self.keys[-1])
 
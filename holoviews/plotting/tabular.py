@@ -1,9 +1,9 @@
-from collections import defaultdict
 from matplotlib.font_manager import FontProperties
 from matplotlib.table import Table as mpl_Table
 
 import param
 
+from ..core import Dimension, HoloMap, OrderedDict
 from ..element import ItemTable, Table
 from .element import ElementPlot
 from ..core.options import Store
@@ -34,8 +34,23 @@ class TablePlot(ElementPlot):
         cell.""")
 
     max_rows = param.Integer(default=15, doc="""
-        The maximum number of Table rows before the table is
-        summarized.""")
+        The maximum number of Table rows displayed at once. Larger
+        tables are summarized, showing their first and last rows,
+        unless paginated.""")
+
+    max_cols = param.Integer(default=None, allow_None=True, doc="""
+        The maximum number of Table columns displayed at once. Larger
+        tables are summarized, showing their first and last columns.""")
+
+    paginate = param.Boolean(default=False, doc="""
+        Whether to page through the rows of tables exceeding max_rows
+        instead of summarizing them. The pages are selected by an
+        additional Row dimension holding the offset of the first row
+        on each page, which is animated and controlled by widgets
+        like any other dimension. Each table only has as many pages
+        as its own rows fill, so the pages of a HoloMap of tables of
+        different lengths are sparse. Tables plotted as part of a
+        layout only display their first page.""")
 
     font_types = param.Dict(default={'heading': FontProperties(weight='bold',
                                                                family='monospace')},
@@ -43,37 +58,129 @@ class TablePlot(ElementPlot):
 
     style_opts = ['alpha', 'sketch_params']
 
+    dynamic_handles = ['table', 'title']
+
     # Disable computing plot bounds from data.
     apply_databounds = False
 
+    # The cells are laid out to the shape of the displayed table
+    reusable = False
+
     def __init__(self, table, **params):
         super(TablePlot, self).__init__(table, **params)
-        self.cell_values = self._format_table()
-
-
-    def _format_table(self):
-        cell_values = defaultdict(dict)
-        for key in self.keys:
-            frame = self._get_frame(key)
-            if frame is None:
-                continue
-
-            # Mapping from the cell coordinates to the dictionary key.
-            summarize = frame.rows > self.max_rows
-            half_rows = self.max_rows/2
-            rows = min([self.max_rows, frame.rows])
-            for row in range(rows):
-                adjusted_row = row
-                for col in range(frame.cols):
-                    if summarize and row == half_rows:
-                        cell_text = "..."
-                    else:
-                        if summarize and row > half_rows:
-                            adjusted_row = (frame.rows - self.max_rows + row)
-                        value = frame.pprint_cell(adjusted_row, col)
-                        cell_text = self.pprint_value(value)
-                    cell_values[key][(row, col)] = cell_text
-        return cell_values
+        self._columns = {}
+        self._cell_values = {}
+        # Mapping from the plot keys to the map key and row offset
+        self._pages = OrderedDict()
+        # Number of data rows displayed on each page
+        self._page_size = max(self.max_rows - self._header_rows(self.map.last), 1)
+        if self.paginate and not self.subplot:
+            single = not isinstance(table, HoloMap)
+            for key in self.keys:
+                frame = self.map.data.get(key)
+                rows = 0 if frame is None else frame.rows - self._header_rows(frame)
+                for offset in range(0, max(rows, 1), self._page_size):
+                    page_key = (offset,) if single else tuple(key) + (offset,)
+                    self._pages[page_key] = (key, offset)
+            self.dimensions = ([] if single else list(self.dimensions)) + [Dimension('Row')]
+            self.keys = list(self._pages.keys())
+
+
+    def _page(self, key):
+        """
+        Returns the map key and row offset of the page displayed for
+        the supplied plot key.
+        """
+        if not self._pages:
+            return key, 0
+        if isinstance(key, int):
+            key = self.keys[min([key, len(self.keys)-1])]
+        return self._pages[tuple(key)]
+
+
+    def _get_frame(self, key):
+        if not self._pages:
+            return super(TablePlot, self)._get_frame(key)
+        return self.map.data.get(self._page(key)[0])
+
+
+    def _header_rows(self, frame):
+        "The number of heading rows of the frame, repeated on every page"
+        return int(frame.rows > 0 and all(frame.cell_type(0, col) == 'heading'
+                                          for col in range(frame.cols)))
+
+
+    def _window(self, frame, offset):
+        """
+        Returns the row and column indices of the frame displayed at
+        the supplied row offset, where None marks the row or column
+        summarizing the rows or columns omitted from the display.
+        """
+        headers = self._header_rows(frame)
+        if self._pages:
+            stop = headers + offset + self._page_size
+            rows = list(range(headers)) + list(range(headers + offset, stop))
+        else:
+            rows = self._summarize(frame.rows, self.max_rows)
+        cols = self._summarize(frame.cols, self.max_cols)
+        return rows, cols
+
+
+    @staticmethod
+    def _summarize(length, maximum):
+        if maximum is None or length <= maximum:
+            return list(range(length))
+        half = maximum // 2
+        return (list(range(half)) + [None] +
+                list(range(length - maximum + half + 1, length)))
+
+
+    def _column(self, frame, col):
+        """
+        Returns the values of the frame along a column, cached so that
+        paging through the rows of a table is independent of its size.
+        """
+        key = (id(frame), col)
+        if key not in self._columns:
+            dim = (frame.key_dimensions + frame.value_dimensions)[col]
+            self._columns[key] = frame.dimension_values(dim.name)
+        return self._columns[key]
+
+
+    def _format_cells(self, frame, offset):
+        """
+        Formats the cells of the frame displayed at the supplied row
+        offset, returning a dictionary of the cell text and font types
+        indexed by the cell coordinates. Only the displayed cells are
+        formatted, column by column, and the results are cached.
+        """
+        cache_key = (id(frame), offset)
+        if cache_key in self._cell_values:
+            return self._cell_values[cache_key]
+
+        rows, cols = self._window(frame, offset)
+        headers = self._header_rows(frame) if isinstance(frame, Table) else None
+        cells = {}
+        for c, col in enumerate(cols):
+            if headers is not None and col is not None:
+                dim = (frame.key_dimensions + frame.value_dimensions)[col]
+                values = self._column(frame, col)
+            for r, row in enumerate(rows):
+                if row is not None and row >= frame.rows:
+                    cells[(r, c)] = ('', 'data')
+                    continue
+                cell_type = 'data' if None in (row, col) else frame.cell_type(row, col)
+                if None in (row, col):
+                    text = '...'
+                elif headers is None:
+                    text = self.pprint_value(frame.pprint_cell(row, col))
+                elif row < headers:
+                    text = self.pprint_value(str(dim))
+                else:
+                    text = self.pprint_value(dim.pprint_value(values[row - headers]))
+                cells[(r, c)] = (text, cell_type)
+        self._cell_values[cache_key] = cells
+        return cells
 
 
     def pprint_value(self, value):
@@ -94,6 +201,7 @@ class TablePlot(ElementPlot):
 
 
     def __call__(self, ranges=None):
+        key = self.keys[-1]
         element = self.map.last
         axis = self.handles['axis']
 
@@ -102,22 +210,17 @@ class TablePlot(ElementPlot):
         table = mpl_Table(axis, bbox=[self.border, self.border,
                                       size_factor, size_factor])
 
-        width = size_factor / element.cols
-        height = size_factor / element.rows
-
-        summarize = element.rows > self.max_rows
-        half_rows = self.max_rows/2
-        rows = min([self.max_rows, element.rows])
-        for row in range(rows):
-            adjusted_row = row
-            for col in range(element.cols):
-                if summarize and row > half_rows:
-                    adjusted_row = (element.rows - self.max_rows + row)
-                cell_value = self.cell_values[self.keys[-1]][(row, col)]
-                cellfont = self.font_types.get(element.cell_type(adjusted_row,col), None)
-                font_kwargs = dict(fontproperties=cellfont) if cellfont else {}
-                table.add_cell(row, col, width, height, text=cell_value,  loc='center',
-                               **font_kwargs)
+        cells = self._format_cells(element, self._page(key)[1])
+        rows = max(r for r, _ in cells) + 1 if cells else 1
+        cols = max(c for _, c in cells) + 1 if cells else 1
+        width = size_factor / cols
+        height = size_factor / rows
+
+        for (row, col), (cell_text, cell_type) in cells.items():
+            cellfont = self.font_types.get(cell_type, None)
+            font_kwargs = dict(fontproperties=cellfont) if cellfont else {}
+            table.add_cell(row, col, width, height, text=cell_text,  loc='center',
+                           **font_kwargs)
 
         table.set_fontsize(self.max_font_size)
         table.auto_set_font_size(True)
@@ -125,14 +228,15 @@ class TablePlot(ElementPlot):
 
         self.handles['table'] = table
 
-        return self._finalize_axis(self.keys[-1])
+        return self._finalize_axis(key)
 
 
     def update_handles(self, axis, view, key, ranges=None):
         table = self.handles['table']
+        cells = self._format_cells(view, self._page(key)[1])
 
         for coords, cell in table.get_celld().items():
-            value = self.cell_values[key][coords]
+            value = cells.get(coords, ('', 'data'))[0]
             cell.set_text_props(text=value)
 
         # Resize fonts across table as necessary
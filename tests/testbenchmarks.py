@@ -0,0 +1,68 @@
+"""
+Test cases for the runner of the benchmark suite.
+"""
+from holoviews.element.comparison import ComparisonTestCase
+
+from benchmarks.run import (param_combinations, param_key, compare, measure,
+                            run_benchmark, format_result)
+
+
+class SingleParam(object):
+    params = [1, 2]
+    param_names = ['n']
+
+
+class MultipleParams(object):
+    params = [['a', 'b'], [1, 2]]
+    param_names = ['name', 'n']
+
+
+class TrackSuite(object):
+    params = [2, 3]
+    param_names = ['n']
+
+    def track_size(self, n):
+        return n * 10
+    track_size.unit = 'bytes'
+
+
+class BenchmarkRunnerTest(ComparisonTestCase):
+
+    def test_single_param_combinations(self):
+        self.assertEqual(param_combinations(SingleParam), [(1,), (2,)])
+
+    def test_multiple_param_combinations(self):
+        self.assertEqual(param_combinations(MultipleParams),
+                         [('a', 1), ('a', 2), ('b', 1), ('b', 2)])
+
+    def test_no_params(self):
+        self.assertEqual(param_combinations(object), [()])
+
+    def test_param_key(self):
+        self.assertEqual(param_key('module.Suite.time_x', ('a', 1)),
+                         "module.Suite.time_x('a', 1)")
+
+    def test_measure(self):
+        timing = measure(lambda: None, repeat=3, min_time=0.001)
+        self.assertEqual(timing['repeat'], 3)
+        self.assertTrue(timing['median'] >= timing['min'] >= 0)
+
+    def test_compare(self):
+        baseline = {'a': {'min': 1.0}, 'b': {'min': 1.0}, 'c': {'min': 1.0}}
+        results = {'a': {'min': 1.5}, 'b': {'min': 0.5}, 'c': {'min': 1.1},
+                   'd': {'min': 1.0}, 'e': None}
+        rows = sorted(compare(results, baseline, threshold=1.2))
+        self.assertEqual([(key, status) for key, _, _, _, status in rows],
+                         [('a', 'regressed'), ('b', 'improved'), ('c', '')])
+
+    def test_track_benchmark(self):
+        result = run_benchmark(TrackSuite, 'track_size', (3,), 5, 0.01)
+        self.assertEqual(dict(result), {'value': 30, 'unit': 'bytes'})
+        self.assertEqual(format_result(result), '30 bytes')
+
+    def test_compare_tracked_values(self):
+        baseline = {'a': {'value': 100, 'unit': 'bytes'}}
+        results = {'a': {'value': 150, 'unit': 'bytes'}}
+        rows = compare(results, baseline, threshold=1.2)
+        self.assertEqual([(row[0], row[3], row[4]) for row in rows],
+                         [('a', 1.5, 'regressed')])
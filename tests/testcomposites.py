@@ -3,6 +3,8 @@ Test cases for the composite types built with + and * i.e Layout
 and Overlay (does *not* test HoloMaps).
 """
 
+from functools import reduce
+
 from holoviews import Element, Layout, Overlay
 from holoviews.element.comparison import ComparisonTestCase
 
@@ -117,6 +119,19 @@ class LayoutTestCase(ElementTestCase):
                                     ('Element', 'LabelA', 'III'),
                                     ('Element', 'LabelA', 'IV')])
 
+    def test_layouttree_from_values_matches_addition(self):
+        values = [self.el1, self.el6, self.el1 + self.el4, self.el6, self.el1]
+        t = Layout.from_values(values)
+        expected = reduce(lambda x, y: x+y, values)
+        self.assertEqual(t.keys(), expected.keys())
+        self.assertEqual(t.values(), expected.values())
+
+    def test_layouttree_from_values_many(self):
+        t = Layout.from_values([self.el1]*50)
+        self.assertEqual(t.keys()[0], ('Element', 'I'))
+        self.assertEqual(t.keys()[-1], ('Element', 'L'))
+        self.assertEqual(len(set(t.keys())), 50)
+
 
 
 class OverlayTestCase(ElementTestCase):
@@ -0,0 +1,87 @@
+"""
+Test cases for sampling and reducing HoloMaps of Raster types.
+"""
+import numpy as np
+
+from holoviews import Image, Raster, HoloMap
+from holoviews.element.comparison import ComparisonTestCase
+
+
+class HoloMapRasterSampleTest(ComparisonTestCase):
+    """
+    Uniform Raster HoloMaps are sampled and reduced across all frames
+    at once, which must match sampling each frame individually.
+    """
+
+    def setUp(self):
+        self.arrays = [np.arange(16).reshape(4, 4)*i for i in range(1, 4)]
+        self.image_map = HoloMap([(i, Image(arr)) for i, arr in enumerate(self.arrays)],
+                                 key_dimensions=['t'])
+        self.raster_map = HoloMap([(i, Raster(arr)) for i, arr in enumerate(self.arrays)],
+                                  key_dimensions=['t'])
+
+    def framewise(self, hmap, method, *args, **kwargs):
+        frames = hmap.clone([(k, getattr(v, method)(*args, **kwargs))
+                             for k, v in hmap.items()])
+        return frames.table()
+
+    def test_sample_points(self):
+        samples = [(-0.4, -0.4), (0.1, 0.3)]
+        sampled = self.image_map.sample(samples)
+        self.assertEqual(sampled, self.framewise(self.image_map, 'sample', samples))
+        self.assertEqual(sampled[1, 0.1, 0.3], (4,))
+
+    def test_sample_single_dimension(self):
+        sampled = self.image_map.sample(x=0.1)
+        self.assertEqual(sampled, self.framewise(self.image_map, 'sample', x=0.1))
+
+    def test_sample_regular_grid(self):
+        sampled = self.image_map.sample((2, 2))
+        self.assertEqual(sampled.key_dimensions, ['t', 'x', 'y'])
+        self.assertEqual(len(sampled), 12)
+
+    def test_reduce_single_dimension(self):
+        reduced = self.raster_map.reduce(x=np.mean)
+        self.assertEqual(reduced, self.framewise(self.raster_map, 'reduce', x=np.mean))
+
+    def test_nonuniform_map_falls_back(self):
+        hmap = self.image_map.clone()
+        hmap[3] = Image(np.ones((2, 2)))
+        sampled = hmap.sample([(0.1, 0.1)])
+        self.assertEqual(sampled, self.framewise(hmap, 'sample', [(0.1, 0.1)]).reindex())
+
+    def test_nonuniform_map_not_stacked(self):
+        hmap = self.image_map.clone()
+        hmap[3] = Image(np.ones((2, 2)))
+        self.assertFalse(hmap._uniform_rasters())
+        self.assertTrue(self.image_map._uniform_rasters())
+
+    def test_mismatched_stacked_values_not_tabulated(self):
+        template = self.image_map.last.sample([(0.1, 0.1)]).table()
+        self.assertEqual(self.image_map._stacked_table(template, np.zeros((3, 2))), None)
+
+    def test_reduce_nonsquare_image(self):
+        hmap = HoloMap([(i, Image(np.random.rand(2, 3))) for i in range(3)],
+                       key_dimensions=['t'])
+        reduced = hmap.reduce(x=np.mean)
+        self.assertEqual(reduced, self.framewise(hmap, 'reduce', x=np.mean))
+
+    def test_reduce_nonsquare_raster(self):
+        hmap = HoloMap([(i, Raster(np.random.rand(2, 3))) for i in range(3)],
+                       key_dimensions=['t'])
+        for dim in ['x', 'y']:
+            reduced = hmap.reduce(**{dim: np.mean})
+            self.assertEqual(reduced, self.framewise(hmap, 'reduce', **{dim: np.mean}))
+
+    def test_sample_nonsquare_image(self):
+        hmap = HoloMap([(i, Image(np.random.rand(2, 3))) for i in range(3)],
+                       key_dimensions=['t'])
+        sampled = hmap.sample(y=0.1)
+        self.assertEqual(sampled, self.framewise(hmap, 'sample', y=0.1))
+
+    def test_sample_nonsquare_raster(self):
+        hmap = HoloMap([(i, Raster(np.random.rand(2, 3))) for i in range(3)],
+                       key_dimensions=['t'])
+        sampled = hmap.sample(y=1)
+        self.assertEqual(len(sampled), 6)
+        self.assertEqual(sampled, self.framewise(hmap, 'sample', y=1))
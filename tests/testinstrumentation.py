@@ -0,0 +1,98 @@
+"""
+Test cases for the Instrumentation of the hot points of HoloViews.
+"""
+import numpy as np
+
+from holoviews import HoloMap, Image, Table
+from holoviews.core import Dimensioned, traversal
+from holoviews.core.instrumentation import Instrumentation
+from holoviews.element.comparison import ComparisonTestCase
+
+from matplotlib import pyplot
+pyplot.switch_backend('agg')
+
+from holoviews.plotting import RasterPlot
+
+
+class InstrumentationTest(ComparisonTestCase):
+
+    def setUp(self):
+        self.hmap = HoloMap({i: Image(np.eye(2)*i) for i in range(3)},
+                            key_dimensions=['Frame'])
+        Instrumentation.reset()
+
+    def tearDown(self):
+        Instrumentation.disable()
+        Instrumentation.reset()
+
+    def test_disable_restores_hot_points(self):
+        select = Dimensioned.__dict__['select']
+        unique_dimkeys = traversal.unique_dimkeys
+        Instrumentation.enable()
+        self.assertTrue(Dimensioned.__dict__['select'] is not select)
+        Instrumentation.disable()
+        self.assertTrue(Dimensioned.__dict__['select'] is select)
+        self.assertTrue(traversal.unique_dimkeys is unique_dimkeys)
+
+    def test_unresolved_hot_point_instruments_nothing(self):
+        select = Dimensioned.__dict__['select']
+        hot_points = Instrumentation.hot_points
+        Instrumentation.hot_points = hot_points + [('holoviews.bogus', None, 'bogus', 'bogus')]
+        try:
+            Instrumentation.enable()
+        finally:
+            Instrumentation.hot_points = hot_points
+        self.assertFalse(Instrumentation.enabled())
+        self.assertTrue(Dimensioned.__dict__['select'] is select)
+
+    def test_disabled_records_nothing(self):
+        self.hmap.select(Frame=1)
+        self.assertEqual(Instrumentation.timers, {})
+
+    def test_timers_per_class(self):
+        Instrumentation.enable()
+        self.hmap.select(Frame=1)
+        self.hmap.select(Frame=2)
+        timer = Instrumentation.timers['HoloMap.select']
+        self.assertEqual(timer.calls, 2)
+        self.assertTrue(timer.total >= timer.maximum > 0)
+
+    def test_construction_counted_once(self):
+        Instrumentation.enable()
+        RasterPlot(self.hmap)
+        self.assertEqual(Instrumentation.timers['RasterPlot construction'].calls, 1)
+
+    def test_range_counters(self):
+        Instrumentation.enable()
+        plot = RasterPlot(self.hmap)
+        pyplot.close(plot())
+        computed = Instrumentation.counters['Ranges computed']
+        cached = Instrumentation.counters.get('Ranges cached', 0)
+        for key in plot.keys:
+            plot.update_frame(key)
+        self.assertEqual(Instrumentation.counters['Ranges computed'], computed)
+        self.assertEqual(Instrumentation.counters['Ranges cached'], cached + len(plot.keys))
+
+    def test_disabled_counts_nothing(self):
+        plot = RasterPlot(self.hmap)
+        pyplot.close(plot())
+        for key in plot.keys:
+            plot.update_frame(key)
+        self.assertEqual(Instrumentation.counters, {})
+
+    def test_timer_and_count(self):
+        with Instrumentation.timer('block'):
+            with Instrumentation.timer('block'):
+                pass
+        Instrumentation.count('items', 3)
+        self.assertEqual(Instrumentation.timers['block'].calls, 2)
+        self.assertEqual(Instrumentation.counters['items'], 3)
+
+    def test_table(self):
+        Instrumentation.enable()
+        self.hmap.select(Frame=1)
+        Instrumentation.count('items')
+        table = Instrumentation.table()
+        self.assertTrue(isinstance(table, Table))
+        self.assertEqual(table.data[('HoloMap.select',)][0], 1)
+        self.assertEqual(table.data[('items',)][0], 1)
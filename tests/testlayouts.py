@@ -1,5 +1,6 @@
 import unittest
-from holoviews import AdjointLayout, NdLayout, GridSpace, Layout, Element
+from holoviews import AdjointLayout, NdLayout, GridSpace, Layout, Element, HoloMap
+from holoviews.core.traversal import unique_dimkeys
 
 
 class CompositeTest(unittest.TestCase):
@@ -59,3 +60,14 @@ class GridTest(CompositeTest):
         keys = [(0,0), (0,1), (1,0), (1,1)]
         grid = GridSpace(zip(keys, vals))
         self.assertEqual(grid.shape, (2,2))
+
+
+class UniqueDimkeysTest(CompositeTest):
+
+    def test_unique_dimkeys_subset_dimensions(self):
+        hmap1 = HoloMap({(a, b): self.view1 for a in range(2) for b in range(2)},
+                        key_dimensions=['A', 'B'])
+        hmap2 = HoloMap({a: self.view2 for a in range(3)}, key_dimensions=['A'])
+        dims, keys = unique_dimkeys(hmap1 + hmap2)
+        self.assertEqual([d.name for d in dims], ['A', 'B'])
+        self.assertEqual(keys, [(0, 0), (0, 1), (1, 0), (1, 1), (2, None)])
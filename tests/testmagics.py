@@ -1,4 +1,5 @@
 from holoviews.core.options import Store
+from holoviews.core.instrumentation import Instrumentation
 
 from holoviews import ipython
 from holoviews.ipython import IPTestCase
@@ -137,6 +138,30 @@ class TestCompositorMagic(ExtensionTestCase):
         self.assertEqual(Compositor.definitions[0].mode, 'data')
 
 
+class TestInstrumentMagic(ExtensionTestCase):
+
+    def setUp(self):
+        super(TestInstrumentMagic, self).setUp()
+        self.cell("from holoviews import HoloMap, Element")
+
+    def tearDown(self):
+        Instrumentation.disable()
+        Instrumentation.reset()
+        super(TestInstrumentMagic, self).tearDown()
+
+    def test_cell_instrument(self):
+        self.cell_magic('instrument', '', "HoloMap({i: Element(None) for i in range(3)}).select(Default=1)")
+        self.assertEqual(Instrumentation.timers['HoloMap.select'].calls, 1)
+        self.assertEqual(Instrumentation.enabled(), False)
+
+    def test_line_instrument_on_off(self):
+        self.line_magic('instrument', 'on')
+        self.assertEqual(Instrumentation.enabled(), True)
+        self.line_magic('instrument', 'off')
+        self.assertEqual(Instrumentation.enabled(), False)
+
+
+
 if __name__ == "__main__":
     import sys
     import nose
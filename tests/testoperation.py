@@ -0,0 +1,213 @@
+"""
+Test cases for the ElementOperations in holoviews.operation.element.
+"""
+import numpy as np
+
+from holoviews import Image, Contours, Curve, Dimension, HSV, HoloMap
+from holoviews.operation.element import contours, marching_squares, \
+    vectorfield, collapse_curve, histogram, PartialHistogram, chain, \
+    transform, threshold, gradient
+from holoviews.operation.normalization import raster_normalization
+from holoviews.core.sheetcoords import SheetCoordinateSystem
+from holoviews.element.comparison import ComparisonTestCase
+
+
+class MarchingSquaresTest(ComparisonTestCase):
+
+    def setUp(self):
+        x, y = np.meshgrid(np.linspace(-1, 1, 9), np.linspace(-1, 1, 9))
+        self.radial = np.sqrt(x**2 + y**2)
+
+    def test_closed_contour(self):
+        [[path]] = marching_squares(self.radial, [0.5])
+        self.assertEqual(path[0], path[-1])
+        radii = np.sqrt(((path-4)**2).sum(axis=1))
+        self.assertTrue(np.all(np.abs(radii - 2) < 0.1))
+
+    def test_open_contours(self):
+        [paths] = marching_squares(self.radial, [1.2])
+        self.assertEqual(len(paths), 4)
+        for path in paths:
+            for point in [path[0], path[-1]]:
+                self.assertTrue(np.isclose(point, 0).any() or np.isclose(point, 8).any())
+
+    def test_multiple_levels(self):
+        traced = marching_squares(self.radial, [0.5, 1.2, 2.0])
+        self.assertEqual([len(paths) for paths in traced], [1, 4, 0])
+
+    def test_crossing_points_interpolated(self):
+        data = np.array([[0, 0, 0], [0, 1, 0], [0, 0, 0]])
+        [[path]] = marching_squares(data, [0.5])
+        self.assertEqual(sorted(map(tuple, path[:-1])),
+                         [(0.5, 1.0), (1.0, 0.5), (1.0, 1.5), (1.5, 1.0)])
+
+
+class ContoursOperationTest(ComparisonTestCase):
+
+    def test_contours_sheet_coordinates(self):
+        data = np.array([[0, 0, 0], [0, 1, 0], [0, 0, 0]])
+        overlay = contours(Image(data, bounds=(-1.5, -1.5, 1.5, 1.5)), levels=(0.5,))
+        contour = overlay.values()[1].last
+        self.assertTrue(isinstance(contour, Contours))
+        self.assertEqual(contour.level, 0.5)
+        self.assertEqual(sorted(map(tuple, contour.data[0][:-1])),
+                         [(-0.5, 0.0), (0.0, -0.5), (0.0, 0.5), (0.5, 0.0)])
+
+
+class VectorFieldOperationTest(ComparisonTestCase):
+
+    def setUp(self):
+        self.angles = Image(np.arange(16).reshape(4, 4)/16.,
+                            value_dimensions=[Dimension('Angle', cyclic=True, range=(0, 1))])
+        self.lengths = Image(np.arange(16).reshape(4, 4)/8.)
+
+    def test_vectorfield_samples(self):
+        vfield = vectorfield(self.angles * self.lengths, rows=2, cols=2)
+        self.assertEqual(vfield.data, np.array([[-1/6., -1/6.,  9/16.,  9/8.],
+                                                [ 1/6., -1/6., 10/16., 10/8.],
+                                                [-1/6.,  1/6.,  5/16.,  5/8.],
+                                                [ 1/6.,  1/6.,  6/16.,  6/8.]]))
+
+    def test_vectorfield_unit_magnitudes(self):
+        vfield = vectorfield(self.angles, rows=2, cols=2)
+        self.assertEqual(vfield.data[:, 3], np.ones(4))
+
+
+class CollapseCurveOperationTest(ComparisonTestCase):
+
+    def setUp(self):
+        xs = np.arange(5)
+        self.overlay = (Curve(np.column_stack([xs, xs])) *
+                        Curve(np.column_stack([xs, xs*3])))
+
+    def test_collapse_curve_axis_function(self):
+        collapsed = collapse_curve(self.overlay)
+        self.assertEqual(collapsed.data[:, 1], np.arange(5)*2.)
+
+    def test_collapse_curve_sequence_function(self):
+        collapsed = collapse_curve(self.overlay, fn=lambda ys: max(ys))
+        self.assertEqual(collapsed.data[:, 1], np.arange(5)*3.)
+
+
+class HSVConversionTest(ComparisonTestCase):
+
+    def test_hsv_to_rgb_matches_colorsys(self):
+        import colorsys
+        hsv = np.random.rand(8, 8, 3)
+        hsv[0, :, 1] = 0
+        hsv[1, :, 0] = 1
+        expected = np.dstack(np.vectorize(colorsys.hsv_to_rgb)(*hsv.transpose(2, 0, 1)))
+        self.assertEqual(HSV(hsv).rgb.data, expected)
+
+
+class HistogramOperationTest(ComparisonTestCase):
+
+    def setUp(self):
+        self.values = np.array([0.05, 0.15, 0.15, 0.35, np.NaN, 0.95, 1.0])
+
+    def test_partial_histogram_matches_numpy(self):
+        values = np.random.randn(1000)
+        partial = PartialHistogram.from_range((-2, 2), 13).update(values)
+        counts, edges = np.histogram(values, bins=13, range=(-2, 2))
+        self.assertEqual(partial.counts, counts.astype(float))
+        self.assertEqual(partial.edges, edges)
+
+    def test_partial_histogram_weights(self):
+        partial = PartialHistogram.from_range((0, 1), 2)
+        partial.update(self.values, np.arange(7.))
+        self.assertEqual(partial.counts, np.array([6., 11.]))
+
+    def test_partial_histogram_merge(self):
+        hist1 = PartialHistogram.from_range((0, 1), 4).update(self.values[:3])
+        hist2 = PartialHistogram.from_range((0, 1), 4).update(self.values[3:])
+        self.assertEqual((hist1 + hist2).counts, np.array([3., 1., 0., 2.]))
+
+    def test_partial_histogram_merge_mismatched_edges(self):
+        with self.assertRaises(ValueError):
+            PartialHistogram.from_range((0, 1), 4) + PartialHistogram.from_range((0, 2), 4)
+
+    def test_partial_histogram_from_chunks(self):
+        hist = PartialHistogram.from_chunks([self.values[:3], self.values[3:]], 4)
+        self.assertEqual(hist.edges, np.linspace(0.05, 1, 5))
+        self.assertEqual(hist.counts, np.array([3., 1., 0., 2.]))
+
+    def test_histogram_cumulative_normed(self):
+        img = Image(self.values[:4].reshape(2, 2))
+        hist = histogram(img, adjoin=False, bin_range=(0, 1), num_bins=4,
+                         cumulative=True)
+        self.assertEqual(hist.data[0], np.array([0.75, 1., 1., 1.]))
+
+    def test_holomap_hist_shared_bins(self):
+        hmap = HoloMap({i: Image(np.eye(2)*(i+1)) for i in range(3)})
+        hists = hmap.hist(adjoin=False, individually=False, num_bins=3)
+        for hist in hists.values():
+            self.assertEqual(hist.data[1], np.array([0., 1., 2., 3.]))
+
+
+class ChainOperationTest(ComparisonTestCase):
+
+    def setUp(self):
+        self.image = Image(np.arange(16.).reshape(4, 4)/16.)
+        self.operations = [transform.instance(operator=lambda x: x*2),
+                           threshold.instance(level=0.5),
+                           gradient.instance(),
+                           threshold.instance(level=0.25, high=2.0)]
+
+    def test_fused_chain_matches_unfused(self):
+        fused = chain(self.image, operations=self.operations)
+        unfused = chain(self.image, operations=self.operations, fuse=False)
+        self.assertEqual(fused.data, unfused.data)
+        self.assertEqual(fused.group, 'Chain')
+
+    def test_fused_chain_preserves_input(self):
+        data = self.image.data.copy()
+        chain(self.image, operations=[transform.instance(), threshold.instance(),
+                                      threshold.instance(level=0.3)])
+        self.assertEqual(self.image.data, data)
+
+    def assert_fused_matches_unfused(self, image, operations):
+        fused = chain(image, operations=operations)
+        unfused = chain(image, operations=operations, fuse=False)
+        self.assertEqual(fused.data, unfused.data)
+        self.assertEqual(fused.value_dimensions, unfused.value_dimensions)
+        self.assertEqual(fused.bounds.lbrt(), unfused.bounds.lbrt())
+
+    def test_fused_normalization_uses_transformed_metadata(self):
+        image = Image(np.arange(16.).reshape(4, 4),
+                      value_dimensions=[Dimension('z', range=(0, 10))])
+        operations = [transform.instance(operator=lambda x: x*100),
+                      raster_normalization.instance()]
+        self.assert_fused_matches_unfused(image, operations)
+
+    def test_fused_normalization_of_gradient(self):
+        operations = [gradient.instance(), raster_normalization.instance(data_range=True)]
+        self.assert_fused_matches_unfused(self.image, operations)
+
+    def test_fused_gradient_of_transformed_cyclic_image(self):
+        image = Image(self.image.data, value_dimensions=[Dimension('z', cyclic=True,
+                                                                   range=(0, 1))])
+        operations = [transform.instance(operator=lambda x: x*2), gradient.instance()]
+        self.assert_fused_matches_unfused(image, operations)
+
+    def test_fused_normalization_by_group(self):
+        image = Image(self.image.data, group='Input')
+        operations = [threshold.instance(level=0.5),
+                      raster_normalization.instance(ranges={('Image', 'Threshold'): {'z': (0, 2)}})]
+        self.assert_fused_matches_unfused(image, operations)
+
+    def test_fused_chain_constructs_single_image(self):
+        operations = [transform.instance(operator=lambda x: x*2),
+                      raster_normalization.instance(), gradient.instance(),
+                      threshold.instance(level=0.3), raster_normalization.instance()]
+        constructed = []
+        init = SheetCoordinateSystem.__init__
+        def counting_init(self, *args, **kwargs):
+            constructed.append(self)
+            init(self, *args, **kwargs)
+        SheetCoordinateSystem.__init__ = counting_init
+        try:
+            fused = chain(self.image, operations=operations)
+        finally:
+            SheetCoordinateSystem.__init__ = init
+        self.assertEqual(len(constructed), 1)
+        self.assertEqual(fused.data, chain(self.image, operations=operations, fuse=False).data)
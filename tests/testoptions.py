@@ -1,5 +1,8 @@
-from holoviews import Store
-from holoviews.core.options import OptionError, Cycle, Options, OptionTree
+import numpy as np
+
+from holoviews import Store, Curve, Image
+from holoviews.core.options import OptionError, Cycle, Options, OptionTree, \
+    Compositor
 from holoviews.element.comparison import ComparisonTestCase
 
 
@@ -220,6 +223,67 @@ class TestOptionTreeFind(ComparisonTestCase):
     def test_optiontree_find_mismatch4(self):
         self.assertEqual(self.options.find('Baz.Baz').options('group').options, dict())
 
+class TestOptionTreeClosestCache(ComparisonTestCase):
+
+    def setUp(self):
+        self.options = OptionTree(groups={'group':  Options()})
+        self.options.Curve = Options('group', kw1='value1')
+        self.curve = Curve([(0, 1)], group='Foo')
+        self.original_options = Store.options
+        Store.options = OptionTree(groups={'group':  Options()})
+        OptionTree.clear_cache()
+
+    def tearDown(self):
+        Store.options = self.original_options
+
+    def test_closest_cache_hits(self):
+        self.options.closest(self.curve, 'group')
+        opts = self.options.closest(self.curve, 'group')
+        self.assertEqual(opts.options, dict(kw1='value1'))
+        self.assertEqual(OptionTree.cache_info(),
+                         dict(hits=1, misses=1, size=1))
+
+    def test_closest_cache_invalidated_on_set(self):
+        self.options.closest(self.curve, 'group')
+        self.options.Curve.Foo = Options('group', kw2='value2')
+        self.assertEqual(self.options.closest(self.curve, 'group').options,
+                         dict(kw1='value1', kw2='value2'))
+        self.assertEqual(OptionTree.cache_info()['hits'], 0)
+
+    def test_closest_cache_per_tree(self):
+        other = OptionTree(groups={'group':  Options()})
+        other.Curve = Options('group', kw3='value3')
+        self.options.closest(self.curve, 'group')
+        self.assertEqual(other.closest(self.curve, 'group').options,
+                         dict(kw3='value3'))
+
+
+class TestCompositorMatch(ComparisonTestCase):
+
+    def setUp(self):
+        self.original_definitions = Compositor.definitions
+        Compositor.definitions = []
+        self.compositor = Compositor('Image.R * Image.G', None, 'RG', 'data')
+        Compositor.register(self.compositor)
+        data = np.zeros((2, 2))
+        self.overlay = (Image(data, group='B') * Image(data, group='R')
+                        * Image(data, group='G'))
+
+    def tearDown(self):
+        Compositor.definitions = self.original_definitions
+
+    def test_strongest_match(self):
+        self.assertEqual(Compositor.strongest_match(self.overlay, 'data'),
+                         (4, self.compositor, (1, 3)))
+
+    def test_strongest_match_mode_mismatch(self):
+        self.assertEqual(Compositor.strongest_match(self.overlay, 'display'), None)
+
+    def test_strongest_match_cache_invalidated(self):
+        Compositor.strongest_match(self.overlay, 'data')
+        self.compositor.mode = 'display'
+        self.assertEqual(Compositor.strongest_match(self.overlay, 'data'), None)
+
 
 
 if __name__ == "__main__":
@@ -0,0 +1,574 @@
+"""
+Test cases for the range computation, frame lookup, parallel
+rendering, animation streaming and pooled rendering of plots.
+"""
+import os
+import base64
+import pickle
+import tempfile
+from io import BytesIO
+
+import numpy as np
+
+from holoviews import (HoloMap, Image, Curve, Histogram, VectorField, Bars, GridSpace,
+                       HeatMap, Raster, Scatter3D, Surface, Table, Layout, Store)
+from holoviews.core.options import Options
+from holoviews.element.comparison import ComparisonTestCase
+
+# Standardize backend due to random inconsistencies
+from matplotlib import pyplot, animation
+from matplotlib.backends.backend_agg import RendererAgg
+pyplot.switch_backend('agg')
+
+import holoviews.plotting as plotting
+from holoviews.plotting import (RasterPlot, CurvePlot, GridPlot, TablePlot,
+                                LayoutPlot, MPLPlotRenderer)
+from holoviews.plotting.plot import PlotContext
+from holoviews.plotting.raster import TextGrid
+
+
+@animation.writers.register('test_cat')
+class CatWriter(animation.MovieWriter):
+    "Writer passing the raw frames through unencoded"
+
+    args_key = 'animation.ffmpeg_args'
+
+    @classmethod
+    def isAvailable(cls):
+        return True
+
+    def _args(self):
+        if self.outfile == '-':
+            return ['cat']
+        return ['sh', '-c', 'cat > "$0"', self.outfile]
+
+
+class PlotRangesTest(ComparisonTestCase):
+
+    def setUp(self):
+        self.holomap = HoloMap({i: Image(np.eye(2)*i) for i in range(1, 4)},
+                               key_dimensions=['Frame'])
+        self.plot = RasterPlot(self.holomap)
+
+    def test_compute_ranges_mapwise(self):
+        ranges = self.plot.compute_ranges(self.plot.map, None, None)
+        self.assertEqual(ranges[('Image',)]['z'], (0., 3.))
+
+    def test_compute_ranges_reuses_table(self):
+        self.plot.compute_ranges(self.plot.map, (2,), None)
+        table_size = len(self.plot._range_table())
+        self.plot.compute_ranges(self.plot.map, (2,), None)
+        self.assertEqual(len(self.plot._range_table()), table_size)
+
+    def test_combine_ranges(self):
+        self.assertEqual(RasterPlot._combine_ranges([(0, 2), (-1, 1), (1, 3)]),
+                         (-1., 3.))
+
+    def test_combine_ranges_nonnumeric(self):
+        combined = RasterPlot._combine_ranges([('a', 'b'), (0, 1)])
+        self.assertTrue(np.isnan(combined[0]) and np.isnan(combined[1]))
+
+
+class GridPlotContextTest(ComparisonTestCase):
+
+    def setUp(self):
+        np.random.seed(42)
+        self.grid = GridSpace({(i, j): HoloMap({k: Curve(np.random.rand(5, 2)*(i+j+1))
+                                                for k in range(3)}, key_dimensions=['Frame'])
+                               for i in range(2) for j in range(2)},
+                              key_dimensions=['x', 'y'])
+
+    def test_subplots_share_collapsed_maps(self):
+        plot = GridPlot(self.grid)
+        maps = [subplot.map for subplot in plot.subplots.values()]
+        self.assertEqual([id(m) for m in maps],
+                         [id(plot.layout[key]) for key in plot.layout.keys()])
+
+    def test_subplots_reuse_context_ranges(self):
+        plot = GridPlot(self.grid)
+        for subplot in plot.subplots.values():
+            self.assertEqual(subplot._range_table(), {})
+        ranges = plot.compute_ranges(plot.layout, plot.keys[-1], None)
+        subplot = plot.subplots[(0, 0)]
+        self.assertEqual(subplot.compute_ranges(subplot.map, plot.keys[-1], ranges),
+                         ranges)
+
+    def test_context_covers_collapsed_items(self):
+        context = PlotContext(self.grid, [(0,)], {})
+        self.assertTrue(context.covers(self.grid[0, 0]))
+        self.assertFalse(context.covers(self.grid[0, 0].clone()))
+
+
+
+class PlotFrameLookupTest(ComparisonTestCase):
+
+    def setUp(self):
+        self.holomap = HoloMap({(i, j): Image(np.eye(2)*i) for i in range(3)
+                                for j in range(2)}, key_dimensions=['A', 'B'])
+
+    def test_element_plot_get_frame(self):
+        plot = RasterPlot(self.holomap)
+        self.assertIs(plot._get_frame((1, 1)), self.holomap.data[(1, 1)])
+
+    def test_element_plot_get_frame_missing(self):
+        plot = RasterPlot(self.holomap)
+        self.assertEqual(plot._get_frame((5, 1)), None)
+
+    def test_grid_plot_get_frame(self):
+        grid = GridSpace({0: self.holomap, 1: self.holomap}, key_dimensions=['X'])
+        plot = GridPlot(grid)
+        frame = plot._get_frame((2, 1))
+        self.assertIs(frame[0], self.holomap.data[(2, 1)])
+        self.assertIs(plot._get_frame((2, 1)), frame)
+
+
+
+class ParallelRenderTest(ComparisonTestCase):
+
+    def setUp(self):
+        self.holomap = HoloMap({i: Image(np.random.rand(5, 5)*i) for i in range(6)},
+                               key_dimensions=['Frame'])
+
+    def test_pipe_writer(self):
+        self.assertTrue(MPLPlotRenderer._pipe_writer('ffmpeg') or
+                        'ffmpeg' not in pyplot.matplotlib.animation.writers.avail)
+        self.assertFalse(MPLPlotRenderer._pipe_writer('ffmpeg_file'))
+        self.assertFalse(MPLPlotRenderer._pipe_writer('missing'))
+
+    def test_render_frames_match_serial(self):
+        renderer = MPLPlotRenderer.instance(dpi=20)
+        plot = renderer.get_plot(self.holomap)
+        figure = plot()
+        serial = []
+        for key in plot.keys:
+            plot.update_frame(key)
+            frame = BytesIO()
+            figure.savefig(frame, format='rgba', dpi=20)
+            serial.append(frame.getvalue())
+        pyplot.close(figure)
+        plotting._init_render_worker(Store.dumps(self.holomap), pickle.dumps(Store.options),
+                                     dict(dpi=20, size=renderer.size, fps=renderer.fps,
+                                          blit=False))
+        try:
+            frames = (plotting._render_frames((3, 6, 'rgba', 20)) +
+                      plotting._render_frames((0, 3, 'rgba', 20)))
+        finally:
+            pyplot.close(plotting._render_state.pop('figure'))
+            plotting._render_state.clear()
+        self.assertEqual(frames, serial[3:] + serial[:3])
+
+    def test_sublabel_not_stacked(self):
+        plot = RasterPlot(self.holomap, sublabel_format='{Alpha}')
+        plot()
+        axis = plot.handles['axis']
+        num_artists = len(axis.artists)
+        plot.update_frame(3)
+        plot.update_frame(4)
+        self.assertEqual(len(axis.artists), num_artists)
+        pyplot.close(plot.handles['fig'])
+
+
+
+class AnimationStreamTest(ComparisonTestCase):
+
+    def setUp(self):
+        plotting.ANIMATION_OPTS['raw'] = ('test_cat', 'raw', {}, [])
+        plotting.STREAM_OPTS['raw'] = ('-', [])
+        plotting.HTML_TAGS['raw'] = ('application/octet-stream', None)
+        self.holomap = HoloMap({i: Image(np.random.rand(5, 5)*i) for i in range(4)},
+                               key_dimensions=['Frame'])
+        self.renderer = MPLPlotRenderer.instance(dpi=20, blit=False)
+        self.data, _ = self.renderer(self.holomap, fmt='raw')
+
+    def tearDown(self):
+        for opts in [plotting.ANIMATION_OPTS, plotting.STREAM_OPTS, plotting.HTML_TAGS]:
+            opts.pop('raw')
+
+    def test_stream_matches_temporary_file(self):
+        plotting.STREAM_OPTS.pop('raw')
+        self.assertFalse(self.renderer._streamable('raw', 'test_cat'))
+        data, _ = self.renderer(self.holomap, fmt='raw')
+        self.assertEqual(data, self.data)
+        plotting.STREAM_OPTS['raw'] = ('-', [])
+
+    def test_stream_to_callable(self):
+        chunks = []
+        plot = self.renderer.get_plot(self.holomap)
+        self.renderer._anim_data(self.holomap, plot, 'raw', chunks.append)
+        self.assertEqual(b''.join(chunks), self.data)
+
+    def test_stream_to_base64_sink(self):
+        sink = plotting.Base64Sink()
+        plot = self.renderer.get_plot(self.holomap)
+        self.renderer.anim_stream(plot.anim(fps=self.renderer.fps), 'raw', 'test_cat', sink)
+        self.assertEqual(sink.getvalue(), base64.b64encode(self.data).decode('utf-8'))
+
+    def test_base64_sink_unaligned_chunks(self):
+        sink = plotting.Base64Sink()
+        data = bytes(bytearray(range(256)))
+        for start, stop in [(0, 1), (1, 5), (5, 5), (5, 100), (100, 256)]:
+            sink(data[start:stop])
+        self.assertEqual(sink.getvalue(), base64.b64encode(data).decode('utf-8'))
+
+    def test_save_streams_to_file(self):
+        basename = os.path.join(tempfile.mkdtemp(), 'anim')
+        self.renderer.save(self.holomap, basename, fmt='raw')
+        with open(basename + '.raw', 'rb') as f:
+            self.assertEqual(f.read(), self.data)
+        os.remove(basename + '.raw')
+        os.rmdir(os.path.dirname(basename))
+
+    def test_parallel_frames_match_serial(self):
+        renderer = MPLPlotRenderer.instance(dpi=20, blit=False, processes=2)
+        data, _ = renderer(self.holomap, fmt='raw')
+        self.assertEqual(data, self.data)
+
+    def test_writer_settings(self):
+        writer = plotting.StreamingWriter(CatWriter(fps=7, extra_args=['-x']))
+        self.assertEqual((writer.fps, writer.extra_args, writer.frame_format),
+                         (7, ['-x'], 'rgba'))
+
+    def test_writer_without_command_line(self):
+        writer = plotting.StreamingWriter(animation.MovieWriter(extra_args=[]))
+        with self.assertRaises(NotImplementedError):
+            writer.setup(pyplot.figure(), '-', 20)
+
+    def test_encoder_failure(self):
+        writer = plotting.StreamingWriter(CatWriter(), lambda chunk: None)
+        writer._args = lambda: ['sh', '-c', 'echo failed >&2; exit 1']
+        writer.setup(pyplot.figure(), '-', 20)
+        with self.assertRaisesRegexp(IOError, 'failed'):
+            writer.cleanup()
+
+
+
+class BlitTest(ComparisonTestCase):
+
+    def setUp(self):
+        xs = np.linspace(0, 1, 20)
+        self.holomap = HoloMap({i: Curve(np.column_stack([xs, np.sin(xs*i)]))
+                                for i in range(4)}, key_dimensions=['Frame'])
+
+    def render(self, plot, blit):
+        figure = plot()
+        frames = list(plotting._raw_frames(plot, figure, plot.keys, 'rgba', 20, blit))
+        pyplot.close(figure)
+        return [np.frombuffer(frame, np.uint8) for frame in frames]
+
+    def test_blitted_frames_match_render(self):
+        renderer = MPLPlotRenderer.instance(dpi=20)
+        blitted = self.render(renderer.get_plot(self.holomap), True)
+        rendered = self.render(renderer.get_plot(self.holomap), False)
+        for blit, render in zip(blitted, rendered):
+            self.assertEqual(blit.shape, render.shape)
+            # Only the pixels where the curve overlaps the spines differ
+            self.assertTrue((blit != render).mean() < 0.01)
+
+    def test_blit_disabled_by_default(self):
+        self.assertFalse(MPLPlotRenderer.blit)
+        plot = MPLPlotRenderer.instance(dpi=20).get_plot(self.holomap)
+        figure = plot()
+        frames = list(plotting._raw_frames(plot, figure, plot.keys, 'rgba', 20))
+        self.assertFalse(hasattr(plot, '_blit_background_'))
+        pyplot.close(figure)
+        self.assertEqual(len(frames), len(plot.keys))
+
+    def test_background_cached(self):
+        plot = MPLPlotRenderer.instance().get_plot(self.holomap)
+        pyplot.close(plot())
+        plot.blit(plot.keys[0])
+        background = plot._blit_background_
+        for key in plot.keys:
+            plot.blit(key)
+        self.assertIs(plot._blit_background_, background)
+
+    def test_overlay_dynamic_artists(self):
+        overlay = self.holomap * self.holomap
+        plot = MPLPlotRenderer.instance().get_plot(overlay)
+        pyplot.close(plot())
+        lines = [a for a in plot.dynamic_artists() if a in plot.handles['axis'].lines]
+        self.assertEqual(len(lines), 2)
+
+    def test_anim_blit(self):
+        plot = MPLPlotRenderer.instance().get_plot(self.holomap)
+        self.assertTrue(plot.anim()._blit)
+
+    def test_framewise_not_blittable(self):
+        holomap = self.holomap({'Curve': {'norm': Options(framewise=True)}})
+        plot = CurvePlot(holomap, dimensions=holomap.key_dimensions)
+        self.assertFalse(plot.blittable())
+        self.assertFalse(plot.anim()._blit)
+
+    def test_layout_blittable(self):
+        plot = MPLPlotRenderer.instance().get_plot(self.holomap + self.holomap)
+        self.assertTrue(plot.blittable())
+
+
+
+class BarCollectionTest(ComparisonTestCase):
+
+    def test_histogram_single_collection(self):
+        hist = Histogram(np.arange(4), np.arange(5))
+        plot = MPLPlotRenderer.instance().get_plot(hist)
+        pyplot.close(plot())
+        bars = plot.handles['bars']
+        self.assertEqual(plot.handles['axis'].collections, [bars])
+        self.assertEqual(len(bars.get_paths()), 4)
+        self.assertEqual(bars.get_paths()[2].vertices[:4],
+                         np.array([[2, 0], [3, 0], [3, 2], [2, 2]]))
+
+    def test_histogram_update_bin_count(self):
+        holomap = HoloMap({i: Histogram(np.ones(i+2), np.arange(i+3))
+                           for i in range(3)}, key_dimensions=['Frame'])
+        plot = MPLPlotRenderer.instance().get_plot(holomap)
+        pyplot.close(plot())
+        plot.update_frame(0)
+        self.assertEqual(len(plot.handles['bars'].get_paths()), 2)
+
+    def test_vertical_histogram(self):
+        hist = Histogram(np.arange(4), np.arange(5))(plot=dict(orientation='vertical'))
+        plot = MPLPlotRenderer.instance().get_plot(hist)
+        pyplot.close(plot())
+        vertices = plot.handles['bars'].get_paths()[2].vertices[:4]
+        self.assertEqual(vertices, np.array([[0, 2], [0, 3], [2, 3], [2, 2]]))
+
+    def test_stacked_bars(self):
+        bars = Bars([(('A', 'p'), 1), (('A', 'q'), 2), (('B', 'p'), 3)],
+                    key_dimensions=['g', 's'], value_dimensions=['v'])
+        plot = MPLPlotRenderer.instance().get_plot(bars(plot=dict(category_index=2, stack_index=1)))
+        pyplot.close(plot())
+        verts = plot._bar_verts(bars)
+        self.assertEqual(verts[:, 0, 1], np.array([0, 1, 0, 3]))
+        self.assertEqual(verts[:, 2, 1], np.array([1, 3, 3, np.NaN]))
+
+
+    def test_center_aligned_bars(self):
+        holomap = HoloMap({i: Bars([(('A',), i+1), (('B',), i+2)], key_dimensions=['x'],
+                                   value_dimensions=['y'])(style=dict(align='center'))
+                           for i in range(2)}, key_dimensions=['Frame'])
+        plot = MPLPlotRenderer.instance().get_plot(holomap)
+        pyplot.close(plot())
+        edges = np.array([p.vertices[0, 0] for bars in plot.handles['bars'].values()
+                          for p in bars.get_paths()])
+        expected = plot.bar_positions - plot.bar_width/2.
+        self.assertEqual(edges, expected)
+        plot.update_frame(0)
+        edges = np.array([p.vertices[0, 0] for bars in plot.handles['bars'].values()
+                          for p in bars.get_paths()])
+        self.assertEqual(edges, expected)
+
+
+
+class TextCountingRenderer(RendererAgg):
+
+    def draw_text(self, *args, **kwargs):
+        self.texts = getattr(self, 'texts', 0) + 1
+
+
+
+class HeatMapValuesTest(ComparisonTestCase):
+
+    def test_values_single_artist(self):
+        heatmap = HeatMap({(0, 0): 1, (1, 0): 2.5, (0, 1): np.NaN})
+        plot = RasterPlot(heatmap, show_values=True)
+        pyplot.close(plot())
+        axis, annotations = plot.handles['axis'], plot.handles['annotations']
+        self.assertEqual(axis.texts, [])
+        self.assertIn(annotations, axis.artists)
+        self.assertEqual(list(annotations._strings[annotations._codes]),
+                         ['1', '2.5', '', ''])
+
+    def test_values_updated(self):
+        holomap = HoloMap({i: HeatMap({(0, 0): i, (1, 1): i+1}) for i in range(2)},
+                          key_dimensions=['Frame'])
+        plot = RasterPlot(holomap, show_values=True)
+        pyplot.close(plot())
+        annotations = plot.handles['annotations']
+        plot.update_frame(0)
+        self.assertIs(plot.handles['annotations'], annotations)
+        self.assertEqual(list(annotations._strings[annotations._codes]),
+                         ['0', '', '', '1'])
+
+    def test_textgrid_skips_small_cells(self):
+        fig = pyplot.figure(figsize=(2, 2), dpi=72)
+        axis = fig.add_subplot(111)
+        for size, drawn in [(2, 4), (200, 0)]:
+            grid = TextGrid(np.full((size, size), '10', dtype=object),
+                            transform=axis.transAxes)
+            axis.add_artist(grid)
+            renderer = TextCountingRenderer(144, 144, 72)
+            grid.draw(renderer)
+            self.assertEqual(getattr(renderer, 'texts', 0), drawn)
+        pyplot.close(fig)
+
+
+class TablePlotTest(ComparisonTestCase):
+
+    def setUp(self):
+        self.table = Table({(i,): (i, 'v%d' % i) for i in range(10)},
+                           key_dimensions=['x'], value_dimensions=['y', 'z'])
+
+    def cell_text(self, plot, col=0):
+        cells = plot.handles['table'].get_celld()
+        rows = sorted(r for r, c in cells if c == col)
+        return [cells[(r, col)].get_text().get_text() for r in rows]
+
+    def test_summarized_rows(self):
+        plot = TablePlot(self.table, max_rows=5)
+        pyplot.close(plot())
+        self.assertEqual(self.cell_text(plot), ['x', '0', '...', '8', '9'])
+
+    def test_summarized_columns(self):
+        plot = TablePlot(self.table, max_cols=2)
+        pyplot.close(plot())
+        self.assertEqual(self.cell_text(plot, 1)[:2], ['...', '...'])
+
+    def test_paginated_keys(self):
+        plot = TablePlot(self.table, max_rows=4, paginate=True)
+        self.assertEqual([d.name for d in plot.dimensions], ['Row'])
+        self.assertEqual(plot.keys, [(0,), (3,), (6,), (9,)])
+
+    def test_paginated_update(self):
+        plot = TablePlot(self.table, max_rows=4, paginate=True)
+        pyplot.close(plot())
+        self.assertEqual(self.cell_text(plot, 2), ['z', 'v9', '', ''])
+        plot.update_frame((3,))
+        self.assertEqual(self.cell_text(plot, 2), ['z', 'v3', 'v4', 'v5'])
+
+    def test_paginated_holomap(self):
+        holomap = HoloMap({i: self.table for i in range(2)}, key_dimensions=['Frame'])
+        plot = TablePlot(holomap, max_rows=6, paginate=True)
+        self.assertEqual([d.name for d in plot.dimensions], ['Frame', 'Row'])
+        self.assertEqual(plot.keys, [(0, 0), (0, 5), (1, 0), (1, 5)])
+
+    def test_paginated_holomap_pages_per_table(self):
+        tables = [Table({(i,): (i, 'v%d' % i) for i in range(rows)},
+                        key_dimensions=['x'], value_dimensions=['y', 'z'])
+                  for rows in [20, 30, 40]]
+        holomap = HoloMap(list(enumerate(tables)), key_dimensions=['Frame'])
+        plot = TablePlot(holomap, max_rows=10, paginate=True)
+        self.assertEqual([k for k in plot.keys if k[0] == 0], [(0, 0), (0, 9), (0, 18)])
+        self.assertEqual([k for k in plot.keys if k[0] == 2],
+                         [(2, 0), (2, 9), (2, 18), (2, 27), (2, 36)])
+
+
+class Plot3DUpdateTest(ComparisonTestCase):
+
+    def setUp(self):
+        np.random.seed(42)
+        self.renderer = MPLPlotRenderer.instance(fig='png', dpi=50)
+
+    def render_frame(self, plot, key):
+        plot.update_frame(key)
+        return self.renderer.figure_data(plot.handles['fig'], 'png')
+
+    def assert_updates_match(self, holomap):
+        plot = self.renderer.get_plot(holomap)
+        pyplot.close(plot())
+        for key in list(holomap.keys())[::-1]:
+            fresh = self.renderer.get_plot(holomap)
+            pyplot.close(fresh())
+            self.assertEqual(self.render_frame(plot, key), self.render_frame(fresh, key))
+        return plot
+
+    def test_scatter3d_updated_in_place(self):
+        holomap = HoloMap({i: Scatter3D(np.random.rand(10, 3)) for i in range(3)},
+                          key_dimensions=['Frame'])
+        plot = self.assert_updates_match(holomap)
+        self.assertEqual(plot.handles['axis'].collections, [plot.handles['scatter']])
+
+    def test_surface_updated_in_place(self):
+        holomap = HoloMap({i: Surface(np.random.rand(5, 5)) for i in range(3)},
+                          key_dimensions=['Frame'])
+        plot = self.assert_updates_match(holomap)
+        self.assertEqual(plot.handles['axis'].collections, [plot.handles['surface']])
+
+    def test_3d_title_position_stable(self):
+        holomap = HoloMap({i: Surface(np.random.rand(5, 5)) for i in range(3)},
+                          key_dimensions=['Frame'])
+        plot = self.renderer.get_plot(holomap)
+        pyplot.close(plot())
+        title = plot.handles['axis'].title
+        position = title.get_position()
+        for key in [0, 1, 0]:
+            plot.update_frame(key)
+        self.assertEqual(title.get_position(), position)
+
+
+class LayoutPlotTest(ComparisonTestCase):
+
+    def setUp(self):
+        np.random.seed(42)
+
+    def test_layout_sublabels_beyond_alphabet(self):
+        layout = Layout.from_values([Curve(np.random.rand(3, 2)) for i in range(28)])
+        plot = LayoutPlot(layout, sublabel_format='{Alpha}')
+        pyplot.close(plot())
+        labels = [subplot.subplots['main']._sublabel.txt.get_text()
+                  for subplot in plot.subplots.values()]
+        self.assertEqual(sorted(labels, key=lambda l: (len(l), l))[-3:], ['Z', 'AA', 'AB'])
+
+    def test_layout_axes_replace_figure_axis(self):
+        layout = Curve(np.random.rand(3, 2)) + Curve(np.random.rand(3, 2))
+        plot = LayoutPlot(layout)
+        fig = plot()
+        self.assertEqual(len(fig.axes), 2)
+        pyplot.close(fig)
+
+    def test_triple_adjoint_layout(self):
+        img = Image(np.random.rand(5, 5))
+        layout = (img.hist() << img.hist(adjoin=False)) + Curve(np.random.rand(5, 2))
+        plot = LayoutPlot(layout)
+        pyplot.close(plot())
+        self.assertEqual(sorted(plot.subplots[(0, 0)].subplots.keys()),
+                         ['main', 'right', 'top'])
+
+
+
+class PlotPoolTest(ComparisonTestCase):
+
+    def setUp(self):
+        np.random.seed(42)
+        self.renderer = MPLPlotRenderer.instance(fig='png', dpi=50)
+        self.pooled = MPLPlotRenderer.instance(fig='png', dpi=50, pool_size=2)
+
+    def assert_pooled_match(self, elements):
+        for element in elements:
+            self.assertEqual(self.pooled(element)[0], self.renderer(element)[0])
+
+    def test_pooled_curves_match(self):
+        self.assert_pooled_match([Curve(np.random.rand(10, 2)) for _ in range(3)])
+
+    def test_pooled_images_match(self):
+        self.assert_pooled_match([Image(np.random.rand(5, 5)) for _ in range(3)])
+
+    def test_pooled_images_with_bounds_match(self):
+        self.assert_pooled_match([Image(np.random.rand(5, 5)),
+                                  Image(np.random.rand(5, 5), bounds=(0, 0, 3, 8)),
+                                  Image(np.random.rand(5, 5))])
+
+    def test_pooled_rasters_match(self):
+        self.assert_pooled_match([Raster(np.random.rand(5, 5)),
+                                  Raster(np.random.rand(3, 8))])
+
+    def test_pooled_vector_fields_match(self):
+        self.assert_pooled_match([VectorField(np.random.rand(5, 4)) for _ in range(3)])
+
+    def test_pooled_plot_reused(self):
+        plot = self.pooled._plot_format(Curve([(0, 0), (1, 1)]), None)[1]
+        self.assertIs(self.pooled._plot_format(Curve([(0, 1), (1, 0)]), None)[1], plot)
+
+    def test_pool_options_signature(self):
+        plot = self.pooled._plot_format(Curve([(0, 0), (1, 1)]), None)[1]
+        styled = Curve([(0, 0), (1, 1)])(style=dict(color='r'))
+        self.assertIsNot(self.pooled._plot_format(styled, None)[1], plot)
+
+    def test_pool_eviction(self):
+        for element in [Curve([(0, 0)]), Image(np.eye(2)), VectorField(np.eye(4))]:
+            self.pooled(element)
+        self.assertEqual(len(self.pooled._plot_pool), 2)
+
+    def test_bars_not_pooled(self):
+        bars = Bars([(('A',), 1)], key_dimensions=['x'], value_dimensions=['y'])
+        self.pooled(bars)
+        self.assertFalse(hasattr(self.pooled, '_plot_pool'))
@@ -1,19 +1,38 @@
 """
 Test cases for the HTML/JavaScript scrubber and widgets.
 """
+import os
 import re
+import sys
+import json
+import time
+import zlib
+import base64
+import shutil
+import tempfile
+from io import BytesIO
+try:
+    from StringIO import StringIO
+    from urllib2 import urlopen, Request, HTTPError
+except ImportError:
+    from io import StringIO
+    from urllib.request import urlopen, Request
+    from urllib.error import HTTPError
 from hashlib import sha256
 import numpy as np
 
 from holoviews.ipython import IPTestCase
-from holoviews.ipython.widgets import ScrubberWidget, SelectionWidget
+from holoviews.ipython.delta import DeltaEncoder
+from holoviews.ipython.magics import OutputMagic
+from holoviews.ipython.widgets import (ScrubberWidget, SelectionWidget,
+                                       FrameCache, FrameBlob, WidgetRegistry)
 
 # Standardize backend due to random inconsistencies
 from matplotlib import pyplot
 pyplot.switch_backend('agg')
 
-from holoviews import Image, HoloMap
-from holoviews.plotting import RasterPlot
+from holoviews import Image, Curve, HoloMap
+from holoviews.plotting import RasterPlot, CurvePlot
 
 def digest_data(data):
     hashfn = sha256()
@@ -63,6 +82,381 @@ class TestWidgets(IPTestCase):
         self.assertEqual(digest_data(html), '41b4c724661eac26254c3202348d71281e1b0275421d2134e46e2ac594eeb620')
 
 
+
+class TestLazyWidgets(IPTestCase):
+
+    def setUp(self):
+        super(TestLazyWidgets, self).setUp()
+        holomap = HoloMap([(i, Image(np.eye(2)*i)) for i in range(10)],
+                          key_dimensions=['test'])
+        self.plot = RasterPlot(holomap)
+        self.frames = ScrubberWidget(self.plot).frames
+
+    def request_frame(self, widget, idx):
+        stdout, sys.stdout = sys.stdout, StringIO()
+        try:
+            widget.request_frame(idx)
+            return json.loads(sys.stdout.getvalue())
+        finally:
+            sys.stdout = stdout
+
+    def test_lazy_scrubber_renders_initial_frame(self):
+        widget = ScrubberWidget(self.plot, lazy=True)
+        self.assertEqual(list(widget.frames.values()), [self.frames[0]])
+        self.assertEqual(len(widget._frame_cache), 1)
+
+    def test_lazy_selection_renders_initial_frame(self):
+        widget = SelectionWidget(self.plot, lazy=True)
+        self.assertEqual(list(widget.frames.keys()), [(0,)])
+
+    def test_lazy_scrubber_request_frame(self):
+        widget = ScrubberWidget(self.plot, lazy=True, prefetch=0)
+        self.assertEqual(self.request_frame(widget, 3), self.frames[3])
+        self.assertEqual(len(widget._frame_cache), 2)
+
+    def cached_frames(self, widget, count):
+        for _ in range(100):
+            if len(widget._frame_cache) == count: break
+            time.sleep(0.05)
+        options = widget._frame_options()
+        return [idx for idx, key in enumerate(widget.keys)
+                if (key, options) in widget._frame_cache]
+
+    def test_lazy_scrubber_prefetch(self):
+        widget = ScrubberWidget(self.plot, lazy=True, prefetch=2)
+        self.request_frame(widget, 5)
+        self.assertEqual(self.cached_frames(widget, 4), [0, 5, 6, 7])
+        self.request_frame(widget, 4)
+        self.assertEqual(self.cached_frames(widget, 7), [0, 2, 3, 4, 5, 6, 7])
+
+    def test_lazy_scrubber_registered(self):
+        widget = ScrubberWidget(self.plot, lazy=True)
+        html = widget()
+        widget_id = [k for k, w in widget.widgets.items() if w is widget][0]
+        self.assertTrue('_anim_img%s' % widget_id in html)
+        widget.widgets.pop(widget_id)
+
+    def test_prefetch_disabled_by_default(self):
+        widget = ScrubberWidget(self.plot, lazy=True)
+        self.request_frame(widget, 5)
+        self.assertEqual(widget._prefetch_thread, None)
+        self.assertEqual(len(widget._frame_cache), 2)
+
+    def test_prefetch_thread_exits_when_drained(self):
+        widget = ScrubberWidget(self.plot, lazy=True, prefetch=2)
+        self.request_frame(widget, 5)
+        self.cached_frames(widget, 4)
+        for _ in range(100):
+            if widget._prefetch_thread is None: break
+            time.sleep(0.05)
+        self.assertEqual(widget._prefetch_thread, None)
+
+    def wait_prefetched(self, widget):
+        for _ in range(100):
+            if widget._prefetch_thread is None: break
+            time.sleep(0.05)
+
+    def test_prefetch_limited_by_cache_size(self):
+        widget = ScrubberWidget(self.plot, lazy=True, prefetch=5, cache_size=2)
+        self.request_frame(widget, 5)
+        self.wait_prefetched(widget)
+        self.assertEqual(self.cached_frames(widget, 2), [5, 6])
+
+    def test_prefetch_continues_past_cache_size(self):
+        widget = ScrubberWidget(self.plot, lazy=True, prefetch=1, cache_size=3)
+        for idx in range(6):
+            self.request_frame(widget, idx)
+            self.wait_prefetched(widget)
+        options = widget._frame_options()
+        self.assertTrue((widget.keys[6], options) in widget._frame_cache)
+        self.assertEqual(len(widget._frame_cache), 3)
+
+    def test_released_widget_does_not_prefetch(self):
+        widget = ScrubberWidget(self.plot, lazy=True, prefetch=2)
+        widget.release()
+        self.request_frame(widget, 5)
+        self.assertEqual(widget._prefetch_thread, None)
+
+    def test_registry_releases_least_recently_used(self):
+        registry = WidgetRegistry(2)
+        widgets = [ScrubberWidget(self.plot, lazy=True) for _ in range(3)]
+        registry['a'], registry['b'] = widgets[:2]
+        registry['a']
+        registry['c'] = widgets[2]
+        self.assertEqual(sorted(k for k, _ in registry.items()), ['a', 'c'])
+        self.assertTrue(widgets[1]._released)
+        self.assertFalse(widgets[0]._released)
+        with self.assertRaises(KeyError):
+            registry['b']
+
+    def test_frame_cache_evicts_least_recently_used(self):
+        cache = FrameCache(2)
+        cache['a'] = 1
+        cache['b'] = 2
+        cache.get('a')
+        cache['c'] = 3
+        self.assertEqual(sorted(cache._frames.keys()), ['a', 'c'])
+
+
+
+class TestFrameServer(IPTestCase):
+
+    def setUp(self):
+        super(TestFrameServer, self).setUp()
+        holomap = HoloMap([(i, Image(np.eye(2)*i)) for i in range(3)],
+                          key_dimensions=['test'])
+        self.plot = RasterPlot(holomap)
+        self.frames = ScrubberWidget(self.plot).frames
+        self.json_path = tempfile.mkdtemp()
+        self.widget = ScrubberWidget(self.plot, serve=True, json_path=self.json_path)
+        self.html = self.widget()
+        self.server = ScrubberWidget.frame_server
+        self.id = [k for k, w in self.server.widgets.items() if w is self.widget][0]
+
+    def tearDown(self):
+        self.server.stop()
+        ScrubberWidget.frame_server = None
+        shutil.rmtree(self.json_path)
+        super(TestFrameServer, self).tearDown()
+
+    def request(self, path, **headers):
+        return urlopen(Request(self.server.url + path, headers=headers))
+
+    def frame_path(self, idx, id=None):
+        id = self.id if id is None else id
+        return '/%s/fig_%s/%d' % (self.server.token(id), id, idx)
+
+    def test_served_widget_embeds_no_frames(self):
+        self.assertEqual(self.widget.frames, {})
+        self.assertTrue('%s/%s' % (self.server.url, self.server.token(self.id)) in self.html)
+
+    def test_served_selection_widget_renders_on_demand(self):
+        renders = []
+        class CountingWidget(SelectionWidget):
+            def _plot_figure(self, idx):
+                renders.append(idx)
+                return super(CountingWidget, self)._plot_figure(idx)
+        widget = CountingWidget(self.plot, serve=True, json_path=self.json_path)
+        widget()
+        self.assertEqual(renders, [])
+        id = [k for k, w in self.server.widgets.items() if w is widget][0]
+        response = self.request(self.frame_path(1, id))
+        self.assertEqual(response.read().decode('utf-8'), str(self.frames[1]))
+        self.assertEqual(renders, [1])
+
+    def test_serve_frame(self):
+        response = self.request(self.frame_path(1))
+        self.assertEqual(response.read().decode('utf-8'), str(self.frames[1]))
+        self.assertEqual(response.info().get('Access-Control-Allow-Origin'), None)
+
+    def test_serve_frame_to_requesting_origin(self):
+        response = self.request(self.frame_path(1), Origin='http://localhost:8888')
+        self.assertEqual(response.info()['Access-Control-Allow-Origin'],
+                         'http://localhost:8888')
+
+    def expect_error(self, path, code):
+        try:
+            self.request(path, Origin='http://example.com')
+            raise AssertionError("Request for %s succeeded" % path)
+        except HTTPError as e:
+            self.assertEqual(e.code, code)
+            self.assertEqual(e.info().get('Access-Control-Allow-Origin'), None)
+
+    def test_serve_frame_requires_token(self):
+        self.expect_error('/fig_%s/1' % self.id, 404)
+        self.expect_error('/%s/fig_%s/1' % ('0'*64, self.id), 403)
+
+    def test_serve_token_of_other_widget_rejected(self):
+        token = self.server.token('other')
+        self.expect_error('/%s/fig_%s/1' % (token, self.id), 403)
+
+    def test_server_releases_least_recently_used_widgets(self):
+        self.request(self.frame_path(0)).read()
+        for _ in range(self.server.max_widgets):
+            ScrubberWidget(self.plot, serve=True, json_path=self.json_path)()
+        self.assertEqual(self.server.widgets.get(self.id), None)
+        self.assertTrue(self.widget._released)
+        self.assertFalse(any(key[0] == self.id for key in self.server._index))
+        self.expect_error(self.frame_path(0), 404)
+
+    def test_serve_frame_not_modified(self):
+        etag = self.request(self.frame_path(2)).info()['ETag']
+        try:
+            self.request(self.frame_path(2), **{'If-None-Match': etag})
+            raise AssertionError("Frame was not revalidated")
+        except HTTPError as e:
+            self.assertEqual(e.code, 304)
+
+    def test_serve_frame_cached_on_disk(self):
+        self.request(self.frame_path(0)).read()
+        self.request(self.frame_path(0)).read()
+        cache_path = self.server.cache_path
+        self.assertEqual(len(os.listdir(cache_path)), 1)
+
+    def test_serve_binary_frame(self):
+        widget = ScrubberWidget(self.plot, serve=True, frame_encoding='binary',
+                                json_path=self.json_path)
+        widget()
+        id = [k for k, w in self.server.widgets.items() if w is widget][0]
+        response = self.request(self.frame_path(1, id))
+        self.assertEqual(response.info()['Content-Type'], 'image/png')
+        self.assertEqual(response.read(), widget.get_frame(1))
+
+    def test_serve_missing_frame(self):
+        try:
+            self.request(self.frame_path(5))
+            raise AssertionError("Missing frame was served")
+        except HTTPError as e:
+            self.assertEqual(e.code, 404)
+
+
+class TestBinaryFrames(IPTestCase):
+
+    def setUp(self):
+        super(TestBinaryFrames, self).setUp()
+        holomap = HoloMap([(i, Image(np.eye(2)*i)) for i in range(3)],
+                          key_dimensions=['test'])
+        self.plot = RasterPlot(holomap)
+        self.fig = OutputMagic.options['fig']
+
+    def tearDown(self):
+        OutputMagic.options['fig'] = self.fig
+        super(TestBinaryFrames, self).tearDown()
+
+    def test_frame_blob(self):
+        blob = FrameBlob()
+        blob.append(0, b'abc')
+        blob.append(1, b'de')
+        self.assertEqual(blob.data, b'abcde')
+        self.assertEqual(blob.index, {0: (0, 3), 1: (3, 2)})
+        self.assertEqual(blob[1], b'de')
+
+    def test_binary_png_frames(self):
+        OutputMagic.options['fig'] = 'png'
+        widget = ScrubberWidget(self.plot, frame_encoding='binary')
+        data = json.loads(widget.get_frames("test"))
+        self.assertEqual(data['mime_type'], 'image/png')
+        self.assertFalse(data['compressed'])
+        blob = base64.b64decode(data['blob'])
+        for idx, frame in widget.frames.items():
+            offset, length = data['index'][str(idx)]
+            self.assertEqual(blob[offset:offset+length], frame)
+            self.assertTrue(frame.startswith(b'\x89PNG'))
+
+    def test_binary_svg_frames_compressed(self):
+        OutputMagic.options['fig'] = 'svg'
+        widget = ScrubberWidget(self.plot, frame_encoding='binary')
+        svg = zlib.decompress(widget.frames[0]).decode('utf-8')
+        self.assertTrue('<svg' in svg)
+        self.assertEqual(widget._frame_content(0)[1:], ('image/svg+xml', 'deflate'))
+
+    def payload_size(self, encoding):
+        widget = ScrubberWidget(self.plot, frame_encoding=encoding)
+        return len(str(widget.get_frames("test")))
+
+    def test_binary_svg_payload_smaller(self):
+        OutputMagic.options['fig'] = 'svg'
+        self.assertTrue(self.payload_size('binary') < self.payload_size('html') / 2.)
+
+    def test_binary_png_payload_not_larger(self):
+        OutputMagic.options['fig'] = 'png'
+        self.assertTrue(self.payload_size('binary') <= self.payload_size('html'))
+
+    def test_binary_selection_frames(self):
+        widget = SelectionWidget(self.plot, frame_encoding='binary')
+        data = json.loads(widget.get_frames("test"))
+        self.assertEqual(sorted(data['index'].keys()), ['0', '1', '2'])
+
+    def test_binary_widget_html(self):
+        html = ScrubberWidget(self.plot, frame_encoding='binary')()
+        self.assertTrue('BinaryFrames' in html)
+
+    def test_binary_export_json_raises(self):
+        widget = ScrubberWidget(self.plot, frame_encoding='binary', export_json=True,
+                                json_path=tempfile.mkdtemp())
+        try:
+            self.assertRaises(ValueError, widget.get_frames, "test")
+        finally:
+            shutil.rmtree(widget.json_path)
+
+
+
+class TestDeltaFrames(IPTestCase):
+
+    def setUp(self):
+        super(TestDeltaFrames, self).setUp()
+        holomap = HoloMap([(i, Image(np.eye(4)*i)) for i in range(3)],
+                          key_dimensions=['test'])
+        self.plot = RasterPlot(holomap)
+
+    def render(self, fig):
+        data = BytesIO()
+        fig.canvas.print_figure(data, format='png', dpi=72,
+                                facecolor=fig.get_facecolor())
+        data.seek(0)
+        return pyplot.imread(data)
+
+    def test_delta_frames(self):
+        encoder = DeltaEncoder(dpi=72)
+        frames = [encoder(self.plot[i]) for i in range(3)]
+        self.assertTrue('background' in frames[0])
+        self.assertEqual(list(frames[0]['artists'].keys()), ['0-image-0', '0-text-1'])
+        self.assertFalse('background' in frames[1])
+        self.assertEqual(frames[1]['artists']['0-text-1']['text'],
+                         self.plot[1].axes[0].title.get_text())
+
+    def test_delta_frames_unchanged_artists(self):
+        holomap = HoloMap([(i, Curve([(0, 0), (1, 1)], label='Curve'))
+                           for i in range(2)], key_dimensions=['test'])
+        plot = CurvePlot(holomap, show_title=False)
+        encoder = DeltaEncoder(dpi=72)
+        encoder(plot[0])
+        self.assertEqual(encoder(plot[1])['artists'], {})
+
+    def test_delta_keyframe_interval(self):
+        encoder = DeltaEncoder(dpi=72, keyframe_interval=2)
+        frames = [encoder(self.plot[i]) for i in range(3)]
+        self.assertEqual(['background' in f for f in frames], [True, False, True])
+
+    def test_delta_restores_dpi(self):
+        fig = self.plot[0]
+        dpi = fig.dpi
+        DeltaEncoder(dpi=int(dpi)//2)(fig, self.plot)
+        self.assertEqual(fig.dpi, dpi)
+
+    def test_delta_background_cached(self):
+        encoder = DeltaEncoder(dpi=72)
+        backgrounds = []
+        for i in range(3):
+            encoder(self.plot[i], self.plot)
+            backgrounds.append(encoder._background)
+        self.assertTrue(backgrounds[0] is backgrounds[1] is backgrounds[2])
+
+    def test_delta_background_rendered_without_plot(self):
+        encoder = DeltaEncoder(dpi=72)
+        encoder(self.plot[0])
+        background = encoder._background
+        encoder(self.plot[1])
+        self.assertFalse(encoder._background is background)
+
+    def test_delta_image_tile(self):
+        encoder = DeltaEncoder(dpi=72)
+        tile = encoder(self.plot[2])['artists']['0-image-0']
+        png = pyplot.imread(BytesIO(base64.b64decode(tile['png'])))
+        full = self.render(self.plot[2])
+        h, w = png.shape[:2]
+        self.assertEqual(full[tile['y']:tile['y']+h, tile['x']:tile['x']+w], png)
+
+    def test_delta_widget(self):
+        html = ScrubberWidget(self.plot, frame_encoding='delta')()
+        self.assertTrue('DeltaFrames' in html)
+
+    def test_delta_lazy_raises(self):
+        widget = SelectionWidget(self.plot, frame_encoding='delta', lazy=True)
+        self.assertRaises(ValueError, widget.get_frames, "test")
+
+
+
 if __name__ == "__main__":
     import sys
     import nose